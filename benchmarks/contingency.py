@@ -0,0 +1,80 @@
+# Contingency benchmark
+# Cost of removing, editing and restoring elements of a table holding tombstones
+#
+# Run from the repository root with: python -m benchmarks.contingency [rows]
+
+import sys
+import time
+
+import numpy as np
+
+from networks.ElementTable import ElementTable
+
+
+# number of remove, edit and restore steps timed at each tombstone count
+STEPS = 2000
+
+
+def build(rows: int):
+    """
+    Build a table of lines that is never compacted, so tombstones accumulate.
+
+    :param rows: The number of lines.
+    :type rows: int
+    :return: The table.
+    :rtype: ElementTable
+    """
+    table = ElementTable(capacity=rows)
+    table.COMPACTION_THRESHOLD = float("inf")
+    table.extend({"id": np.arange(1, rows + 1), "in_service": np.ones(rows, dtype=bool),
+                  "max_loading_percent": np.full(rows, 100.0)})
+    return table
+
+
+def step_time(table, ids):
+    """
+    Time contingency steps: remove a line, edit another by row and by id, look up a
+    row and restore the removed line.
+
+    :param table: The table of lines.
+    :type table: ElementTable
+    :param ids: The ids of the lines removed, one per step, each above 1.
+    :type ids: list
+    :return: The microseconds per step.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for id in ids:
+        record = table.remove(id)
+        table.set_value(len(table) // 2, "max_loading_percent", 90.0)
+        table.set_field(id - 1, "in_service", False)
+        table.row_of(id - 1)
+        table.append(record)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def main(rows: int = 1000000):
+    """
+    Print the time of a contingency step as tombstones accumulate in a table.
+
+    Each restored line is appended again and its old slot stays a tombstone, so
+    every step adds one tombstone; the time per step should not grow with them.
+    With 1000000 lines a step took about 3000 us once tombstones existed when every
+    edit dropped the row mapping and the next row lookup rescanned the alive mask,
+    and takes about 25 us with the incremental row index, after a first build of
+    the index in the first batch of steps.
+
+    :param rows: The number of lines in the table, defaults to 1000000
+    :type rows: int, optional
+    """
+    table = build(rows)
+    rng = np.random.default_rng(0)
+    print(f"{'tombstones':>12}{'us/step':>10}")
+    for _ in range(5):
+        tombstones = table._dead
+        ids = rng.choice(np.arange(2, rows + 1), STEPS, replace=False).tolist()
+        print(f"{tombstones:>12}{step_time(table, ids):>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
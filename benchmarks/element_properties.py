@@ -0,0 +1,58 @@
+# Element property benchmark
+# Time of get_property and set_property for the first and last field of each element class
+#
+# Run from the repository root with: python -m benchmarks.element_properties [count]
+
+import sys
+import timeit
+
+from benchmarks.element_classes import ARGUMENTS
+
+
+REPEAT = 5
+
+
+def measure(cls, count: int):
+    """
+    Measure the time of property access on an instance of an element class.
+
+    :param cls: The element class.
+    :type cls: type
+    :param count: The number of calls to time.
+    :type count: int
+    :return: The nanoseconds per call of get_property and set_property on the
+        first and last field of the class, and of get_properties on every field.
+    :rtype: dict
+    """
+    element = cls(*ARGUMENTS[cls])
+    fields = [field for field in element.to_dict() if field != "id"]
+    first, last = fields[0], fields[-1]
+    value = element.get_property(last)
+    every = element.to_dict()
+    calls = {
+        "get first": lambda: element.get_property(first),
+        "get last": lambda: element.get_property(last),
+        "set last": lambda: element.set_property(last, value),
+    }
+    if hasattr(element, "get_properties"):
+        calls["get all"] = lambda: element.get_properties(every)
+    # the fastest of several runs is the least disturbed by other processes
+    return {name: min(timeit.repeat(call, number=count, repeat=REPEAT)) / count * 1e9 for name, call in calls.items()}
+
+
+def main(count: int = 200000):
+    """
+    Print the property access times of every element class.
+
+    :param count: The number of calls to time per measurement, defaults to 200000
+    :type count: int, optional
+    """
+    columns = ("get first", "get last", "set last", "get all")
+    print(f"{'class (ns/call)':<25}" + "".join(f"{column:>11}" for column in columns))
+    for cls in ARGUMENTS:
+        timings = measure(cls, count)
+        print(f"{cls.__name__:<25}" + "".join(f"{timings[column]:>11.0f}" if column in timings else f"{'-':>11}" for column in columns))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
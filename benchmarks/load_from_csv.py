@@ -0,0 +1,95 @@
+# CSV loading benchmark
+# Time of Network.load_from_csv against adding the rows of the CSV files one by one
+#
+# Run from the repository root with: python -m benchmarks.load_from_csv [num_buses] [sample]
+
+import inspect
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from networks.network import Network, ELEMENT_CLASSES
+from networks.NetworkGenerator import NetworkGenerator
+
+
+# number of files read at the same time by the threaded load
+THREADS = 4
+
+# number of rows read at a time by the streamed load
+CHUNKSIZE = 50000
+
+
+def load_row_by_row(directory: str, sample: int):
+    """
+    Load the first rows of every CSV file by building one element object per row,
+    as load_from_csv did before loading whole columns.
+
+    :param directory: The directory holding the CSV files.
+    :type directory: str
+    :param sample: The number of rows to load from each file.
+    :type sample: int
+    :return: The number of rows loaded.
+    :rtype: int
+    """
+    network = Network()
+    rows = 0
+    for element_type, element_class in ELEMENT_CLASSES.items():
+        fields = list(inspect.signature(element_class.__init__).parameters)[1:]
+        try:
+            df = pd.read_csv(os.path.join(directory, f"{element_type}.csv"), nrows=sample)
+        except pd.errors.EmptyDataError:
+            continue
+        add = getattr(network, f"add_{element_type}")
+        for _, row in df.iterrows():
+            add(element_class(*(row[field] for field in fields)))
+        rows += len(df)
+    return rows
+
+
+def main(num_buses: int = 400000, sample: int = 5000):
+    """
+    Print the time to load a generated network from CSV files column by column,
+    with one and with several threads and in chunks, and the time extrapolated
+    from loading a sample of the rows one by one.
+
+    :param num_buses: The number of buses of the generated network, which has about
+        as many lines, defaults to 400000
+    :type num_buses: int, optional
+    :param sample: The number of rows per file loaded one by one, defaults to 5000
+    :type sample: int, optional
+    """
+    network = NetworkGenerator(num_buses, seed=0).generate()
+    total = sum(len(table) for table in network.net.values())
+    with tempfile.TemporaryDirectory() as directory:
+        network.save_to_csv(directory)
+
+        start = time.perf_counter()
+        loaded = Network()
+        loaded.load_from_csv(directory)
+        columns = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Network().load_from_csv(directory, max_workers=THREADS)
+        threads = time.perf_counter() - start
+
+        start = time.perf_counter()
+        Network().load_from_csv(directory, chunksize=CHUNKSIZE)
+        chunks = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = load_row_by_row(directory, sample)
+        row_by_row = (time.perf_counter() - start) / rows * total
+
+    print(f"{total} elements, {len(network.net['line'])} lines")
+    print(f"{'column by column':<28}{columns:>10.2f} s")
+    print(f"{f'column by column, {THREADS} threads':<28}{threads:>10.2f} s")
+    print(f"{f'chunks of {CHUNKSIZE} rows':<28}{chunks:>10.2f} s")
+    print(f"{'row by row (extrapolated)':<28}{row_by_row:>10.2f} s")
+    print(f"{'speedup':<28}{row_by_row / columns:>10.0f} x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
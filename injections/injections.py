@@ -1,9 +1,11 @@
 """A module to model injections in power systems.
 """
 
+import hashlib
 import pathlib
 import os
 from abc import ABC, abstractmethod  # import abstract base class
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 
@@ -81,6 +83,34 @@ class Injections(_DataLoaderFactory):
             "generator": generator_df
         }
 
+    def fingerprints(self):
+        """Returns a content hash of the load and of the generator injections
+
+        Each hash is combined from the hashes kept by the injections themselves, so
+        only the injections changed since they were last hashed are rehashed.
+
+        :return: The hash of the "load" and of the "generator" injections, as 32 hexadecimal digits
+        :rtype: dict
+        """
+        fingerprints = {}
+        for injection_type, injections in self.injections.items():
+            digest = hashlib.blake2b(digest_size=16)
+            for injection in injections or []:
+                digest.update(injection.fingerprint().encode())
+            fingerprints[injection_type] = digest.hexdigest()
+        return fingerprints
+
+    def fingerprint(self):
+        """Returns a content hash of all the injections, stable across processes
+
+        :return: The hash as 32 hexadecimal digits
+        :rtype: string
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for injection_type, fingerprint in sorted(self.fingerprints().items()):
+            digest.update(f"{injection_type}={fingerprint};".encode())
+        return digest.hexdigest()
+
 
 # To-do: discuss whether this is necessary or if just the dataframe is enough
 @dataclass  # one way to generate a method to test the equality of object values
@@ -91,17 +121,50 @@ class Injection:
     def __init__(self, location, times, magnitudes):
         """Creates an injection object
 
+        The times and magnitudes are stored as read-only NumPy arrays, viewing the
+        memory of arrays passed in, and the getters return copies as lists, so they
+        can only be changed by assigning new values, which keeps the cached
+        fingerprint up to date.
+
         :param location: Location of the injection
         :type location: int
         :param times: List of times for the injection
-        :type times: list
+        :type times: list or numpy.ndarray
         :param magnitudes: List of magnitudes for the injection
-        :type magnitudes: list
+        :type magnitudes: list or numpy.ndarray
         """
         self.location = location
         self.times = times
         self.magnitudes = magnitudes
 
+    def __setattr__(self, name, value):
+        # assigning new data drops the cached hash
+        if name in ("location", "times", "magnitudes"):
+            object.__setattr__(self, "_fingerprint", None)
+        if name in ("times", "magnitudes"):
+            value = np.asarray(value).view()
+            value.flags.writeable = False
+        object.__setattr__(self, name, value)
+
+    def fingerprint(self):
+        """Returns a content hash of the injection, stable across processes
+
+        The hash is kept until the location, times or magnitudes are assigned again.
+
+        :return: The hash as 32 hexadecimal digits
+        :rtype: string
+        """
+        if self._fingerprint is None:
+            # adding 0.0 turns -0.0 into 0.0
+            times = np.asarray(self.times, dtype=np.float64) + 0.0
+            magnitudes = np.asarray(self.magnitudes, dtype=np.float64) + 0.0
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{self.location};{len(times)};{len(magnitudes)};".encode())
+            digest.update(times.tobytes())
+            digest.update(magnitudes.tobytes())
+            object.__setattr__(self, "_fingerprint", digest.hexdigest())
+        return self._fingerprint
+
     def get_location(self):
         """Returns the location of the injection
 
@@ -116,7 +179,7 @@ class Injection:
         :return: Times
         :rtype: list
         """
-        return self.times
+        return self.times.tolist()
 
     def get_magnitudes(self):
         """Returns the magnitudes of the injection
@@ -124,7 +187,7 @@ class Injection:
         :return: Magnitudes
         :rtype: list
         """
-        return self.magnitudes
+        return self.magnitudes.tolist()
 
 
 @ dataclass
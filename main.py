@@ -34,19 +34,19 @@ def main():
     test_network1.add_bus(bus1)
     test_network1.add_bus(bus2)
 
-    line1 = network.Line("Line1", 0, 1, 10.0, 80.0, 0.1, 0.2,
+    line1 = network.Line("Line1", bus1.get_id(), bus2.get_id(), 10.0, 80.0, 0.1, 0.2,
                          100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3,"ol")
     test_network1.add_line(line1)
 
-    load1 = network.Load("Load1", 0, 50.0, 30.0, 0.4, 50.0,
+    load1 = network.Load("Load1", bus1.get_id(), 50.0, 30.0, 0.4, 50.0,
                          0.0, 0.0, True, 55.0, 45.0, 35.0, 25.0)
     test_network1.add_load(load1)
 
-    transformer1 = network.Transformer("Transformer1", 0, 1, 110.0, 20.0,
+    transformer1 = network.Transformer("Transformer1", bus1.get_id(), bus2.get_id(), 110.0, 20.0,
                                        1000.0, 6.0, 0.5, 1.0, 2.0, -2, 0, 2, 1.25, 0.01, 0.02, 0.01)
     test_network1.add_transformer(transformer1)
 
-    generator1 = network.Generator("Gen1", 0, 60.0, 20.0, 0.4,
+    generator1 = network.Generator("Gen1", bus1.get_id(), 60.0, 20.0, 0.4,
                                    60.0, 1.0, True, 65.0, 55.0, 25.0, 15.0, 3, 0.02)
     test_network1.add_generator(generator1)
 
@@ -1,9 +1,60 @@
+import threading
+from operator import attrgetter
 from abc import ABC, abstractmethod
 
+# guards the per-class id counters when elements are created from several threads
+_id_lock = threading.Lock()
+
+def _slot(cls, field: str):
+    """
+    Find the slot storing a field of an element class.
+
+    :param cls: The element class.
+    :type cls: type
+    :param field: The name of the field.
+    :type field: str
+    :return: The slot descriptor of the first class in the method resolution order that declares it.
+    :rtype: member_descriptor
+    """
+    for klass in cls.__mro__:
+        slot = klass.__dict__.get(f"_{klass.__name__.lstrip('_')}__{field}")
+        if slot is not None:
+            return slot
+    raise AttributeError(f"{cls.__name__} declares no slot for the field {field}")
+
+
 class Element(ABC):
     """
     An abstract base class representing an element in a network.
+
+    Each element class numbers its instances with its own ``_next_id`` counter.
+    A :class:`networks.network.Network` replaces that id with one from its own
+    allocator when the element is added to it.
+
+    Each subclass lists its fields, other than name and id, in ``_fields`` and
+    stores them in the private slots ``__<field>``. The field table built from this
+    list maps every property name to its attribute, so :meth:`get_property` and
+    :meth:`set_property` cost a single dictionary lookup whatever the field, and
+    ``_field_values`` reads all fields, in the order of ``_field_names``, in one call.
     """
+    _next_id = 1
+    _fields = ()
+    __slots__ = ("__name", "__id")
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Build the field table of an element class from its ``_fields``. The slot of
+        each field is looked up along the method resolution order, so subclasses of
+        an element class can reuse or extend the fields of their base.
+        """
+        super().__init_subclass__(**kwargs)
+        slots = {"name": Element._Element__name, "id": Element._Element__id}
+        slots.update((field, _slot(cls, field)) for field in cls._fields)
+        cls._getters = {field: attrgetter(slot.__name__) for field, slot in slots.items()}
+        cls._field_names = tuple(slots)
+        cls._field_values = attrgetter(*(slot.__name__ for slot in slots.values()))
+        cls._setters = {field: slot.__set__ for field, slot in slots.items() if field != "id"}
+
     def __init__(self, name: str):
         """
         Initializes an Element object.
@@ -12,6 +63,27 @@ class Element(ABC):
         :type name: str
         """
         self.__name = name
+        with _id_lock:
+            self.__id = type(self)._next_id
+            type(self)._next_id += 1
+
+    def get_id(self):
+        """
+        Get the id of the element.
+
+        :return: The id of the element.
+        :rtype: int
+        """
+        return self.__id
+
+    def _set_id(self, id: int):
+        """
+        Set the id of the element, used by a network when the element is added to it.
+
+        :param id: The new id of the element.
+        :type id: int
+        """
+        self.__id = id
 
     def get_name(self):
         """
@@ -32,27 +104,66 @@ class Element(ABC):
         self.__name = n
         return
     
-    @abstractmethod
-    def get_property(self):
+    def get_property(self, var: str):
         """
-        Abstract method to get a property of the element.
+        Get a property of the element.
 
-        This method must be implemented by subclasses.
+        :param var: The name of the property to retrieve.
+        :type var: str
+        :return: The value of the requested property, or a message if the element
+            has no such property.
+        :rtype: str or int or float or bool
+        """
+        getter = self._getters.get(var)
+        if getter is None:
+            return "Not a valid variable for this element"
+        return getter(self)
 
-        :raises NotImplementedError: If not implemented by subclass.
+    def set_property(self, var: str, new):
         """
-        pass
+        Set a property of the element. The id can not be set.
 
-    @abstractmethod
-    def set_property(self):
+        :param var: The name of the property to set.
+        :type var: str
+        :param new: The new value for the property.
+        :type new: str or int or float or bool
+        :return: A message if the element has no such property, otherwise None.
+        :rtype: str
         """
-        Abstract method to set a property of the element.
+        setter = self._setters.get(var)
+        if setter is None:
+            return "Not a valid variable for this element"
+        setter(self, new)
 
-        This method must be implemented by subclasses.
+    def get_properties(self, vars):
+        """
+        Get several properties of the element at once.
 
-        :raises NotImplementedError: If not implemented by subclass.
+        :param vars: The names of the properties to retrieve.
+        :type vars: iterable
+        :return: The value of each requested property, or a message for the names
+            the element has no property for.
+        :rtype: dict
+        """
+        getters = self._getters
+        return {var: getters[var](self) if var in getters else "Not a valid variable for this element" for var in vars}
+
+    def set_properties(self, values: dict):
+        """
+        Set several properties of the element at once. Either every property is
+        set or, if any name is not a settable property, none is.
+
+        :param values: The new value of each property to set.
+        :type values: dict
+        :return: A message naming the invalid properties, otherwise None.
+        :rtype: str
         """
-        pass
+        setters = self._setters
+        invalid = [var for var in values if var not in setters]
+        if invalid:
+            return f"Not a valid variable for this element: {', '.join(map(str, invalid))}"
+        for var, new in values.items():
+            setters[var](self, new)
 
     @abstractmethod
     def to_dict(self):
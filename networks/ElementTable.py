@@ -0,0 +1,1152 @@
+# ElementTable Class
+# Columnar storage for network elements
+
+import copy
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+from networks.NetworkEvent import ADDED, REMOVED, CHANGED
+
+
+def _infer_dtype(value):
+    """
+    Infer the NumPy dtype used to store a single field value.
+
+    :param value: The value to be stored.
+    :type value: any
+    :return: bool, int64, float64 or object dtype.
+    :rtype: numpy.dtype
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(bool)
+    if isinstance(value, (int, np.integer)):
+        return np.dtype(np.int64)
+    if isinstance(value, (float, np.floating)):
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _array_dtype(values):
+    """
+    Find the storage dtype for a whole array of field values.
+
+    :param values: The values to be stored.
+    :type values: numpy.ndarray
+    :return: bool, int64, float64 or object dtype.
+    :rtype: numpy.dtype
+    """
+    if values.dtype.kind == "b":
+        return np.dtype(bool)
+    if values.dtype.kind in "iu":
+        return np.dtype(np.int64)
+    if values.dtype.kind == "f":
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+def _promote(current, required):
+    """
+    Find a dtype able to hold values of both the current and the required dtype.
+
+    Integers and floats are promoted to float, any other mix falls back to object,
+    which follows the way pandas infers a column from a list of dictionaries.
+
+    :param current: The dtype of the existing column.
+    :type current: numpy.dtype
+    :param required: The dtype of the value being stored.
+    :type required: numpy.dtype
+    :return: The dtype the column should have.
+    :rtype: numpy.dtype
+    """
+    if current == required:
+        return current
+    numeric = {np.dtype(np.int64), np.dtype(np.float64)}
+    if current in numeric and required in numeric:
+        return np.dtype(np.float64)
+    return np.dtype(object)
+
+
+# largest share of distinct values for a string column to be stored as categorical in compact DataFrames
+CATEGORY_RATIO = 0.5
+
+
+def _downcast(values):
+    """
+    Convert a column to the smallest dtype holding its values.
+
+    Strings become categorical when at most ``CATEGORY_RATIO`` of them are
+    distinct, since categories of mostly unique strings take more memory than
+    the strings. Floats become float32 when every value converts back to
+    exactly the same float64, and integers take the smallest signed integer
+    dtype holding their range. Any other column is returned unchanged.
+
+    :param values: The values of the column.
+    :type values: numpy.ndarray
+    :return: The converted values.
+    :rtype: numpy.ndarray or pandas.Categorical
+    """
+    if values.dtype == object:
+        if pd.api.types.infer_dtype(values, skipna=True) != "string":
+            return values
+        codes, uniques = pd.factorize(values)
+        if len(uniques) > CATEGORY_RATIO * len(values):
+            return values
+        return pd.Categorical.from_codes(codes, categories=uniques)
+    if values.dtype == np.float64:
+        with np.errstate(over="ignore", invalid="ignore"):
+            narrow = values.astype(np.float32)
+        if np.array_equal(narrow.astype(np.float64), values, equal_nan=True):
+            return narrow
+        return values
+    if values.dtype == np.int64 and len(values):
+        low, high = values.min(), values.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+                return values.astype(dtype)
+    return values
+
+
+def _mix(values):
+    """
+    Scramble 64-bit hashes so that sums of them do not cancel out (splitmix64 finalizer).
+
+    :param values: The hashes to scramble.
+    :type values: numpy.ndarray
+    :return: The scrambled hashes.
+    :rtype: numpy.ndarray
+    """
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _hash_values(values):
+    """
+    Hash field values independently of the dtype of the column holding them.
+
+    Booleans, integers and floats are hashed by their float value, so a column
+    promoted from int to float keeps its hashes, and every NaN hashes alike.
+
+    :param values: The values to hash.
+    :type values: numpy.ndarray
+    :return: A 64-bit hash per value, stable across processes and platforms.
+    :rtype: numpy.ndarray
+    """
+    if values.dtype != object:
+        # adding 0.0 turns -0.0 into 0.0
+        values = values.astype(np.float64) + 0.0
+    return pd.util.hash_array(values)
+
+
+class _RankIndex:
+    """
+    Counts of the live slots of a table kept in a Fenwick tree.
+
+    Finding the row of a slot or the slot of a row, and marking a slot as live
+    or tombstoned, each take logarithmic time, so tables with tombstones
+    convert between rows and slots without rescanning the alive mask.
+
+    :param alive: The alive mask of the occupied slots.
+    :type alive: numpy.ndarray
+    :param capacity: The number of slots covered, at least the length of ``alive``.
+    :type capacity: int
+    """
+
+    def __init__(self, alive, capacity: int):
+        """
+        Builds the tree from an alive mask in linear time.
+
+        :param alive: The alive mask of the occupied slots.
+        :type alive: numpy.ndarray
+        :param capacity: The number of slots covered, at least the length of ``alive``.
+        :type capacity: int
+        """
+        prefix = np.zeros(capacity + 1, dtype=np.int64)
+        np.cumsum(alive, out=prefix[1:len(alive) + 1])
+        prefix[len(alive) + 1:] = prefix[len(alive)]
+        nodes = np.arange(1, capacity + 1)
+        # node i holds the count of the slots (i - lowbit(i), i]
+        self._tree = [0] + (prefix[nodes] - prefix[nodes - (nodes & -nodes)]).tolist()
+        self._top = 1 << (capacity.bit_length() - 1)
+
+    @property
+    def capacity(self):
+        """
+        Get the number of slots covered by the index.
+
+        :return: The number of slots.
+        :rtype: int
+        """
+        return len(self._tree) - 1
+
+    def copy(self):
+        """
+        Create an independent copy of the index.
+
+        :return: The copy.
+        :rtype: _RankIndex
+        """
+        copied = copy.copy(self)
+        copied._tree = list(self._tree)
+        return copied
+
+    def add(self, slot: int, delta: int):
+        """
+        Mark a slot as live (delta 1) or as tombstoned (delta -1).
+
+        :param slot: The slot in the column buffers.
+        :type slot: int
+        :param delta: The change of the count of the slot.
+        :type delta: int
+        """
+        tree = self._tree
+        node = slot + 1
+        while node < len(tree):
+            tree[node] += delta
+            node += node & -node
+
+    def rank(self, slot: int):
+        """
+        Count the live slots before a slot, which is the row of the slot if it is live.
+
+        :param slot: The slot in the column buffers.
+        :type slot: int
+        :return: The number of live slots before it.
+        :rtype: int
+        """
+        tree = self._tree
+        count = 0
+        while slot > 0:
+            count += tree[slot]
+            slot -= slot & -slot
+        return count
+
+    def select(self, row: int):
+        """
+        Find the slot of a row.
+
+        :param row: The row, smaller than the number of live slots.
+        :type row: int
+        :return: The slot of the live element at that row.
+        :rtype: int
+        """
+        tree = self._tree
+        slot, remaining, step = 0, row + 1, self._top
+        while step:
+            node = slot + step
+            if node < len(tree) and tree[node] < remaining:
+                slot = node
+                remaining -= tree[node]
+            step >>= 1
+        return slot
+
+
+class ElementTable(Sequence):
+    """
+    Columnar (struct-of-arrays) storage for one type of network element.
+
+    Every field is held in its own typed NumPy array which grows geometrically as
+    elements are appended. Elements are appended and read back as dictionaries, so
+    the table can be used anywhere a list of element dictionaries was used before,
+    while whole columns can be read at once with :meth:`column`. A hash index from
+    element id to row is kept up to date on every append; the index from name to
+    row is built on the first lookup by name after a bulk append or compaction.
+
+    Removed elements are only marked as tombstones, which hides them from iteration,
+    columns and DataFrames in constant time. The buffers are compacted once the share
+    of tombstones exceeds ``COMPACTION_THRESHOLD``. Rows are always counted over the
+    elements currently in the table, so compaction does not change them, and are
+    converted to buffer slots through an index updated in logarithmic time when an
+    element is appended or removed.
+
+    Tables can be forked cheaply: a fork shares the buffers and indexes of its parent
+    until either of them is modified, at which point the modified table makes its
+    own private copy (copy-on-write).
+
+    A hash of every element is kept once :meth:`fingerprint` has been called, and
+    only the elements appended or modified since the previous call are rehashed.
+
+    A listener set with :meth:`set_listener` is called after every change to the
+    elements, which lets a network notify its subscribers.
+
+    :param capacity: The number of rows to allocate up front, defaults to 16
+    :type capacity: int, optional
+    """
+
+    _MISSING = np.nan
+
+    #: share of tombstoned slots above which the buffers are compacted
+    COMPACTION_THRESHOLD = 0.25
+
+    def __init__(self, capacity: int = 16):
+        """
+        Initializes an empty ElementTable.
+
+        :param capacity: The number of rows to allocate up front, defaults to 16
+        :type capacity: int, optional
+        """
+        self._capacity = max(int(capacity), 1)
+        self._size = 0
+        self._dead = 0
+        self._alive = np.ones(self._capacity, dtype=bool)
+        self._columns = {}
+        self._id_index = {}
+        self._name_index = {}
+        self._max_id = None
+        self._version = 0
+        self._layout = 0
+        self._live = None
+        self._ranks = None
+        self._sorted_ids = None
+        self._frame = None
+        self._compact_frame = None
+        self._owned = True
+        self._hashes = None
+        self._hash_layout = None
+        self._dirty = set()
+        self._fingerprint = None
+        self._listener = None
+
+    def __len__(self):
+        return self._size - self._dead
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ElementTable index out of range")
+        return self._record(self._physical(index))
+
+    def __iter__(self):
+        fields = list(self._columns)
+        values = [self._data(field).tolist() for field in fields]
+        for row in zip(*values):
+            yield dict(zip(fields, row))
+
+    def __eq__(self, other):
+        if isinstance(other, (ElementTable, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ElementTable(rows={len(self)}, fields={list(self._columns)})"
+
+    @property
+    def fields(self):
+        """
+        Get the names of the fields stored in the table.
+
+        :return: The field names in insertion order.
+        :rtype: tuple
+        """
+        return tuple(self._columns)
+
+    @property
+    def version(self):
+        """
+        Get the modification counter of the table.
+
+        The counter changes every time the table is modified, so consumers can
+        cache results derived from the table and rebuild them only when it changes.
+
+        :return: The current version of the table.
+        :rtype: int
+        """
+        return self._version
+
+    @property
+    def max_id(self):
+        """
+        Get the highest id ever stored in the table.
+
+        :return: The highest id, None if no element with an id was stored.
+        :rtype: int
+        """
+        return self._max_id
+
+    @property
+    def nbytes(self):
+        """
+        Get the number of bytes used by the occupied part of the column buffers.
+
+        :return: Bytes used by the column data, not counting referenced Python objects.
+        :rtype: int
+        """
+        return sum(column[:self._size].nbytes for column in self._columns.values())
+
+    def column(self, field: str):
+        """
+        Get a read-only array of a whole column.
+
+        :param field: The name of the field.
+        :type field: str
+        :return: The values of every element in the table, a view when the table
+            holds no tombstones.
+        :rtype: numpy.ndarray
+        :raises KeyError: If the field is not stored in the table.
+        """
+        values = self._data(field)
+        values.flags.writeable = False
+        return values
+
+    def fork(self):
+        """
+        Create a copy-on-write copy of the table.
+
+        The copy shares every buffer and index with this table, so forking costs
+        the same regardless of the number of elements. Whichever table is modified
+        first copies the shared storage before writing to it.
+
+        :return: A table holding the same elements.
+        :rtype: ElementTable
+        """
+        forked = copy.copy(self)
+        forked._listener = None
+        self._owned = False
+        forked._owned = False
+        return forked
+
+    def set_listener(self, listener):
+        """
+        Set the function called after every change to the elements of the table.
+
+        The listener is called with the kind of change ("added", "removed" or
+        "changed"), an array of the ids of the elements concerned and the changed
+        field, None for added and removed elements. Forks of the table start without
+        a listener.
+
+        :param listener: The function to call, None to stop notifying changes.
+        :type listener: callable
+        """
+        self._listener = listener
+
+    @property
+    def shared(self):
+        """
+        Check whether the table may still share its storage with a fork.
+
+        :return: True until the table has made a private copy of its storage.
+        :rtype: bool
+        """
+        return not self._owned
+
+    def fingerprint(self):
+        """
+        Get a hash of the content of the table.
+
+        The hash depends on the field values of every element but not on the order
+        of the elements, and is the same in every process and on every platform, so
+        it can key caches of results computed from the table. Numbers are hashed by
+        value regardless of the dtype of their column.
+
+        The hash of each element is kept and only the elements appended or modified
+        since the previous call are rehashed, so after changing one element the
+        fingerprint costs one element hash and a sum over the table.
+
+        :return: The hash as 16 hexadecimal digits.
+        :rtype: str
+        """
+        if self._fingerprint is None or self._fingerprint[0] != self._version:
+            self._rehash()
+            total = self._hashes[self._alive[:self._size]].sum(dtype=np.uint64)
+            self._fingerprint = (self._version, f"{int(total):016x}")
+        return self._fingerprint[1]
+
+    def get(self, id):
+        """
+        Get the element with the given id.
+
+        :param id: The id of the element.
+        :type id: int
+        :return: The element as a dictionary.
+        :rtype: dict
+        :raises KeyError: If no element with this id is stored in the table.
+        """
+        return self._record(self._id_index[id])
+
+    def row_of(self, id):
+        """
+        Get the row holding the element with the given id.
+
+        :param id: The id of the element.
+        :type id: int
+        :return: The row of the element.
+        :rtype: int
+        :raises KeyError: If no element with this id is stored in the table.
+        """
+        return self._logical(self._id_index[id])
+
+    def rows_of(self, ids):
+        """
+        Get the rows holding the elements with the given ids, as a vectorized lookup.
+
+        :param ids: The ids of the elements.
+        :type ids: array_like
+        :return: The row of each element, -1 where no element has the id.
+        :rtype: numpy.ndarray
+        """
+        ids = np.asarray(ids)
+        if len(self) == 0 or "id" not in self._columns:
+            return np.full(ids.shape, -1, dtype=np.int64)
+
+        if self._sorted_ids is None or self._sorted_ids[0] != self._version:
+            order = np.argsort(self.column("id"), kind="stable")
+            self._sorted_ids = (self._version, order, self.column("id")[order])
+        _, order, sorted_ids = self._sorted_ids
+
+        positions = np.clip(np.searchsorted(sorted_ids, ids), 0, len(sorted_ids) - 1)
+        return np.where(sorted_ids[positions] == ids, order[positions], -1)
+
+    def rows_named(self, name: str):
+        """
+        Get the rows holding the elements with the given name.
+
+        :param name: The name of the elements.
+        :type name: str
+        :return: The rows of the matching elements, in insertion order.
+        :rtype: list
+        """
+        return [self._logical(row) for row in self._names().get(name, ())]
+
+    def append(self, record: dict):
+        """
+        Append one element to the table.
+
+        Fields not seen before are added as new columns, and columns are promoted
+        to a wider dtype when a value does not fit the current one.
+
+        :param record: The element as a dictionary, usually produced by ``to_dict``.
+        :type record: dict
+        :raises ValueError: If an element with the same id is already stored.
+        """
+        self.append_values(tuple(record), tuple(record.values()))
+
+    def append_values(self, fields: tuple, values: tuple):
+        """
+        Append one element given as its field names and values, without building a dictionary.
+
+        :param fields: The names of the fields of the element.
+        :type fields: tuple
+        :param values: The value of each field, in the same order.
+        :type values: tuple
+        :raises ValueError: If an element with the same id is already stored.
+        """
+        id = values[fields.index("id")] if "id" in fields else None
+        if id is not None and id in self._id_index:
+            raise ValueError(f"An element with id {id} is already in the table")
+
+        self._own()
+        if self._size == self._capacity:
+            self._reserve(self._size + 1)
+
+        for field, value in zip(fields, values):
+            if field not in self._columns:
+                self._add_column(field, value)
+
+        row = self._size
+        for field, value in zip(fields, values):
+            self._store(field, row, value)
+        if len(fields) < len(self._columns):
+            for field in self._columns.keys() - set(fields):
+                self._store(field, row, self._MISSING)
+        self._alive[row] = True
+        self._size += 1
+        if self._ranks is not None:
+            if row < self._ranks.capacity:
+                self._ranks.add(row, 1)
+            else:
+                # the buffers grew, the index is rebuilt at their new capacity when needed
+                self._ranks = None
+        self._index_row(row, id, values[fields.index("name")] if "name" in fields else None)
+        self._version += 1
+        self._layout += 1
+        self._notify(ADDED, [id] if id is not None else [])
+
+    def extend(self, columns: dict):
+        """
+        Append many elements at once from whole columns.
+
+        :param columns: A dictionary mapping each field name to an array of values,
+            all arrays having the same length.
+        :type columns: dict
+        :raises ValueError: If the arrays differ in length or an id is already used.
+        """
+        columns = {field: np.asarray(values) for field, values in columns.items()}
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        count = lengths.pop() if lengths else 0
+        if count == 0:
+            return
+
+        ids = columns["id"].tolist() if "id" in columns else None
+        if ids is not None and (len(set(ids)) != count or not self._id_index.keys().isdisjoint(ids)):
+            raise ValueError("The new elements have duplicate ids or ids already in the table")
+
+        self._own()
+        self._reserve(self._size + count)
+        for field, values in columns.items():
+            if field not in self._columns:
+                self._add_column(field, values[0])
+
+        start, stop = self._size, self._size + count
+        for field, column in self._columns.items():
+            values = columns.get(field)
+            if values is None:
+                values = np.full(count, self._MISSING)
+            dtype = _promote(column.dtype, _array_dtype(values))
+            if dtype != column.dtype:
+                column = column.astype(dtype)
+                self._columns[field] = column
+            column[start:stop] = values
+        self._alive[start:stop] = True
+        self._size = stop
+        self._ranks = None
+
+        self._index_ids(start, ids)
+        if "name" in columns:
+            self._name_index = None
+        self._version += 1
+        self._layout += 1
+        self._notify(ADDED, np.array(columns["id"]) if "id" in columns else [])
+
+    @classmethod
+    def from_arrays(cls, columns: dict):
+        """
+        Create a table over existing column arrays without copying them.
+
+        The arrays, such as read-only memory-mapped files, are shared with the
+        table as with a fork: the table only reads them until it is first
+        modified, at which point it copies them into memory (copy-on-write). Only
+        the id index is built up front; the name index is built on first use.
+
+        :param columns: A dictionary mapping each field name to an array of values,
+            all arrays having the same length.
+        :type columns: dict
+        :return: A table holding the elements.
+        :rtype: ElementTable
+        :raises ValueError: If the arrays differ in length or the ids are not unique.
+        """
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        count = lengths.pop() if lengths else 0
+
+        table = cls(capacity=count)
+        if count == 0:
+            columns = {field: np.empty(table._capacity, dtype=values.dtype) for field, values in columns.items()}
+        table._columns = dict(columns)
+        table._size = count
+        table._name_index = None
+        if "id" in columns and count:
+            table._index_ids(0, columns["id"].tolist())
+            if len(table._id_index) != count:
+                raise ValueError("The elements have duplicate ids")
+        table._owned = False
+        return table
+
+    def take(self, rows):
+        """
+        Copy some of the elements into a new table.
+
+        :param rows: The rows of the elements to copy, in the order they are copied.
+        :type rows: array_like
+        :return: A table holding the selected elements and every field of this table.
+        :rtype: ElementTable
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        table = ElementTable(capacity=max(len(rows), 1))
+        table.extend({field: self._data(field)[rows] for field in self._columns})
+        return table
+
+    def set_value(self, row: int, field: str, value):
+        """
+        Overwrite one field of a stored element.
+
+        :param row: The row of the element.
+        :type row: int
+        :param field: The name of the field.
+        :type field: str
+        :param value: The new value.
+        :type value: any
+        :raises IndexError: If the row is not in the table.
+        :raises KeyError: If the field is not stored in the table.
+        :raises ValueError: If the new id is already used by another element.
+        """
+        if not 0 <= row < len(self):
+            raise IndexError("ElementTable index out of range")
+        if field not in self._columns:
+            raise KeyError(field)
+
+        self._own()
+        self._write(self._physical(row), field, value)
+
+    def get_field(self, id, field: str):
+        """
+        Read one field of the element with the given id without building its dictionary.
+
+        :param id: The id of the element.
+        :type id: int
+        :param field: The name of the field.
+        :type field: str
+        :return: The stored value.
+        :rtype: any
+        :raises KeyError: If no element with this id is stored in the table, or the field is not stored.
+        """
+        return self._scalar(self._columns[field], self._id_index[id])
+
+    def set_field(self, id, field: str, value):
+        """
+        Overwrite one field of the element with the given id.
+
+        :param id: The id of the element.
+        :type id: int
+        :param field: The name of the field.
+        :type field: str
+        :param value: The new value.
+        :type value: any
+        :raises KeyError: If no element with this id is stored in the table, or the field is not stored.
+        :raises ValueError: If the new id is already used by another element.
+        """
+        if field not in self._columns:
+            raise KeyError(field)
+        slot = self._id_index[id]
+        self._own()
+        self._write(slot, field, value)
+
+    def remove(self, id):
+        """
+        Remove the element with the given id by marking it as a tombstone.
+
+        The element disappears from the table immediately; its storage is reclaimed
+        when the table is next compacted.
+
+        :param id: The id of the element.
+        :type id: int
+        :return: The removed element as a dictionary, which can be appended again to restore it.
+        :rtype: dict
+        :raises KeyError: If no element with this id is stored in the table.
+        """
+        row = self._id_index[id]
+        self._own()
+        del self._id_index[id]
+        record = self._record(row)
+        if "name" in record and self._name_index is not None:
+            self._unindex_name(row, record["name"])
+        self._alive[row] = False
+        self._dead += 1
+        if self._ranks is not None:
+            self._ranks.add(row, -1)
+        self._version += 1
+        self._layout += 1
+        self._notify(REMOVED, [id])
+
+        if self._dead > self.COMPACTION_THRESHOLD * self._size:
+            self.compact()
+        return record
+
+    def compact(self):
+        """
+        Drop the tombstoned slots from the buffers and rebuild the indexes.
+
+        The rows of the remaining elements are unchanged by compaction.
+        """
+        if self._dead == 0:
+            return
+        live = np.flatnonzero(self._alive[:self._size])
+        count = len(live)
+        if self._hashes is not None:
+            self._rehash()
+            self._hashes = self._hashes[live]
+        self._capacity = max(count, 16)
+        self._columns = {field: self._compacted(column, live) for field, column in self._columns.items()}
+        self._alive = np.ones(self._capacity, dtype=bool)
+        self._size = count
+        self._dead = 0
+        self._live = None
+        self._ranks = None
+        self._layout += 1
+        self._owned = True
+
+        self._id_index = {}
+        if "id" in self._columns:
+            self._id_index = dict(zip(self._columns["id"][:count].tolist(), range(count)))
+        self._name_index = None
+
+    def to_dataframe(self, compact: bool = False):
+        """
+        Convert the table to a pandas DataFrame.
+
+        The DataFrame is cached and returned again until the table is modified, so
+        it is shared between callers and must not be modified in place; use
+        ``copy()`` on the result before changing it.
+
+        In compact mode, repeated strings are stored as categoricals, floats as
+        float32 where every value is exactly representable in float32, and
+        integers such as ids in the smallest integer dtype holding them.
+
+        :param compact: Downcast the columns to save memory, defaults to False
+        :type compact: bool, optional
+        :return: A DataFrame with one column per field and one row per element.
+        :rtype: pandas.DataFrame
+        """
+        if compact:
+            if self._compact_frame is None or self._compact_frame[0] != self._version:
+                frame = pd.DataFrame({field: _downcast(self._data(field)) for field in self._columns}, copy=True)
+                self._compact_frame = (self._version, frame)
+            return self._compact_frame[1]
+        if self._frame is None or self._frame[0] != self._version:
+            frame = pd.DataFrame({field: np.array(self._data(field)) for field in self._columns})
+            self._frame = (self._version, frame)
+        return self._frame[1]
+
+    def _own(self):
+        """
+        Make private copies of the buffers and indexes if they may be shared with a fork.
+        """
+        if self._owned:
+            return
+        self._columns = {field: column.copy() for field, column in self._columns.items()}
+        self._alive = self._alive.copy()
+        self._id_index = dict(self._id_index)
+        if self._name_index is not None:
+            self._name_index = {name: list(rows) for name, rows in self._name_index.items()}
+        if self._hashes is not None:
+            self._hashes = self._hashes.copy()
+        if self._ranks is not None:
+            self._ranks = self._ranks.copy()
+        self._dirty = set(self._dirty)
+        self._owned = True
+
+    def _live_rows(self):
+        """
+        Get the slots of the elements that are not tombstoned.
+
+        The slots are cached until an element is appended or removed; changing
+        field values keeps them.
+
+        :return: The slots in ascending order.
+        :rtype: numpy.ndarray
+        """
+        if self._live is None or self._live[0] != self._layout:
+            self._live = (self._layout, np.flatnonzero(self._alive[:self._size]))
+        return self._live[1]
+
+    def _rank_index(self):
+        """
+        Get the index converting between rows and slots, building it if needed.
+
+        The index is updated in place when single elements are appended or
+        removed, and only rebuilt after bulk appends, buffer growth or compaction.
+
+        :return: The index of the live slots.
+        :rtype: _RankIndex
+        """
+        if self._ranks is None:
+            self._ranks = _RankIndex(self._alive[:self._size], self._capacity)
+        return self._ranks
+
+    def _physical(self, row: int):
+        """
+        Convert a row into the buffer slot holding it.
+
+        :param row: The row of an element.
+        :type row: int
+        :return: The slot of the element in the column buffers.
+        :rtype: int
+        """
+        return row if self._dead == 0 else self._rank_index().select(row)
+
+    def _logical(self, slot: int):
+        """
+        Convert a buffer slot of an element that is not tombstoned into its row.
+
+        :param slot: The slot of the element in the column buffers.
+        :type slot: int
+        :return: The row of the element.
+        :rtype: int
+        """
+        return slot if self._dead == 0 else self._rank_index().rank(slot)
+
+    def _data(self, field: str):
+        """
+        Get the values of a field for the elements that are not tombstoned.
+
+        :param field: The name of the field.
+        :type field: str
+        :return: A view of the buffer when there are no tombstones, a copy otherwise.
+        :rtype: numpy.ndarray
+        """
+        column = self._columns[field][:self._size]
+        return column if self._dead == 0 else column[self._live_rows()]
+
+    def _record(self, slot: int):
+        """
+        Read the element stored in a buffer slot as a dictionary.
+
+        :param slot: The slot of the element in the column buffers.
+        :type slot: int
+        :return: The element as a dictionary.
+        :rtype: dict
+        """
+        return {field: self._scalar(column, slot) for field, column in self._columns.items()}
+
+    def _index_row(self, row: int, id, name):
+        """
+        Add a row to the id and name indexes.
+
+        :param row: The slot of the element in the column buffers.
+        :type row: int
+        :param id: The id of the element, None if the element has no id.
+        :type id: int
+        :param name: The name of the element, None if the element has no name.
+        :type name: str
+        """
+        if id is not None:
+            self._id_index[id] = row
+            if self._max_id is None or id > self._max_id:
+                self._max_id = id
+        if name is not None and self._name_index is not None:
+            self._name_index.setdefault(name, []).append(row)
+
+    def _index_ids(self, start: int, ids):
+        """
+        Add the ids of consecutive new slots to the id index at once.
+
+        :param start: The slot of the first element in the column buffers.
+        :type start: int
+        :param ids: The ids of the elements, None if the elements have no id.
+        :type ids: list
+        """
+        if ids is None:
+            return
+        self._id_index.update(zip(ids, range(start, start + len(ids))))
+        top = max(ids)
+        if self._max_id is None or top > self._max_id:
+            self._max_id = top
+
+    def _names(self):
+        """
+        Get the name index, building it from the name column if it is not up to date.
+
+        The name index is only needed to find elements by name, so bulk appends and
+        compaction drop it instead of updating it and it is rebuilt here on first use.
+
+        :return: The slots of the elements with each name, in ascending order.
+        :rtype: dict
+        """
+        if self._name_index is not None:
+            return self._name_index
+        self._name_index = {}
+        if "name" not in self._columns:
+            return self._name_index
+
+        slots = np.flatnonzero(self._alive[:self._size])
+        codes, uniques = pd.factorize(self._columns["name"][slots])
+        if len(uniques) == len(slots):
+            # the common case of distinct names needs no grouping
+            self._name_index = dict(zip(uniques, ([slot] for slot in slots.tolist())))
+            return self._name_index
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        grouped = slots[order].tolist()
+        for code, name in enumerate(uniques):
+            self._name_index[name] = grouped[bounds[code]:bounds[code + 1]]
+        return self._name_index
+
+    def _unindex_name(self, row: int, name):
+        """
+        Remove a row from the name index.
+
+        :param row: The slot of the element in the column buffers.
+        :type row: int
+        :param name: The name the element is indexed under.
+        :type name: str
+        """
+        rows = self._name_index.get(name)
+        if rows is not None and row in rows:
+            rows.remove(row)
+            if not rows:
+                del self._name_index[name]
+
+    def _compacted(self, column, live):
+        """
+        Copy the live slots of a column into a new buffer.
+
+        :param column: The column buffer.
+        :type column: numpy.ndarray
+        :param live: The slots to keep.
+        :type live: numpy.ndarray
+        :return: A buffer of the current capacity starting with the kept values.
+        :rtype: numpy.ndarray
+        """
+        compacted = np.empty(self._capacity, dtype=column.dtype)
+        compacted[:len(live)] = column[live]
+        return compacted
+
+    def _reserve(self, rows: int):
+        """
+        Grow the column buffers so that they hold at least the given number of rows.
+
+        :param rows: The minimum number of rows required.
+        :type rows: int
+        """
+        if rows <= self._capacity:
+            return
+        capacity = max(rows, self._capacity * 2)
+        for field, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[field] = grown
+        alive = np.ones(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        self._alive = alive
+        self._capacity = capacity
+
+    def _add_column(self, field: str, value):
+        """
+        Add a new column, marking it as missing for the elements already stored.
+
+        :param field: The name of the field.
+        :type field: str
+        :param value: The first value that will be stored in the column.
+        :type value: any
+        """
+        dtype = _infer_dtype(value)
+        column = np.empty(self._capacity, dtype=dtype)
+        if self._size:
+            column = column.astype(_promote(dtype, np.dtype(np.float64)))
+            column[:self._size] = self._MISSING
+        self._columns[field] = column
+
+    def _write(self, slot: int, field: str, value):
+        """
+        Overwrite one field of the element in a buffer slot, keeping the indexes up to date.
+
+        :param slot: The slot of the element in the column buffers.
+        :type slot: int
+        :param field: The name of the field.
+        :type field: str
+        :param value: The new value.
+        :type value: any
+        :raises ValueError: If the new id is already used by another element.
+        """
+        old = self._scalar(self._columns[field], slot)
+        if field == "id" and value != old:
+            if value in self._id_index:
+                raise ValueError(f"An element with id {value} is already in the table")
+            del self._id_index[old]
+            self._id_index[value] = slot
+            if self._max_id is None or value > self._max_id:
+                self._max_id = value
+        elif field == "name" and value != old and self._name_index is not None:
+            self._unindex_name(slot, old)
+            self._name_index.setdefault(value, []).append(slot)
+            self._name_index[value].sort()
+
+        self._store(field, slot, value)
+        if self._hashes is not None:
+            self._dirty.add(slot)
+        self._version += 1
+
+        if field == "id" and value != old:
+            self._notify(REMOVED, [old])
+            self._notify(ADDED, [value])
+        elif self._listener is not None:
+            self._notify(CHANGED, [self._scalar(self._columns["id"], slot)] if "id" in self._columns else [], field)
+
+    def _store(self, field: str, row: int, value):
+        """
+        Store a value, promoting the column dtype first if required.
+
+        :param field: The name of the field.
+        :type field: str
+        :param row: The row to write.
+        :type row: int
+        :param value: The value to store.
+        :type value: any
+        """
+        column = self._columns[field]
+        dtype = _promote(column.dtype, _infer_dtype(value))
+        if dtype != column.dtype:
+            column = column.astype(dtype)
+            self._columns[field] = column
+        column[row] = value
+
+    def _notify(self, kind: str, ids, field: str = None):
+        """
+        Call the listener, if any, about a change to the elements.
+
+        :param kind: "added", "removed" or "changed".
+        :type kind: str
+        :param ids: The ids of the elements concerned.
+        :type ids: array_like
+        :param field: The changed field, defaults to None
+        :type field: str, optional
+        """
+        if self._listener is not None:
+            self._listener(kind, np.asarray(ids, dtype=np.int64 if len(ids) == 0 else None), field)
+
+    def _rehash(self):
+        """
+        Bring the element hashes up to date with the buffers.
+
+        Only the slots appended or written since the previous update are hashed,
+        unless a column was added or changed between numeric and object values,
+        which rehashes every slot.
+        """
+        layout = tuple((field, column.dtype == object) for field, column in self._columns.items())
+        if self._hashes is None or layout != self._hash_layout:
+            self._hashes = self._hash_slots(np.arange(self._size))
+        else:
+            hashed = len(self._hashes)
+            dirty = np.fromiter((slot for slot in self._dirty if slot < hashed), dtype=np.int64)
+            if hashed < self._size:
+                self._hashes = np.concatenate([self._hashes, self._hash_slots(np.arange(hashed, self._size))])
+            elif len(dirty) and not self._owned:
+                self._hashes = self._hashes.copy()
+            if len(dirty):
+                self._hashes[dirty] = self._hash_slots(dirty)
+        self._hash_layout = layout
+        self._dirty = set()
+
+    def _hash_slots(self, slots):
+        """
+        Hash the elements stored in some buffer slots.
+
+        Each field value is hashed together with the field name, so that swapping
+        values between fields changes the hash of the element.
+
+        :param slots: The slots of the elements in the column buffers.
+        :type slots: numpy.ndarray
+        :return: A 64-bit hash per element.
+        :rtype: numpy.ndarray
+        """
+        hashes = np.zeros(len(slots), dtype=np.uint64)
+        for field, column in self._columns.items():
+            key = pd.util.hash_array(np.array([field], dtype=object))[0]
+            hashes += _mix(_hash_values(column[slots]) ^ key)
+        return _mix(hashes)
+
+    @staticmethod
+    def _scalar(column, row: int):
+        """
+        Read a single value from a column as a Python object.
+
+        :param column: The column buffer.
+        :type column: numpy.ndarray
+        :param row: The row to read.
+        :type row: int
+        :return: The stored value.
+        :rtype: any
+        """
+        value = column[row]
+        return value if column.dtype == object else value.item()
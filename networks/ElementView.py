@@ -0,0 +1,186 @@
+# ElementView Class
+# Live view of one element stored in a network
+
+class ElementView:
+    """
+    A live view of one element of a network, read and written in place.
+
+    The view holds no values of its own: every read goes to the network's element
+    table and every write changes it directly, so a parameter changed through the
+    view is immediately seen by the network, its DataFrames and its topology. It
+    offers the same property interface as :class:`networks.Element.Element`.
+
+    The view refers to the element by id, so it stays valid as other elements are
+    added or removed. Using it after its own element has been removed raises KeyError.
+
+    :param network: The network holding the element.
+    :type network: class:`networks.network.Network`
+    :param element_type: The type of the element (eg. "bus", "line").
+    :type element_type: str
+    :param id: The id of the element.
+    :type id: int
+    """
+
+    __slots__ = ("__network", "__element_type", "__id")
+
+    def __init__(self, network, element_type: str, id: int):
+        """
+        Initializes an ElementView.
+
+        :param network: The network holding the element.
+        :type network: class:`networks.network.Network`
+        :param element_type: The type of the element (eg. "bus", "line").
+        :type element_type: str
+        :param id: The id of the element.
+        :type id: int
+        """
+        self.__network = network
+        self.__element_type = element_type
+        self.__id = id
+
+    def __repr__(self):
+        """
+        Get a short description of the view.
+
+        :return: The element type and id of the view.
+        :rtype: str
+        """
+        return f"ElementView({self.__element_type!r}, {self.__id!r})"
+
+    def __eq__(self, other):
+        """
+        Check whether two views refer to the same element of the same network.
+
+        :param other: The object to compare with.
+        :type other: any
+        :return: True if both views refer to the same element.
+        :rtype: bool
+        """
+        if not isinstance(other, ElementView):
+            return NotImplemented
+        return (self.__network is other.__network and self.__element_type == other.__element_type
+                and self.__id == other.__id)
+
+    def __hash__(self):
+        """
+        Hash the view by the element it refers to.
+
+        :return: The hash of the element type and id.
+        :rtype: int
+        """
+        return hash((id(self.__network), self.__element_type, self.__id))
+
+    def get_element_type(self):
+        """
+        Get the type of the element.
+
+        :return: The type of the element (eg. "bus", "line").
+        :rtype: str
+        """
+        return self.__element_type
+
+    def get_id(self):
+        """
+        Get the id of the element.
+
+        :return: The id of the element.
+        :rtype: int
+        """
+        return self.__id
+
+    def get_name(self):
+        """
+        Get the name of the element.
+
+        :return: The name of the element.
+        :rtype: str
+        """
+        return self.__table().get_field(self.__id, "name")
+
+    def set_name(self, n: str):
+        """
+        Set the name of the element.
+
+        :param n: The new name for the element.
+        :type n: str
+        """
+        self.__table().set_field(self.__id, "name", n)
+
+    def get_property(self, var: str):
+        """
+        Get a property of the element.
+
+        :param var: The name of the property to retrieve.
+        :type var: str
+        :return: The value of the requested property, or a message if the element
+            has no such property.
+        :rtype: str or int or float or bool
+        """
+        table = self.__table()
+        if var not in table.fields:
+            return "Not a valid variable for this element"
+        return table.get_field(self.__id, var)
+
+    def set_property(self, var: str, new):
+        """
+        Set a property of the element in the network. The id can not be set.
+
+        :param var: The name of the property to set.
+        :type var: str
+        :param new: The new value for the property.
+        :type new: str or int or float or bool
+        :return: A message if the element has no such property, otherwise None.
+        :rtype: str
+        """
+        table = self.__table()
+        if var == "id" or var not in table.fields:
+            return "Not a valid variable for this element"
+        table.set_field(self.__id, var, new)
+
+    def get_properties(self, vars):
+        """
+        Get several properties of the element at once.
+
+        :param vars: The names of the properties to retrieve.
+        :type vars: iterable
+        :return: The value of each requested property, or a message for the names
+            the element has no property for.
+        :rtype: dict
+        """
+        return {var: self.get_property(var) for var in vars}
+
+    def set_properties(self, values: dict):
+        """
+        Set several properties of the element at once. Either every property is
+        set or, if any name is not a settable property, none is.
+
+        :param values: The new value of each property to set.
+        :type values: dict
+        :return: A message naming the invalid properties, otherwise None.
+        :rtype: str
+        """
+        table = self.__table()
+        invalid = [var for var in values if var == "id" or var not in table.fields]
+        if invalid:
+            return f"Not a valid variable for this element: {', '.join(map(str, invalid))}"
+        for var, new in values.items():
+            table.set_field(self.__id, var, new)
+
+    def to_dict(self):
+        """
+        Read the current values of the element into a dictionary.
+
+        :return: Dictionary representation of the element.
+        :rtype: dict
+        :raises KeyError: If the element has been removed from the network.
+        """
+        return self.__table().get(self.__id)
+
+    def __table(self):
+        """
+        Get the table holding the element.
+
+        :return: The element table of the element's type.
+        :rtype: ElementTable
+        """
+        return self.__network.net[self.__element_type]
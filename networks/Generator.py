@@ -40,6 +40,11 @@ class Generator(Element):
     """
 
     _next_id = 1
+    _fields = (
+        "bus_id", "p_kw", "q_kvar", "kv", "kva", "pvfactor", "fixed", "max_p_kw", "min_p_kw", "max_q_kvar",
+        "min_q_kvar", "phases", "subtrans_react_pu"
+    )
+    __slots__ = tuple(f"__{field}" for field in _fields)
 
     def __init__(self, name: str, bus_id: int, p_kw: float, q_kvar: float, kv: float, kva: float, pvfactor: float, fixed: bool, max_p_kw: float, min_p_kw: float, max_q_kvar: float, min_q_kvar: float, phases: str, subtrans_react_pu: float):
         
@@ -77,7 +82,6 @@ class Generator(Element):
         """
         
         super().__init__(name)
-        self.__id = Generator._next_id
         self.__bus_id = bus_id
         self.__p_kw = p_kw
         self.__q_kvar = q_kvar
@@ -92,95 +96,7 @@ class Generator(Element):
         self.__phases = phases
         self.__subtrans_react_pu = subtrans_react_pu
 
-        Generator._next_id += 1
 
-
-    def get_property(self, var: str):
-        
-        """
-        Get a property of the generator.
-
-        :param var: The name of the property to retrieve.
-        :type var: str
-        :return: The value of the requested property.
-        :rtype: str or float or bool
-        """
-        if var == "name":
-            return self.get_name()
-        elif var == "bus_id":
-            return self.__bus_id
-        elif var == "p_kw":
-            return self.__p_kw
-        elif var == "q_kvar":
-            return self.__q_kvar
-        elif var == "kv":
-            return self.__kv
-        elif var == "kva":
-            return self.__kva
-        elif var == "pvfactor":
-            return self.__pvfactor
-        elif var == "fixed":
-            return self.__fixed
-        elif var == "max_p_kw":
-            return self.__max_p_kw
-        elif var == "min_p_kw":
-            return self.__min_p_kw
-        elif var == "max_q_kvar":
-            return self.__max_q_kvar
-        elif var == "min_q_kvar":
-            return self.__min_q_kvar
-        elif var == "phases":
-            return self.__phases
-        elif var == "subtrans_react_pu":
-            return self.__subtrans_react_pu
-        elif var == "id":
-            return self.__id
-        else:
-            return "Not a valid variable for this element"
-
-    def set_property(self, var: str, new):
-        
-        """
-        Set a property of the generator.
-
-        :param var: The name of the property to set.
-        :type var: str
-        :param new: The new value for the property.
-        :type new: str or float or bool
-        :return: A message indicating the success or failure of the operation.
-        :rtype: str
-        """
-        if var == "name":
-            self.set_name(new)
-        elif var == "bus_id":
-            self.__bus_id = new
-        elif var == "p_kw":
-            self.__p_kw = new
-        elif var == "q_kvar":
-            self.__q_kvar = new
-        elif var == "kv":
-            self.__kv = new
-        elif var == "kva":
-            self.__kva = new
-        elif var == "pvfactor":
-            self.__pvfactor = new
-        elif var == "fixed":
-            self.__fixed = new
-        elif var == "max_p_kw":
-            self.__max_p_kw = new
-        elif var == "min_p_kw":
-            self.__min_p_kw = new
-        elif var == "max_q_kvar":
-            self.__max_q_kvar = new
-        elif var == "min_q_kvar":
-            self.__min_q_kvar = new
-        elif var == "phases":
-            self.__phases = new
-        elif var == "subtrans_react_pu":
-            self.__subtrans_react_pu = new
-        else:
-            return "Not a valid variable for this element"
-        
     def to_dict(self):
         """
         Convert generator attributes to a dictionary.
@@ -190,7 +106,7 @@ class Generator(Element):
         """
         return {
             "name": self.get_name(),
-            "id": self.__id,
+            "id": self.get_id(),
             "bus_id": self.__bus_id,
             "p_kw": self.__p_kw,
             "q_kvar": self.__q_kvar,
@@ -0,0 +1,110 @@
+# IdAllocator Class
+# Thread-safe allocation of element ids
+
+import threading
+
+
+class IdAllocator:
+    """
+    Allocates contiguous blocks of element ids.
+
+    Allocation is guarded by a lock, so an allocator used from several threads, or
+    shared by a network and its forks or by the subnetworks of
+    :meth:`Network.partition_by_zone`, never hands out the same id twice. Only the ids are guarded: the element tables are not, so each
+    network must be modified by one thread at a time. An allocator can reserve a
+    range of its ids for another allocator, which can be sent to a worker process
+    so that networks built in parallel can be merged without renumbering.
+
+    :param start: The first id to allocate, defaults to 1
+    :type start: int, optional
+    :param stop: The id after the last one that may be allocated, defaults to None (unbounded)
+    :type stop: int, optional
+    """
+
+    def __init__(self, start: int = 1, stop: int = None):
+        """
+        Initializes an IdAllocator.
+
+        :param start: The first id to allocate, defaults to 1
+        :type start: int, optional
+        :param stop: The id after the last one that may be allocated, defaults to None (unbounded)
+        :type stop: int, optional
+        """
+        self._next_id = start
+        self._stop = stop
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"next_id": self._next_id, "stop": self._stop}
+
+    def __setstate__(self, state):
+        self._next_id = state["next_id"]
+        self._stop = state["stop"]
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"IdAllocator(next_id={self._next_id}, stop={self._stop})"
+
+    @property
+    def next_id(self):
+        """
+        Get the next id that will be allocated.
+
+        :return: The next id.
+        :rtype: int
+        """
+        return self._next_id
+
+    @property
+    def stop(self):
+        """
+        Get the id after the last one this allocator may allocate.
+
+        :return: The end of the range, None if the allocator is unbounded.
+        :rtype: int
+        """
+        return self._stop
+
+    def allocate(self, count: int = 1, floor: int = None):
+        """
+        Allocate a contiguous block of ids.
+
+        :param count: The number of ids to allocate, defaults to 1
+        :type count: int, optional
+        :param floor: The lowest id the block may start at, used to skip ids already
+            taken by elements that were given their id elsewhere, defaults to None
+        :type floor: int, optional
+        :return: The first id of the block.
+        :rtype: int
+        :raises ValueError: If the range of the allocator does not have enough ids left.
+        """
+        with self._lock:
+            first = self._next_id if floor is None else max(self._next_id, floor)
+            if self._stop is not None and first + count > self._stop:
+                raise ValueError(f"Cannot allocate {count} ids, the range ends at {self._stop}")
+            self._next_id = first + count
+            return first
+
+    def reserve(self, count: int, floor: int = None):
+        """
+        Reserve a block of ids for another allocator.
+
+        :param count: The number of ids to reserve.
+        :type count: int
+        :param floor: The lowest id the block may start at, defaults to None
+        :type floor: int, optional
+        :return: An allocator limited to the reserved block.
+        :rtype: IdAllocator
+        """
+        first = self.allocate(count, floor)
+        return IdAllocator(first, first + count)
+
+    def copy(self):
+        """
+        Create an independent allocator continuing from the same next id.
+
+        :return: A copy of the allocator.
+        :rtype: IdAllocator
+        """
+        with self._lock:
+            return IdAllocator(self._next_id, self._stop)
@@ -25,6 +25,8 @@ class Impedence(Element):
     """
 
     _next_id = 1
+    _fields = ("from_bus_id", "to_bus_id", "r_pu", "x_pu", "kv", "kvar")
+    __slots__ = tuple(f"__{field}" for field in _fields)
 
     def __init__(self,name: str,from_bus_id: int, to_bus_id: int, r_pu: float,x_pu: float,kv: float, kvar: float):
         
@@ -48,74 +50,13 @@ class Impedence(Element):
         """
 
         super().__init__(name)
-        self.__id = Impedence._next_id
         self.__from_bus_id = from_bus_id
         self.__to_bus_id = to_bus_id
         self.__r_pu = r_pu
         self.__x_pu = x_pu
         self.__kv = kv
         self.__kvar = kvar
-        
-        Impedence._next_id += 1
-
-    def get_property(self, var: str):
-        
-        """
-        Get a property of the generator.
 
-        :param var: The name of the property to retrieve.
-        :type var: str
-        :return: The value of the requested property.
-        :rtype: str or float or bool
-        """
-        if var == "name":
-            return self.get_name()
-        elif var == "from_bus_id":
-            return self.__from_bus_id
-        elif var == "to_bus_id":
-            return self.__to_bus_id
-        elif var == "r_pu":
-            return self.__r_pu
-        elif var == "x_pu":
-            return self.__x_pu
-        elif var == "kv":
-            return self.__kv
-        elif var == "kvar":
-            return self.__kvar
-        elif var == "id":
-            return self.__id
-        else:
-            return "Not a valid variable for this element"
-        
-    def set_property(self, var: str, new):
-        
-        """
-        Set a property of the generator.
-
-        :param var: The name of the property to set.
-        :type var: str
-        :param new: The new value for the property.
-        :type new: str or float or bool
-        :return: A message indicating the success or failure of the operation.
-        :rtype: str
-        """
-        if var == "name":
-            self.set_name(new)
-        elif var == "from_bus_id":
-            self.__from_bus_id = new
-        elif var == "to_bus_id":
-            self.__to_bus_id = new
-        elif var == "r_pu":
-            self.__r_pu = new
-        elif var == "x_pu":
-            self.__x_pu = new
-        elif var == "kv":
-            self.__kv = new
-        elif var == "kvar":
-            self.__kvar = new
-        else:
-            return "Not a valid variable for this element"
-        
     def to_dict(self):
         """
         Convert impdence attributes to a dictionary.
@@ -125,7 +66,7 @@ class Impedence(Element):
         """
         return {
             "name": self.get_name(),
-            "id": self.__id,
+            "id": self.get_id(),
             "from_bus_id": self.__from_bus_id,
             "to_bus_id": self.__to_bus_id,
             "r_pu": self.__r_pu,
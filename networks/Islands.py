@@ -0,0 +1,443 @@
+# IslandDetector Class
+# Union-find detection of the connected components of a network
+
+import numpy as np
+import pandas as pd
+
+from networks.Topology import BRANCH_TYPES
+
+
+# switch types (as in pandapower) and the branch element an open switch disconnects
+SWITCHED_BRANCHES = {
+    "l": "line",
+    "t": "transformer",
+    "t3": "threewindingtransformer",
+}
+
+# edge type code used for the bus-bus connections made by closed switches
+_SWITCH = -1
+
+
+def _union_find(parent, sources, targets):
+    """
+    Merge the sets joined by a list of edges in a union-find parent array.
+
+    All edges are processed at once: each round hooks the root of the larger label
+    onto the smaller one and then compresses every path to its root, which at
+    least halves the number of roots touched by an edge, so the number of rounds is
+    logarithmic and each round is linear in the number of edges.
+
+    :param parent: The parent of every node; modified in place and fully compressed on return.
+    :type parent: numpy.ndarray
+    :param sources: The first node of every edge.
+    :type sources: numpy.ndarray
+    :param targets: The second node of every edge.
+    :type targets: numpy.ndarray
+    :return: The parent array, in which every node points to the root of its set.
+    :rtype: numpy.ndarray
+    """
+    while True:
+        source_roots, target_roots = parent[sources], parent[targets]
+        crossing = source_roots != target_roots
+        if not crossing.any():
+            return parent
+        low = np.minimum(source_roots[crossing], target_roots[crossing])
+        high = np.maximum(source_roots[crossing], target_roots[crossing])
+        np.minimum.at(parent, high, low)
+
+        # path compression
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent[:] = grandparent
+
+
+def _gather(indptr, values, rows):
+    """
+    Concatenate the slices of several rows of a compressed sparse row array.
+
+    :param indptr: The start of every row, followed by the end of the last one.
+    :type indptr: numpy.ndarray
+    :param values: The values of all rows.
+    :type values: numpy.ndarray
+    :param rows: The rows to gather.
+    :type rows: numpy.ndarray
+    :return: The values of the rows, one row after the other.
+    :rtype: numpy.ndarray
+    """
+    starts, ends = indptr[rows], indptr[rows + 1]
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return values[offsets + np.arange(lengths.sum())]
+
+
+class IslandDetector:
+    """
+    Detects the connected components (islands) of the buses of a network.
+
+    Buses are joined by a union-find over the branch edges of the network's
+    :class:`networks.Topology.Topology` and over closed bus-bus switches. Buses that
+    are not in service are left out of every component together with their branches.
+
+    Switches are mapped to what they switch through an ``element_id`` column, as in
+    pandapower: a closed switch of type "b" joins ``bus_id`` to the bus
+    ``element_id``, and an open switch of type "l", "t" or "t3" disconnects the
+    line, transformer or three-winding transformer ``element_id``. Closed switches of
+    any other type, such as the circuit breakers and load break switches of
+    :class:`networks.Switch.Switch`, are in series with a branch and do not change
+    the components. Open switches and bus-bus switches that cannot be mapped raise a
+    ValueError instead of being ignored.
+
+    The components are computed lazily and recomputed only when the buses, branches
+    or switches of the network change. Single branches can also be opened and closed
+    on the detector itself for contingency screening. Every bus carries a label and the
+    labels themselves form a union-find, so closing a branch is a single union of the
+    labels of its two components. Opening one searches from both of its ends at once
+    until they meet or one side runs out, and only the buses of that side get a new
+    label. The edges of a branch are found by a binary search over the edge ids of its
+    type.
+
+    :param network: The network whose islands are detected.
+    :type network: class:`networks.network.Network`
+    """
+
+    def __init__(self, network):
+        """
+        Initializes an IslandDetector for a network without computing the components yet.
+
+        :param network: The network whose islands are detected.
+        :type network: class:`networks.network.Network`
+        """
+        self.network = network
+        self._state = None
+        self._opened = set()
+        self._switched_open = set()
+        self._labels = np.empty(0, dtype=np.int64)
+        self._parent = np.empty(0, dtype=np.int64)
+        self._sizes = np.empty(0, dtype=np.int64)
+        self._next_label = 0
+        self._in_service = np.empty(0, dtype=bool)
+        self._sources = np.empty(0, dtype=np.int64)
+        self._targets = np.empty(0, dtype=np.int64)
+        self._types = np.empty(0, dtype=np.int8)
+        self._ids = np.empty(0, dtype=np.int64)
+        self._active = np.empty(0, dtype=bool)
+        self._branch_edges = {}
+        self._adjacency = None
+        self._marks = np.empty(0, dtype=np.int64)
+        self._stamp = 0
+
+    def labels(self):
+        """
+        Get the component of every bus.
+
+        :return: For each bus, in bus table order, a label shared by all buses of its
+            component, or -1 if the bus is not in service. After a full computation the
+            label is the lowest bus row of the component.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        parent = self._parent
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent[:] = grandparent
+        return np.where(self._in_service, parent[self._labels], -1)
+
+    def connected_components(self):
+        """
+        Get the connected components of the in-service buses.
+
+        :return: The bus ids of each component, largest component first.
+        :rtype: list
+        """
+        labels = self.labels()
+        bus_ids = self.network.get_topology().bus_ids()
+        rows = np.flatnonzero(labels >= 0)
+        order = rows[np.argsort(labels[rows], kind="stable")]
+        _, starts = np.unique(labels[order], return_index=True)
+        components = np.split(bus_ids[order], starts[1:]) if len(order) else []
+        return sorted(components, key=len, reverse=True)
+
+    def find_islands(self):
+        """
+        Get the buses cut off from the main grid, the largest connected component.
+
+        :return: The bus ids of each component other than the largest one.
+        :rtype: list
+        """
+        return self.connected_components()[1:]
+
+    def is_connected(self, bus_id: int, other_bus_id: int):
+        """
+        Check whether two buses are in the same component.
+
+        :param bus_id: The id of the first bus.
+        :type bus_id: int
+        :param other_bus_id: The id of the second bus.
+        :type other_bus_id: int
+        :return: True if both buses are in service and connected.
+        :rtype: bool
+        """
+        self._ensure_built()
+        topology = self.network.get_topology()
+        node, other = topology.node_of(bus_id), topology.node_of(other_bus_id)
+        if not (self._in_service[node] and self._in_service[other]):
+            return False
+        return self._find(self._labels[node]) == self._find(self._labels[other])
+
+    def open_branch(self, element_type: str, id: int):
+        """
+        Disconnect a branch for island detection without changing the network.
+
+        Only the buses on the smaller side of the branch are visited.
+
+        :param element_type: The type of the branch (eg. "line", "transformer").
+        :type element_type: str
+        :param id: The id of the branch.
+        :type id: int
+        """
+        self._ensure_built()
+        self._opened.add((element_type, id))
+        edges = self._edges_of(element_type, id)
+        edges = edges[self._active[edges]]
+        self._active[edges] = False
+        for edge in edges.tolist():
+            node, other = self._sources[edge], self._targets[edge]
+            root = self._find(self._labels[node])
+            if root != self._find(self._labels[other]):
+                continue
+            side = self._split(node, other)
+            if side is not None:
+                label = self._new_label()
+                self._labels[side] = label
+                self._sizes[root] -= len(side)
+                self._sizes[label] = len(side)
+
+    def close_branch(self, element_type: str, id: int):
+        """
+        Reconnect a branch previously opened with :meth:`open_branch`.
+
+        :param element_type: The type of the branch (eg. "line", "transformer").
+        :type element_type: str
+        :param id: The id of the branch.
+        :type id: int
+        """
+        self._ensure_built()
+        self._opened.discard((element_type, id))
+        if self._is_switched_open(element_type, id):
+            return
+        edges = self._edges_of(element_type, id)
+        edges = edges[~self._active[edges] & self._in_service[self._sources[edges]] & self._in_service[self._targets[edges]]]
+        self._active[edges] = True
+        for edge in edges.tolist():
+            self._union(self._labels[self._sources[edge]], self._labels[self._targets[edge]])
+
+    def _edges_of(self, element_type: str, id: int):
+        """
+        Get the edges belonging to a branch.
+
+        :param element_type: The type of the branch.
+        :type element_type: str
+        :param id: The id of the branch.
+        :type id: int
+        :return: The positions of the edges of the branch.
+        :rtype: numpy.ndarray
+        """
+        if element_type not in self._branch_edges:
+            return np.empty(0, dtype=np.int64)
+        ids, edges = self._branch_edges[element_type]
+        return edges[np.searchsorted(ids, id, side="left"):np.searchsorted(ids, id, side="right")]
+
+    def _is_switched_open(self, element_type: str, id: int):
+        """
+        Check whether a branch is disconnected by an open switch.
+
+        :param element_type: The type of the branch.
+        :type element_type: str
+        :param id: The id of the branch.
+        :type id: int
+        :return: True if an open switch disconnects the branch.
+        :rtype: bool
+        """
+        return (element_type, id) in self._switched_open
+
+    def _neighbours(self, nodes):
+        """
+        Get the nodes reached from a set of nodes over one active edge.
+
+        :param nodes: The nodes.
+        :type nodes: numpy.ndarray
+        :return: The neighbours, with repetitions.
+        :rtype: numpy.ndarray
+        """
+        indptr, neighbours, edges = self._adjacency
+        reached = _gather(indptr, neighbours, nodes)
+        return reached[self._active[_gather(indptr, edges, nodes)]]
+
+    def _split(self, node: int, other: int):
+        """
+        Search the active edges from two nodes at once, always extending the side that
+        has visited fewer nodes, until the sides meet or one of them runs out.
+
+        :param node: The first node.
+        :type node: int
+        :param other: The second node.
+        :type other: int
+        :return: The nodes of the side that ran out if the nodes are no longer
+            connected, None otherwise.
+        :rtype: numpy.ndarray or None
+        """
+        if node == other:
+            return None
+        self._stamp += 2
+        marks, stamps = self._marks, (self._stamp - 1, self._stamp)
+        marks[node], marks[other] = stamps
+        frontiers = [np.array([node]), np.array([other])]
+        visited = [[frontiers[0]], [frontiers[1]]]
+        counts = [1, 1]
+        while True:
+            side = 0 if counts[0] <= counts[1] else 1
+            reached = self._neighbours(frontiers[side])
+            if (marks[reached] == stamps[1 - side]).any():
+                return None
+            frontier = np.unique(reached[marks[reached] != stamps[side]])
+            if len(frontier) == 0:
+                return np.concatenate(visited[side])
+            marks[frontier] = stamps[side]
+            frontiers[side] = frontier
+            visited[side].append(frontier)
+            counts[side] += len(frontier)
+
+    def _new_label(self):
+        """
+        Get an unused component label.
+
+        :return: The label.
+        :rtype: int
+        """
+        label = self._next_label
+        self._next_label += 1
+        if label >= len(self._parent):
+            grown = np.arange(len(self._parent), 2 * len(self._parent) + 1)
+            self._parent = np.concatenate([self._parent, grown])
+            self._sizes = np.concatenate([self._sizes, np.zeros(len(grown), dtype=np.int64)])
+        return label
+
+    def _find(self, label: int):
+        """
+        Find the root of the set of a label, halving the path on the way.
+
+        :param label: The label.
+        :type label: int
+        :return: The root of the set.
+        :rtype: int
+        """
+        parent = self._parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def _union(self, label: int, other: int):
+        """
+        Merge the sets of two labels, hooking the smaller set onto the larger one.
+
+        :param label: The first label.
+        :type label: int
+        :param other: The second label.
+        :type other: int
+        """
+        root, other_root = self._find(label), self._find(other)
+        if root == other_root:
+            return
+        if self._sizes[root] < self._sizes[other_root]:
+            root, other_root = other_root, root
+        self._parent[other_root] = root
+        self._sizes[root] += self._sizes[other_root]
+
+    def _ensure_built(self):
+        """
+        Recompute the components if the buses, branches or switches changed since the last computation.
+        """
+        tables = [self.network.net[element_type] for element_type in ("bus", "switch") + BRANCH_TYPES]
+        state = tuple((id(table), table.version) for table in tables)
+        if state != self._state:
+            self._build()
+            self._state = state
+
+    def _build(self):
+        """
+        Collect the edges of the network and run the union-find over all of them, giving
+        every bus the lowest bus row of its component as its label.
+        """
+        topology = self.network.get_topology()
+        buses = self.network.net["bus"]
+        n = topology.num_buses
+
+        in_service = np.ones(n, dtype=bool)
+        if n and "in_service" in buses.fields:
+            in_service = buses.column("in_service").astype(bool)
+
+        # each branch edge is stored in both directions, keep one of them
+        sources, targets = topology.edge_sources, topology.indices
+        forward = sources <= targets
+        sources, targets = sources[forward], targets[forward]
+        types, ids = topology.edge_types[forward], topology.edge_ids[forward]
+
+        self._switched_open = set()
+        switches = self.network.net["switch"]
+        if len(switches):
+            closed = switches.column("closed").astype(bool)
+            switch_types = switches.column("type")
+            element_ids = np.full(len(switches), np.nan)
+            if "element_id" in switches.fields:
+                element_ids = switches.column("element_id")
+            mapped = pd.notna(element_ids) & np.isin(switch_types, ("b",) + tuple(SWITCHED_BRANCHES))
+            unmapped = ~mapped & (~closed | (switch_types == "b"))
+            if unmapped.any():
+                raise ValueError(f"Switches {switches.column('id')[unmapped].tolist()} cannot be mapped to the "
+                                 f"bus or branch they switch, they need an element_id and a type of 'b', 'l', 't' or 't3'")
+            element_ids = np.where(mapped, element_ids, -1).astype(np.int64)
+
+            bus_bus = closed & (switch_types == "b")
+            from_nodes = buses.rows_of(switches.column("bus_id")[bus_bus])
+            to_nodes = buses.rows_of(element_ids[bus_bus])
+            valid = (from_nodes >= 0) & (to_nodes >= 0)
+            sources = np.concatenate([sources, from_nodes[valid]])
+            targets = np.concatenate([targets, to_nodes[valid]])
+            types = np.concatenate([types, np.full(valid.sum(), _SWITCH, dtype=np.int8)])
+            ids = np.concatenate([ids, np.asarray(switches.column("id")[bus_bus][valid], dtype=ids.dtype)])
+
+            for switch_type, element_type in SWITCHED_BRANCHES.items():
+                opened = element_ids[~closed & (switch_types == switch_type)]
+                self._switched_open.update((element_type, id) for id in opened.tolist())
+
+        self._sources, self._targets = sources, targets
+        self._types, self._ids = types, ids
+        self._in_service = in_service
+
+        # the edges of every branch type sorted by branch id, and the edges at every node
+        self._branch_edges = {}
+        for code, element_type in enumerate(BRANCH_TYPES):
+            edges = np.flatnonzero(types == code)
+            edges = edges[np.argsort(ids[edges], kind="stable")]
+            self._branch_edges[element_type] = (ids[edges], edges)
+        ends = np.concatenate([sources, targets])
+        order = np.argsort(ends, kind="stable")
+        indptr = np.searchsorted(ends[order], np.arange(n + 1))
+        self._adjacency = (indptr, np.concatenate([targets, sources])[order], np.concatenate([np.arange(len(sources))] * 2)[order])
+        self._marks = np.zeros(n, dtype=np.int64)
+
+        active = in_service[sources] & in_service[targets]
+        for element_type, id in self._switched_open | self._opened:
+            if element_type in BRANCH_TYPES:
+                active[self._edges_of(element_type, id)] = False
+        self._active = active
+
+        self._labels = _union_find(np.arange(n), sources[active], targets[active])
+        self._parent = np.arange(n)
+        self._sizes = np.bincount(self._labels, minlength=n)
+        self._next_label = n
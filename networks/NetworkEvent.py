@@ -0,0 +1,119 @@
+# NetworkEvent Class
+# Notification of a change to the elements of a network
+
+import numpy as np
+import pandas as pd
+
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+class NetworkEvent:
+    """
+    A change to some elements of one type in a network.
+
+    Elements are either added, removed, or changed in one field. Adding many
+    elements at once, or a batch of changes of the same kind to the same field,
+    is reported as a single event holding the ids of every element concerned.
+    Changing the id of an element is reported as the removal of the old id and
+    the addition of the new one.
+
+    :param element_type: The type of the elements (eg. "bus", "line").
+    :type element_type: str
+    :param kind: "added", "removed" or "changed".
+    :type kind: str
+    :param ids: The ids of the elements.
+    :type ids: numpy.ndarray
+    :param field: The field that was changed, None for added and removed elements, defaults to None
+    :type field: str, optional
+    """
+
+    __slots__ = ("element_type", "kind", "ids", "field")
+
+    def __init__(self, element_type: str, kind: str, ids, field: str = None):
+        """
+        Initializes a NetworkEvent.
+
+        :param element_type: The type of the elements (eg. "bus", "line").
+        :type element_type: str
+        :param kind: "added", "removed" or "changed".
+        :type kind: str
+        :param ids: The ids of the elements.
+        :type ids: numpy.ndarray
+        :param field: The field that was changed, None for added and removed elements, defaults to None
+        :type field: str, optional
+        """
+        self.element_type = element_type
+        self.kind = kind
+        self.ids = ids
+        self.field = field
+
+    def __repr__(self):
+        """
+        Get a short description of the event.
+
+        :return: The element type, kind, field and number of elements of the event.
+        :rtype: str
+        """
+        field = f", field={self.field!r}" if self.field is not None else ""
+        return f"NetworkEvent({self.element_type!r}, {self.kind!r}{field}, count={len(self.ids)})"
+
+    def __eq__(self, other):
+        """
+        Check whether two events report the same change.
+
+        :param other: The object to compare with.
+        :type other: any
+        :return: True if both events have the same element type, kind, field and ids.
+        :rtype: bool
+        """
+        if not isinstance(other, NetworkEvent):
+            return NotImplemented
+        return (self.element_type == other.element_type and self.kind == other.kind
+                and self.field == other.field and np.array_equal(self.ids, other.ids))
+
+    __hash__ = None
+
+    @staticmethod
+    def coalesce(events):
+        """
+        Merge consecutive events of the same element type, kind and field.
+
+        Only consecutive events are merged, so the order in which the changes
+        happened is kept: an element added and then removed in the same batch is
+        reported as added, then removed.
+
+        :param events: The events in the order they happened.
+        :type events: list
+        :return: The merged events.
+        :rtype: list
+        """
+        merged = []
+        pending = []
+        for event in events:
+            if pending and (event.element_type, event.kind, event.field) != (pending[0].element_type, pending[0].kind, pending[0].field):
+                merged.append(NetworkEvent._merge(pending))
+                pending = []
+            pending.append(event)
+        if pending:
+            merged.append(NetworkEvent._merge(pending))
+        return merged
+
+    @staticmethod
+    def _merge(events):
+        """
+        Merge events of the same element type, kind and field into one, listing
+        an element changed several times only once.
+
+        :param events: The events to merge.
+        :type events: list
+        :return: A single event holding the ids of every event.
+        :rtype: NetworkEvent
+        """
+        first = events[0]
+        if len(events) == 1:
+            return first
+        ids = pd.unique(np.concatenate([event.ids for event in events]))
+        return NetworkEvent(first.element_type, first.kind, ids, first.field)
@@ -0,0 +1,574 @@
+# NetworkGenerator Class
+# Synthetic distribution networks and injection time series at configurable scale
+
+import numpy as np
+
+from networks.network import Network
+from injections.injections import Injections, Injection
+
+
+# voltage levels of the generated networks with typical line data (pandapower standard types)
+LEVELS = {
+    "hv": {"vn_kv": 110.0, "r_ohm_per_km": 0.06, "x_ohm_per_km": 0.4, "c_nf_per_km": 10.0, "max_amp": 645.0,
+           "length_km": (5.0, 40.0), "type": "ol", "max_ka": 40.0},
+    "mv": {"vn_kv": 20.0, "r_ohm_per_km": 0.16, "x_ohm_per_km": 0.12, "c_nf_per_km": 280.0, "max_amp": 320.0,
+           "length_km": (0.3, 3.0), "type": "cs", "max_ka": 16.0},
+    "lv": {"vn_kv": 0.4, "r_ohm_per_km": 0.2, "x_ohm_per_km": 0.08, "c_nf_per_km": 210.0, "max_amp": 270.0,
+           "length_km": (0.02, 0.3), "type": "cs", "max_ka": 1.0},
+}
+
+# transformer data between consecutive voltage levels
+TRANSFORMERS = {
+    "mv": {"sn_kva": 40000.0, "vk_percent": 12.0, "vkr_percent": 0.3, "pfe_kw": 18.0, "i0_percent": 0.05,
+           "tap_min": -9, "tap_max": 9, "tap_step_percent": 1.5},
+    "lv": {"sn_kva": 630.0, "vk_percent": 6.0, "vkr_percent": 1.0, "pfe_kw": 1.15, "i0_percent": 0.26,
+           "tap_min": -2, "tap_max": 2, "tap_step_percent": 2.5},
+}
+
+# median active power in kW of the loads and distributed generators at each level
+LOAD_KW = {"mv": 400.0, "lv": 4.0}
+GENERATION_KW = {"mv": 1500.0, "lv": 6.0}
+
+# tan(phi) of the loads, for a power factor of 0.95
+_TAN_PHI = np.tan(np.arccos(0.95))
+
+
+def _names(prefix: str, count: int):
+    """
+    Number element names.
+
+    :param prefix: The name of the element type, eg. "Bus".
+    :type prefix: str
+    :param count: The number of names.
+    :type count: int
+    :return: The names prefix1 to prefix<count>.
+    :rtype: numpy.ndarray
+    """
+    return np.array([f"{prefix}{number}" for number in range(1, count + 1)], dtype=object)
+
+
+class NetworkGenerator:
+    """
+    Generates synthetic but realistic distribution networks for tests and scaling benchmarks.
+
+    The buses are split over three voltage levels: about 1% at 110 kV, 10% at 20 kV
+    and the rest at 0.4 kV. Within a level every bus is connected by a line to a
+    recently created bus of the same level, which gives long feeders with local
+    branching, and some buses start a new feeder below a bus of the level above
+    through a transformer. The result is radial: a tree of lines and transformers
+    spanning every bus. Meshed networks add extra lines between nearby buses of the
+    same level.
+
+    Loads, distributed generators and storage units are placed at random medium and
+    low voltage buses, with powers drawn from a log-normal distribution around
+    typical values of their level, and a large generator at the first 110 kV bus
+    supplies the rest. Switches are placed at the start of some lines. Buses are
+    grouped into zones by the 110 kV bus supplying them.
+
+    Every array is drawn at once and added with the bulk ``add_*`` methods, so
+    networks of a million buses are generated in seconds. The same seed always
+    generates the same network.
+
+    :param num_buses: The number of buses, at least 1.
+    :type num_buses: int
+    :param topology: "radial" or "meshed", defaults to "radial"
+    :type topology: str, optional
+    :param num_zones: The number of zones, at most the number of 110 kV buses, defaults to 1
+    :type num_zones: int, optional
+    :param seed: The seed of the random generator, defaults to None
+    :type seed: int, optional
+    :param mesh_ratio: The number of extra lines of a meshed network per bus, defaults to 0.1
+    :type mesh_ratio: float, optional
+    :param load_share: The share of medium and low voltage buses with a load, defaults to 0.6
+    :type load_share: float, optional
+    :param generator_share: The share of medium and low voltage buses with a generator, defaults to 0.1
+    :type generator_share: float, optional
+    :param storage_share: The share of medium and low voltage buses with a storage unit, defaults to 0.02
+    :type storage_share: float, optional
+    :param switch_share: The share of lines with a switch, defaults to 0.1
+    :type switch_share: float, optional
+    """
+
+    def __init__(self, num_buses: int, topology: str = "radial", num_zones: int = 1, seed: int = None,
+                 mesh_ratio: float = 0.1, load_share: float = 0.6, generator_share: float = 0.1,
+                 storage_share: float = 0.02, switch_share: float = 0.1):
+        """
+        Initializes a NetworkGenerator.
+
+        :param num_buses: The number of buses, at least 1.
+        :type num_buses: int
+        :param topology: "radial" or "meshed", defaults to "radial"
+        :type topology: str, optional
+        :param num_zones: The number of zones, at most the number of 110 kV buses, defaults to 1
+        :type num_zones: int, optional
+        :param seed: The seed of the random generator, defaults to None
+        :type seed: int, optional
+        :param mesh_ratio: The number of extra lines of a meshed network per bus, defaults to 0.1
+        :type mesh_ratio: float, optional
+        :param load_share: The share of medium and low voltage buses with a load, defaults to 0.6
+        :type load_share: float, optional
+        :param generator_share: The share of medium and low voltage buses with a generator, defaults to 0.1
+        :type generator_share: float, optional
+        :param storage_share: The share of medium and low voltage buses with a storage unit, defaults to 0.02
+        :type storage_share: float, optional
+        :param switch_share: The share of lines with a switch, defaults to 0.1
+        :type switch_share: float, optional
+        :raises ValueError: If the number of buses or the topology is not valid.
+        """
+        if num_buses < 1:
+            raise ValueError("A network needs at least one bus")
+        if topology not in ("radial", "meshed"):
+            raise ValueError(f"Topology {topology} not supported, use 'radial' or 'meshed'")
+        self.num_buses = int(num_buses)
+        self.topology = topology
+        self.num_zones = max(int(num_zones), 1)
+        self.seed = seed
+        self.mesh_ratio = mesh_ratio
+        self.load_share = load_share
+        self.generator_share = generator_share
+        self.storage_share = storage_share
+        self.switch_share = switch_share
+
+    def generate(self):
+        """
+        Generate a network.
+
+        :return: A new network with buses, lines, transformers, loads, generators,
+            storage units and switches.
+        :rtype: Network
+        """
+        rng = np.random.default_rng(self.seed)
+        network = Network()
+
+        counts = self._level_counts()
+        starts = dict(zip(counts, np.cumsum([0] + list(counts.values()))[:-1].tolist()))
+        levels = np.repeat(np.arange(len(counts)), list(counts.values()))
+        names = list(counts)
+        vn_kv = np.array([LEVELS[name]["vn_kv"] for name in names])[levels]
+
+        # the parent of every bus: an earlier bus of its level, or a bus of the level above
+        parent = np.arange(self.num_buses)
+        upward = np.zeros(self.num_buses, dtype=bool)
+        for level, name in enumerate(names):
+            count, start = counts[name], starts[name]
+            position = np.arange(count)
+            offset = 1 + np.floor(rng.random(count) * np.minimum(position, 20)).astype(np.int64)
+            parent[start:start + count] = start + position - offset
+            if level > 0:
+                above = names[level - 1]
+                new_feeder = (position == 0) | (rng.random(count) < 0.05)
+                # feeders are spread evenly over the buses above, so neighbouring feeders share a supply
+                supply = starts[above] + (position * counts[above]) // count
+                parent[start:start + count] = np.where(new_feeder, supply, parent[start:start + count])
+                upward[start:start + count] = new_feeder
+        parent[0] = 0
+
+        zones = self._zones(parent, counts["hv"])
+        bus_ids = network.add_buses({
+            "name": _names("Bus", self.num_buses),
+            "vn_kv": vn_kv,
+            "type": np.full(self.num_buses, "b"),
+            "zone": _names("Zone", zones.max())[zones - 1],
+            "max_vm_pu": np.full(self.num_buses, 1.05),
+            "min_vm_pu": np.full(self.num_buses, 0.95),
+            "in_service": np.ones(self.num_buses, dtype=bool),
+        })
+
+        children = np.arange(1, self.num_buses)
+        lines = children[~upward[children]]
+        from_buses, to_buses = parent[lines], lines
+        if self.topology == "meshed":
+            extra_from, extra_to = self._mesh(rng, counts, starts)
+            from_buses = np.concatenate([from_buses, extra_from])
+            to_buses = np.concatenate([to_buses, extra_to])
+        line_ids = self._add_lines(network, rng, bus_ids, levels, names, from_buses, to_buses)
+
+        trafos = np.flatnonzero(upward)
+        self._add_transformers(network, bus_ids, levels, names, parent[trafos], trafos)
+
+        distribution = np.flatnonzero(levels > 0)
+        load_buses = distribution[rng.random(len(distribution)) < self.load_share]
+        load_kw = self._add_loads(network, rng, bus_ids, levels, names, vn_kv, load_buses)
+        generator_buses = distribution[rng.random(len(distribution)) < self.generator_share]
+        self._add_generators(network, rng, bus_ids, levels, names, vn_kv, generator_buses, load_kw)
+        storage_buses = distribution[rng.random(len(distribution)) < self.storage_share]
+        self._add_storages(network, rng, bus_ids, levels, names, storage_buses)
+
+        switched = rng.random(len(line_ids)) < self.switch_share
+        self._add_switches(network, bus_ids, levels, names, from_buses[switched])
+        return network
+
+    def generate_injections(self, network, num_steps: int = 96, step_hours: float = 0.25, seed: int = None):
+        """
+        Generate one day of injection time series for the loads and generators of a network.
+
+        Loads follow a residential profile with morning and evening peaks, and
+        generators a solar profile with a midday peak, both scaled by the active
+        power of the element and disturbed by random noise.
+
+        :param network: The network whose loads and generators get injections.
+        :type network: Network
+        :param num_steps: The number of time steps, defaults to 96
+        :type num_steps: int, optional
+        :param step_hours: The length of a time step in hours, defaults to 0.25
+        :type step_hours: float, optional
+        :param seed: The seed of the random generator, defaults to the seed of the generator
+        :type seed: int, optional
+        :return: The injections in kW, located at the element ids; the magnitudes of
+            each injection are a read-only view of a row of one shared NumPy array,
+            and all injections view the same array of times.
+        :rtype: Injections
+        """
+        rng = np.random.default_rng(self.seed if seed is None else seed)
+        times = np.arange(num_steps) * step_hours
+        hours = times % 24
+
+        load_profile = 0.4 + 0.35 * np.exp(-((hours - 8) / 2) ** 2) + 0.6 * np.exp(-((hours - 19) / 2.5) ** 2)
+        solar_profile = np.clip(np.sin(np.pi * (hours - 6) / 12), 0, None)
+        return Injections(self._injections(network.net["load"], load_profile, rng, times),
+                          self._injections(network.net["generator"], solar_profile, rng, times))
+
+    def _level_counts(self):
+        """
+        Split the buses over the voltage levels.
+
+        :return: The number of buses of each level, at least one 110 kV bus.
+        :rtype: dict
+        """
+        hv = max(1, self.num_buses // 100)
+        mv = min(max(1, self.num_buses // 10), self.num_buses - hv)
+        return {"hv": hv, "mv": mv, "lv": self.num_buses - hv - mv}
+
+    def _zones(self, parent, hv_count: int):
+        """
+        Give every bus the zone of the 110 kV bus supplying it.
+
+        :param parent: The parent of every bus.
+        :type parent: numpy.ndarray
+        :param hv_count: The number of 110 kV buses, which come first.
+        :type hv_count: int
+        :return: The zone number of every bus, starting at 1.
+        :rtype: numpy.ndarray
+        """
+        supply = parent.copy()
+        supply[:hv_count] = np.arange(hv_count)
+        while True:
+            jumped = supply[supply]
+            if np.array_equal(jumped, supply):
+                break
+            supply = jumped
+        zones = 1 + (np.arange(hv_count) * min(self.num_zones, hv_count)) // hv_count
+        return zones[supply]
+
+    def _mesh(self, rng, counts: dict, starts: dict):
+        """
+        Draw the extra lines of a meshed network between nearby buses of the same level.
+
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param counts: The number of buses of each level.
+        :type counts: dict
+        :param starts: The first bus of each level.
+        :type starts: dict
+        :return: The from and to buses of the extra lines.
+        :rtype: tuple
+        """
+        from_buses, to_buses = [], []
+        for name, count in counts.items():
+            if count < 3:
+                continue
+            extra = int(round(self.mesh_ratio * count))
+            to_bus = rng.integers(2, count, extra)
+            offset = 2 + np.floor(rng.random(extra) * np.minimum(to_bus - 1, 50)).astype(np.int64)
+            from_buses.append(starts[name] + to_bus - offset)
+            to_buses.append(starts[name] + to_bus)
+        if not from_buses:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(from_buses), np.concatenate(to_buses)
+
+    @staticmethod
+    def _level_data(data: dict, field: str, names: list, levels):
+        """
+        Look up a value of the level data for a set of buses.
+
+        :param data: The data of each level, eg. ``LEVELS``.
+        :type data: dict
+        :param field: The field of the level data.
+        :type field: str
+        :param names: The level names, in level order.
+        :type names: list
+        :param levels: The level of each bus.
+        :type levels: numpy.ndarray
+        :return: The value for each bus.
+        :rtype: numpy.ndarray
+        """
+        values = [data[name][field] for name in names if name in data]
+        # levels without data, such as 110 kV for transformers, are never looked up
+        return np.array([data[name][field] if name in data else values[0] for name in names])[levels]
+
+    def _add_lines(self, network, rng, bus_ids, levels, names, from_buses, to_buses):
+        """
+        Add the lines between pairs of buses of the same level.
+
+        :param network: The network the elements are added to.
+        :type network: Network
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param bus_ids: The id of every bus.
+        :type bus_ids: numpy.ndarray
+        :param levels: The level of every bus.
+        :type levels: numpy.ndarray
+        :param names: The level names, in level order.
+        :type names: list
+        :param from_buses: The bus row where each line starts.
+        :type from_buses: numpy.ndarray
+        :param to_buses: The bus row where each line ends, whose level the line takes.
+        :type to_buses: numpy.ndarray
+        :return: The ids of the lines.
+        :rtype: numpy.ndarray
+        """
+        count = len(from_buses)
+        line_levels = levels[to_buses]
+        low = self._level_data(LEVELS, "length_km", names, line_levels)
+        length_km = np.round(np.exp(rng.uniform(np.log(low[:, 0]), np.log(low[:, 1]))), 3) if count else np.empty(0)
+        r = self._level_data(LEVELS, "r_ohm_per_km", names, line_levels)
+        x = self._level_data(LEVELS, "x_ohm_per_km", names, line_levels)
+        c = self._level_data(LEVELS, "c_nf_per_km", names, line_levels)
+        max_amp = self._level_data(LEVELS, "max_amp", names, line_levels)
+        return network.add_lines({
+            "name": _names("Line", count),
+            "from_bus_id": bus_ids[from_buses],
+            "to_bus_id": bus_ids[to_buses],
+            "length_km": length_km,
+            "max_loading_percent": np.full(count, 100.0),
+            "r_ohm_per_km": r,
+            "x_ohm_per_km": x,
+            "c_nf_per_km": c,
+            "r0_ohm_per_km": 3 * r,
+            "x0_ohm_per_km": 3 * x,
+            "c0_nf_per_km": 0.6 * c,
+            "norm_amp": 0.8 * max_amp,
+            "max_amp": max_amp,
+            "num_parallel": np.ones(count, dtype=np.int64),
+            "derating_factor": np.ones(count),
+            "phases": np.full(count, 3),
+            "type": self._level_data(LEVELS, "type", names, line_levels).astype(object),
+        })
+
+    def _add_transformers(self, network, bus_ids, levels, names, hv_buses, lv_buses):
+        """
+        Add the transformers feeding each new feeder from the level above.
+
+        :param network: The network the elements are added to.
+        :type network: Network
+        :param bus_ids: The id of every bus.
+        :type bus_ids: numpy.ndarray
+        :param levels: The level of every bus.
+        :type levels: numpy.ndarray
+        :param names: The level names, in level order.
+        :type names: list
+        :param hv_buses: The bus row of the high voltage side of each transformer.
+        :type hv_buses: numpy.ndarray
+        :param lv_buses: The bus row of the low voltage side of each transformer, the first bus of a feeder.
+        :type lv_buses: numpy.ndarray
+        """
+        count = len(lv_buses)
+        trafo_levels = levels[lv_buses]
+        data = {field: self._level_data(TRANSFORMERS, field, names, trafo_levels)
+                for field in ("sn_kva", "vk_percent", "vkr_percent", "pfe_kw", "i0_percent", "tap_min", "tap_max", "tap_step_percent")}
+        network.add_transformers({
+            "name": _names("Transformer", count),
+            "hv_bus_id": bus_ids[hv_buses],
+            "lv_bus_id": bus_ids[lv_buses],
+            "hv_kv": self._level_data(LEVELS, "vn_kv", names, levels[hv_buses]),
+            "lv_kv": self._level_data(LEVELS, "vn_kv", names, trafo_levels),
+            "tap_neutral": np.zeros(count, dtype=np.int64),
+            "rh": np.full(count, 0.01),
+            "rl": np.full(count, 0.01),
+            "x": data["vk_percent"] / 100,
+            **data,
+        })
+
+    def _add_loads(self, network, rng, bus_ids, levels, names, vn_kv, buses):
+        """
+        Add loads at a set of buses.
+
+        :param network: The network the elements are added to.
+        :type network: Network
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param bus_ids: The id of every bus.
+        :type bus_ids: numpy.ndarray
+        :param levels: The level of every bus.
+        :type levels: numpy.ndarray
+        :param names: The level names, in level order.
+        :type names: list
+        :param vn_kv: The nominal voltage of every bus in kV.
+        :type vn_kv: numpy.ndarray
+        :param buses: The bus row of each load.
+        :type buses: numpy.ndarray
+        :return: The active power of the loads in kW.
+        :rtype: numpy.ndarray
+        """
+        count = len(buses)
+        p_kw = np.round(self._powers(rng, LOAD_KW, names, levels[buses]), 3)
+        q_kvar = np.round(p_kw * _TAN_PHI, 3)
+        network.add_loads({
+            "name": _names("Load", count),
+            "bus_id": bus_ids[buses],
+            "p_kw": p_kw,
+            "q_kvar": q_kvar,
+            "kv": vn_kv[buses],
+            "kva": np.round(p_kw / 0.95, 3),
+            "const_z_percent": np.zeros(count),
+            "const_i_percent": np.zeros(count),
+            "fixed": np.ones(count, dtype=bool),
+            "max_p_kw": 1.2 * p_kw,
+            "min_p_kw": np.zeros(count),
+            "max_q_kvar": 1.2 * q_kvar,
+            "min_q_kvar": np.zeros(count),
+        })
+        return p_kw
+
+    def _add_generators(self, network, rng, bus_ids, levels, names, vn_kv, buses, load_kw):
+        """
+        Add the supplying generator at the first bus and distributed generators at a set of buses.
+
+        :param network: The network the elements are added to.
+        :type network: Network
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param bus_ids: The id of every bus.
+        :type bus_ids: numpy.ndarray
+        :param levels: The level of every bus.
+        :type levels: numpy.ndarray
+        :param names: The level names, in level order.
+        :type names: list
+        :param vn_kv: The nominal voltage of every bus in kV.
+        :type vn_kv: numpy.ndarray
+        :param buses: The bus row of each distributed generator.
+        :type buses: numpy.ndarray
+        :param load_kw: The active power of every load in kW, which the supplying generator covers.
+        :type load_kw: numpy.ndarray
+        """
+        p_kw = np.round(self._powers(rng, GENERATION_KW, names, levels[buses]), 3)
+        # the supplying generator covers the loads with a margin
+        p_kw = np.concatenate([[np.round(max(1.2 * load_kw.sum(), 1000.0), 3)], p_kw])
+        buses = np.concatenate([[0], buses]).astype(np.int64)
+        count = len(buses)
+        network.add_generators({
+            "name": _names("Gen", count),
+            "bus_id": bus_ids[buses],
+            "p_kw": p_kw,
+            "q_kvar": np.zeros(count),
+            "kv": vn_kv[buses],
+            "kva": np.round(p_kw / 0.9, 3),
+            "pvfactor": np.ones(count),
+            "fixed": np.arange(count) > 0,
+            "max_p_kw": p_kw,
+            "min_p_kw": np.zeros(count),
+            "max_q_kvar": np.round(0.5 * p_kw, 3),
+            "min_q_kvar": np.round(-0.5 * p_kw, 3),
+            "phases": np.full(count, 3),
+            "subtrans_react_pu": np.full(count, 0.2),
+        })
+
+    def _add_storages(self, network, rng, bus_ids, levels, names, buses):
+        """
+        Add storage units at a set of buses.
+
+        :param network: The network the elements are added to.
+        :type network: Network
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param bus_ids: The id of every bus.
+        :type bus_ids: numpy.ndarray
+        :param levels: The level of every bus.
+        :type levels: numpy.ndarray
+        :param names: The level names, in level order.
+        :type names: list
+        :param buses: The bus row of each storage unit.
+        :type buses: numpy.ndarray
+        """
+        count = len(buses)
+        power_kw = np.round(self._powers(rng, GENERATION_KW, names, levels[buses]), 3)
+        network.add_storages({
+            "name": _names("Storage", count),
+            "bus_id": bus_ids[buses],
+            "p_kw": np.zeros(count),
+            "p_kvar": np.zeros(count),
+            "max_e_kwh": 2 * power_kw,
+            "min_e_kwh": np.zeros(count),
+            "soc_percent": np.full(count, 50.0),
+            "max_p_mv": power_kw / 1000,
+            "min_p_kw": -power_kw,
+            "max_q_mvar": power_kw / 2000,
+            "min_q_kvar": -power_kw / 2,
+        })
+
+    def _add_switches(self, network, bus_ids, levels, names, buses):
+        """
+        Add closed load break switches at a set of buses.
+
+        :param network: The network the elements are added to.
+        :type network: Network
+        :param bus_ids: The id of every bus.
+        :type bus_ids: numpy.ndarray
+        :param levels: The level of every bus.
+        :type levels: numpy.ndarray
+        :param names: The level names, in level order.
+        :type names: list
+        :param buses: The bus row of each switch.
+        :type buses: numpy.ndarray
+        """
+        count = len(buses)
+        network.add_switches({
+            "name": _names("Switch", count),
+            "bus_id": bus_ids[buses],
+            "type": np.full(count, "LBS"),
+            "closed": np.ones(count, dtype=bool),
+            "base_freq": np.full(count, 50.0),
+            "max_ka": self._level_data(LEVELS, "max_ka", names, levels[buses]),
+        })
+
+    @staticmethod
+    def _powers(rng, typical: dict, names: list, levels):
+        """
+        Draw log-normal active powers around the typical power of each level.
+
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param typical: The median power in kW of each level with elements.
+        :type typical: dict
+        :param names: The level names, in level order.
+        :type names: list
+        :param levels: The level of each element.
+        :type levels: numpy.ndarray
+        :return: The active power of each element in kW.
+        :rtype: numpy.ndarray
+        """
+        median = np.array([typical.get(name, 0.0) for name in names])[levels]
+        return median * rng.lognormal(0.0, 0.5, len(levels))
+
+    @staticmethod
+    def _injections(table, profile, rng, times):
+        """
+        Build the injections of the elements of a table from a daily profile.
+
+        :param table: The load or generator table.
+        :type table: ElementTable
+        :param profile: The share of the active power injected at each time step.
+        :type profile: numpy.ndarray
+        :param rng: The random generator.
+        :type rng: numpy.random.Generator
+        :param times: The time of each step in hours.
+        :type times: numpy.ndarray
+        :return: One injection per element.
+        :rtype: list
+        """
+        if len(table) == 0:
+            return []
+        p_kw = np.asarray(table.column("p_kw"), dtype=float)
+        noise = rng.normal(1.0, 0.1, (len(p_kw), len(profile))).clip(0, None)
+        magnitudes = np.round(p_kw[:, None] * profile[None, :] * noise, 3)
+        return [Injection(id, times, row) for id, row in zip(table.column("id").tolist(), magnitudes)]
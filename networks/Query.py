@@ -0,0 +1,226 @@
+# Query Class
+# Vectorized filter expressions over the element tables of a network
+
+import ast
+import operator
+
+import numpy as np
+import pandas as pd
+
+from networks.Validator import BUS_REFERENCES
+
+
+# operators of the expression language and the NumPy operations evaluating them
+_COMPARISONS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda values, options: np.isin(values, options),
+    ast.NotIn: lambda values, options: ~np.isin(values, options),
+}
+
+_ARITHMETIC = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+}
+
+
+class Query:
+    """
+    A filter expression over one element type of a network, evaluated on whole columns.
+
+    The expression is written in Python syntax over the fields of the element type,
+    for example ``"length_km > 5 and max_amp < 300"`` or ``"type in ['ol', 'cs']"``.
+    It may compare and combine fields with ``==``, ``!=``, ``<``, ``<=``, ``>``,
+    ``>=``, ``in``, ``not in``, ``and``, ``or``, ``not``, ``&``, ``|``, ``~`` and
+    arithmetic. A field of a bus the element references is written as the bus id
+    field without ``_id`` followed by the bus field, so ``"bus.zone == 'North'"``
+    selects the loads at buses of zone North and ``"from_bus.vn_kv > 100"`` the
+    lines starting at a bus above 100 kV.
+
+    The expression is parsed once and each evaluation reads the columns of the
+    element table directly, with one vectorized id lookup per joined bus field,
+    without converting the network to DataFrames. Only the constructs above are
+    accepted, so expressions can not run arbitrary code.
+
+    :param element_type: The type of the elements to filter (eg. "line").
+    :type element_type: str
+    :param expr: The filter expression.
+    :type expr: str
+    :raises ValueError: If the expression is not valid or uses an unsupported construct.
+    """
+
+    def __init__(self, element_type: str, expr: str):
+        """
+        Initializes a Query by parsing its expression.
+
+        :param element_type: The type of the elements to filter (eg. "line").
+        :type element_type: str
+        :param expr: The filter expression.
+        :type expr: str
+        :raises ValueError: If the expression is not valid or uses an unsupported construct.
+        """
+        self.element_type = element_type
+        self.expr = expr
+        try:
+            self._tree = ast.parse(expr, mode="eval").body
+        except SyntaxError as error:
+            raise ValueError(f"Invalid query expression {expr!r}: {error.msg}") from None
+        self._check(self._tree)
+
+    def mask(self, network):
+        """
+        Evaluate the expression on a network.
+
+        :param network: The network to filter.
+        :type network: class:`networks.network.Network`
+        :return: For each element of the type, in table order, whether it matches.
+        :rtype: numpy.ndarray
+        :raises KeyError: If the expression uses a field the elements or buses do not have.
+        """
+        table = network.net[self.element_type]
+        result = self._evaluate(self._tree, network, table, {})
+        return np.broadcast_to(np.asarray(result, dtype=bool), (len(table),))
+
+    def ids(self, network):
+        """
+        Get the ids of the matching elements.
+
+        :param network: The network to filter.
+        :type network: class:`networks.network.Network`
+        :return: The ids of the matching elements, in table order.
+        :rtype: numpy.ndarray
+        """
+        table = network.net[self.element_type]
+        if len(table) == 0:
+            return np.empty(0, dtype=np.int64)
+        return table.column("id")[self.mask(network)]
+
+    def frame(self, network):
+        """
+        Get the matching elements as a DataFrame.
+
+        :param network: The network to filter.
+        :type network: class:`networks.network.Network`
+        :return: A DataFrame with one column per field and one row per matching element.
+        :rtype: pandas.DataFrame
+        """
+        table = network.net[self.element_type]
+        if len(table) == 0:
+            return pd.DataFrame([])
+        mask = self.mask(network)
+        return pd.DataFrame({field: table.column(field)[mask] for field in table.fields})
+
+    def _check(self, node):
+        """
+        Reject the parts of an expression the query language does not support.
+
+        :param node: The root of the expression tree.
+        :type node: ast.AST
+        :raises ValueError: If the expression uses an unsupported construct.
+        """
+        for child in ast.walk(node):
+            allowed = (ast.Compare, ast.BoolOp, ast.UnaryOp, ast.BinOp, ast.Name, ast.Attribute, ast.Constant,
+                       ast.List, ast.Tuple, ast.Load, ast.And, ast.Or, ast.Not, ast.Invert, ast.USub)
+            if not isinstance(child, allowed + tuple(_COMPARISONS) + tuple(_ARITHMETIC)):
+                raise ValueError(f"Unsupported construct {type(child).__name__} in query expression {self.expr!r}")
+            if isinstance(child, ast.Attribute) and not isinstance(child.value, ast.Name):
+                raise ValueError(f"Only bus fields such as bus.zone can be joined in query expression {self.expr!r}")
+
+    def _evaluate(self, node, network, table, joined):
+        """
+        Evaluate a node of the expression tree on whole columns.
+
+        :param node: The node to evaluate.
+        :type node: ast.AST
+        :param network: The network to filter.
+        :type network: class:`networks.network.Network`
+        :param table: The element table being filtered.
+        :type table: ElementTable
+        :param joined: The bus rows of each bus reference already looked up.
+        :type joined: dict
+        :return: The values of the node, one per element, or a constant.
+        :rtype: numpy.ndarray or any
+        """
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [self._evaluate(element, network, table, joined) for element in node.elts]
+        if isinstance(node, ast.Name):
+            if len(table) == 0:
+                return np.empty(0)
+            return table.column(node.id)
+        if isinstance(node, ast.Attribute):
+            return self._join(node.value.id, node.attr, network, table, joined)
+        if isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            values = [self._evaluate(value, network, table, joined) for value in node.values]
+            result = values[0]
+            for value in values[1:]:
+                result = combine(result, value)
+            return result
+        if isinstance(node, ast.UnaryOp):
+            operand = self._evaluate(node.operand, network, table, joined)
+            if isinstance(node.op, ast.USub):
+                return -operand
+            return np.logical_not(operand)
+        if isinstance(node, ast.BinOp):
+            left = self._evaluate(node.left, network, table, joined)
+            right = self._evaluate(node.right, network, table, joined)
+            return _ARITHMETIC[type(node.op)](left, right)
+
+        # comparisons may be chained, as in 0 < length_km < 5
+        result = True
+        left = self._evaluate(node.left, network, table, joined)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = self._evaluate(comparator, network, table, joined)
+            result = np.logical_and(result, _COMPARISONS[type(op)](left, right))
+            left = right
+        return result
+
+    def _join(self, reference: str, field: str, network, table, joined):
+        """
+        Read a field of the buses referenced by the elements.
+
+        :param reference: The bus id field without ``_id`` (eg. "bus", "from_bus").
+        :type reference: str
+        :param field: The bus field to read.
+        :type field: str
+        :param network: The network to filter.
+        :type network: class:`networks.network.Network`
+        :param table: The element table being filtered.
+        :type table: ElementTable
+        :param joined: The bus rows of each bus reference already looked up.
+        :type joined: dict
+        :return: The value of the field at the bus of each element, NaN where the bus is missing.
+        :rtype: numpy.ndarray
+        :raises KeyError: If the elements have no such bus reference or the buses no such field.
+        """
+        id_field = f"{reference}_id"
+        if id_field not in BUS_REFERENCES.get(self.element_type, ()):
+            raise KeyError(f"{self.element_type} has no bus reference {id_field}")
+        if len(table) == 0:
+            return np.empty(0)
+
+        buses = network.net["bus"]
+        if reference not in joined:
+            joined[reference] = buses.rows_of(table.column(id_field))
+        rows = joined[reference]
+        if len(buses) == 0:
+            return np.full(len(rows), np.nan)
+
+        values = buses.column(field)[np.maximum(rows, 0)]
+        missing = rows < 0
+        if missing.any():
+            values = values.astype(np.result_type(values.dtype, np.float64) if values.dtype != bool else object)
+            values[missing] = np.nan
+        return values
@@ -26,6 +26,8 @@ class Switch(Element):
     """
 
     _next_id = 1
+    _fields = ("bus_id", "type", "closed", "base_freq", "max_ka")
+    __slots__ = tuple(f"__{field}" for field in _fields)
 
     def __init__(self, name: str, bus_id: int, type: str, closed: bool, base_freq: float, max_ka: float):
         
@@ -47,69 +49,12 @@ class Switch(Element):
         """
         
         super().__init__(name)
-        self.__id = Switch._next_id
         self.__bus_id = bus_id
         self.__type = type
         self.__closed = closed 
         self.__base_freq = base_freq
         self.__max_ka = max_ka
-        
-        Switch._next_id += 1
-
-    def get_property(self, var: str):
-        
-        """
-        Get a property of the generator.
-
-        :param var: The name of the property to retrieve.
-        :type var: str
-        :return: The value of the requested property.
-        :rtype: str or float or bool
-        """
-        if var == "name":
-            return self.get_name()
-        elif var == "bus_id":
-            return self.__bus_id
-        elif var == "type":
-            return self.__type
-        elif var == "closed":
-            return self.__closed
-        elif var == "base_freq":
-            return self.__base_freq
-        elif var == "max_ka":
-            return self.__max_ka
-        elif var == "id":
-            return self.__id
-        else:
-            return "Not a valid variable for this element"
 
-    def set_property(self, var: str, new):
-        
-        """
-        Set a property of the generator.
-
-        :param var: The name of the property to set.
-        :type var: str
-        :param new: The new value for the property.
-        :type new: str or float or bool
-        :return: A message indicating the success or failure of the operation.
-        :rtype: str
-        """
-        if var == "name":
-            self.set_name(new)
-        elif var == "bus_id":
-            self.__bus_id = new
-        elif var == "type":
-            self.__type = new
-        elif var == "closed":
-            self.__closed = new
-        elif var == "base_freq":
-            self.__base_freq = new
-        elif var == "max_ka":
-            self.__max_ka = new
-        else:
-            return "Not a valid variable for this element"
-        
     def to_dict(self):
         """
         Convert switch attributes to a dictionary.
@@ -119,7 +64,7 @@ class Switch(Element):
         """
         return {
             "name": self.get_name(),
-            "id": self.__id,
+            "id": self.get_id(),
             "bus_id": self.__bus_id,
             "type": self.__type,
             "closed": self.__closed,
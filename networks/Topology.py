@@ -0,0 +1,268 @@
+# Topology Class
+# Sparse bus adjacency built from the branch elements of a network
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+# branch element types and the pairs of bus id fields they connect
+BRANCH_TERMINALS = {
+    "line": (("from_bus_id", "to_bus_id"),),
+    "transformer": (("hv_bus_id", "lv_bus_id"),),
+    "impedence": (("from_bus_id", "to_bus_id"),),
+    "threewindingtransformer": (("hv_bus_id", "mv_bus_id"), ("hv_bus_id", "lv_bus_id"), ("mv_bus_id", "lv_bus_id")),
+}
+
+BRANCH_TYPES = tuple(BRANCH_TERMINALS)
+
+
+class Topology:
+    """
+    A compressed sparse row (CSR) adjacency structure of the buses in a network.
+
+    Nodes are the rows of the network's bus table. Every line, transformer and
+    impedence adds an edge in both directions between the buses it connects, and a
+    three-winding transformer adds one edge for each pair of its windings. Branches
+    that reference a bus missing from the network are left out.
+
+    The structure is compiled lazily on first use and recompiled only when the bus
+    table or one of the branch tables has changed since the last compilation, so
+    neighbour, degree and incidence queries cost O(degree).
+
+    :param network: The network whose topology is indexed.
+    :type network: class:`networks.network.Network`
+    """
+
+    def __init__(self, network):
+        """
+        Initializes a Topology for a network without compiling it yet.
+
+        :param network: The network whose topology is indexed.
+        :type network: class:`networks.network.Network`
+        """
+        self.network = network
+        self._state = None
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.empty(0, dtype=np.int64)
+        self._edge_types = np.empty(0, dtype=np.int8)
+        self._edge_ids = np.empty(0, dtype=np.int64)
+
+    @property
+    def indptr(self):
+        """
+        Get the CSR row pointer array; the neighbours of node i are ``indices[indptr[i]:indptr[i + 1]]``.
+
+        :return: The row pointer array of length number of buses + 1.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        return self._indptr
+
+    @property
+    def indices(self):
+        """
+        Get the CSR column index array holding the neighbouring node of every edge.
+
+        :return: The column index array.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        return self._indices
+
+    @property
+    def edge_sources(self):
+        """
+        Get the source node of every edge, aligned with :attr:`indices`.
+
+        :return: The source node array.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        return np.repeat(np.arange(len(self._indptr) - 1), np.diff(self._indptr))
+
+    @property
+    def edge_types(self):
+        """
+        Get the branch type of every edge as a position in ``BRANCH_TYPES``, aligned with :attr:`indices`.
+
+        :return: The branch type code array.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        return self._edge_types
+
+    @property
+    def edge_ids(self):
+        """
+        Get the id of the branch element of every edge, aligned with :attr:`indices`.
+
+        :return: The branch id array.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        return self._edge_ids
+
+    @property
+    def num_buses(self):
+        """
+        Get the number of nodes in the adjacency structure.
+
+        :return: The number of buses.
+        :rtype: int
+        """
+        self._ensure_built()
+        return len(self._indptr) - 1
+
+    @property
+    def num_edges(self):
+        """
+        Get the number of directed edges stored, twice the number of bus pairs connected.
+
+        :return: The number of directed edges.
+        :rtype: int
+        """
+        self._ensure_built()
+        return len(self._indices)
+
+    def bus_ids(self, nodes=None):
+        """
+        Get the bus ids of nodes of the adjacency structure.
+
+        :param nodes: The nodes to convert, defaults to all nodes
+        :type nodes: array_like, optional
+        :return: The bus id of each node.
+        :rtype: numpy.ndarray
+        """
+        self._ensure_built()
+        if self.num_buses == 0:
+            return np.empty(0, dtype=np.int64)
+        ids = self.network.net["bus"].column("id")
+        return ids if nodes is None else ids[np.asarray(nodes, dtype=np.int64)]
+
+    def node_of(self, bus_id: int):
+        """
+        Get the node of the adjacency structure that represents a bus.
+
+        :param bus_id: The id of the bus.
+        :type bus_id: int
+        :return: The node of the bus.
+        :rtype: int
+        :raises KeyError: If the network has no bus with this id.
+        """
+        return self.network.net["bus"].row_of(bus_id)
+
+    def neighbors(self, bus_id: int):
+        """
+        Get the buses directly connected to a bus by a branch.
+
+        :param bus_id: The id of the bus.
+        :type bus_id: int
+        :return: The ids of the neighbouring buses, without duplicates.
+        :rtype: numpy.ndarray
+        """
+        start, stop = self._span(bus_id)
+        nodes = self._indices[start:stop]
+        _, first = np.unique(nodes, return_index=True)
+        return self.bus_ids(nodes[np.sort(first)])
+
+    def degree(self, bus_id: int):
+        """
+        Get the number of branch connections at a bus, counting parallel branches separately.
+
+        :param bus_id: The id of the bus.
+        :type bus_id: int
+        :return: The degree of the bus.
+        :rtype: int
+        """
+        start, stop = self._span(bus_id)
+        return int(stop - start)
+
+    def incident_branches(self, bus_id: int):
+        """
+        Get the branch elements connected to a bus.
+
+        :param bus_id: The id of the bus.
+        :type bus_id: int
+        :return: A list of (element type, element id) tuples, each branch listed once.
+        :rtype: list
+        """
+        start, stop = self._span(bus_id)
+        branches = zip(self._edge_types[start:stop].tolist(), self._edge_ids[start:stop].tolist())
+        return list(dict.fromkeys((BRANCH_TYPES[code], id) for code, id in branches))
+
+    def to_csr_matrix(self):
+        """
+        Get the adjacency structure as a SciPy sparse matrix for use by solvers.
+
+        :return: A square matrix whose entry (i, j) counts the branches between nodes i and j.
+        :rtype: scipy.sparse.csr_matrix
+        """
+        self._ensure_built()
+        data = np.ones(len(self._indices), dtype=np.int64)
+        n = self.num_buses
+        return csr_matrix((data, self._indices, self._indptr), shape=(n, n))
+
+    def _span(self, bus_id: int):
+        """
+        Get the range of the edge arrays holding the edges of a bus.
+
+        :param bus_id: The id of the bus.
+        :type bus_id: int
+        :return: The start and stop positions in the edge arrays.
+        :rtype: tuple
+        """
+        self._ensure_built()
+        node = self.node_of(bus_id)
+        return self._indptr[node], self._indptr[node + 1]
+
+    def _ensure_built(self):
+        """
+        Compile the adjacency structure if the bus or branch tables changed since the last compilation.
+        """
+        tables = [self.network.net[element_type] for element_type in ("bus",) + BRANCH_TYPES]
+        state = tuple((id(table), table.version) for table in tables)
+        if state != self._state:
+            self._build()
+            self._state = state
+
+    def _build(self):
+        """
+        Compile the CSR arrays from the bus and branch tables.
+        """
+        buses = self.network.net["bus"]
+        sources, targets, types, ids = [], [], [], []
+
+        for code, element_type in enumerate(BRANCH_TYPES):
+            table = self.network.net[element_type]
+            if len(table) == 0:
+                continue
+            element_ids = table.column("id")
+            for from_field, to_field in BRANCH_TERMINALS[element_type]:
+                if from_field not in table.fields or to_field not in table.fields:
+                    continue
+                from_nodes = buses.rows_of(table.column(from_field))
+                to_nodes = buses.rows_of(table.column(to_field))
+                connected = (from_nodes >= 0) & (to_nodes >= 0)
+                from_nodes, to_nodes = from_nodes[connected], to_nodes[connected]
+
+                # store each edge in both directions
+                sources += [from_nodes, to_nodes]
+                targets += [to_nodes, from_nodes]
+                types.append(np.full(2 * len(from_nodes), code, dtype=np.int8))
+                ids += [element_ids[connected], element_ids[connected]]
+
+        n = len(buses)
+        if sources:
+            sources = np.concatenate(sources)
+            order = np.argsort(sources, kind="stable")
+            self._indices = np.concatenate(targets)[order]
+            self._edge_types = np.concatenate(types)[order]
+            self._edge_ids = np.concatenate(ids)[order]
+        else:
+            sources = np.empty(0, dtype=np.int64)
+            self._indices = np.empty(0, dtype=np.int64)
+            self._edge_types = np.empty(0, dtype=np.int8)
+            self._edge_ids = np.empty(0, dtype=np.int64)
+
+        self._indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=self._indptr[1:])
@@ -0,0 +1,324 @@
+# Validator Class
+# Vectorized referential and electrical consistency checks of a network
+
+import numpy as np
+import pandas as pd
+
+
+# element types and the fields holding the id of a bus
+BUS_REFERENCES = {
+    "line": ("from_bus_id", "to_bus_id"),
+    "load": ("bus_id",),
+    "transformer": ("hv_bus_id", "lv_bus_id"),
+    "generator": ("bus_id",),
+    "impedence": ("from_bus_id", "to_bus_id"),
+    "storage": ("bus_id",),
+    "switch": ("bus_id",),
+    "threewindingtransformer": ("hv_bus_id", "mv_bus_id", "lv_bus_id"),
+}
+
+# element types and the pairs of (rated voltage field, bus id field) of their windings
+WINDING_VOLTAGES = {
+    "transformer": (("hv_kv", "hv_bus_id"), ("lv_kv", "lv_bus_id")),
+    "threewindingtransformer": (("hv_kv", "hv_bus_id"), ("mv_kv", "mv_bus_id"), ("lv_kv", "lv_bus_id")),
+}
+
+# element types and the pairs of (lower, upper) fields that must be ordered
+ORDERED_LIMITS = {
+    "bus": (("min_vm_pu", "max_vm_pu"),),
+    "load": (("min_p_kw", "max_p_kw"), ("min_q_kvar", "max_q_kvar")),
+    "generator": (("min_p_kw", "max_p_kw"), ("min_q_kvar", "max_q_kvar")),
+    "storage": (("min_e_kwh", "max_e_kwh"),),
+    "transformer": (("lv_kv", "hv_kv"), ("tap_min", "tap_max")),
+    "threewindingtransformer": (("mv_kv", "hv_kv"), ("lv_kv", "mv_kv"), ("tap_min", "tap_max")),
+}
+
+# element types and the pairs of bus id fields that must differ
+DISTINCT_BUSES = {
+    "line": (("from_bus_id", "to_bus_id"),),
+    "transformer": (("hv_bus_id", "lv_bus_id"),),
+    "impedence": (("from_bus_id", "to_bus_id"),),
+}
+
+ERROR = "error"
+WARNING = "warning"
+
+
+class ValidationReport:
+    """
+    The result of validating a network: a list of issues, each found by one rule.
+
+    Each issue is a dictionary with the keys ``rule``, ``severity`` ("error" or
+    "warning"), ``element_type``, ``field``, ``ids`` (an array of the offending
+    element ids) and ``message``.
+
+    :param issues: The issues found, defaults to no issues
+    :type issues: list, optional
+    """
+
+    def __init__(self, issues=None):
+        """
+        Initializes a ValidationReport.
+
+        :param issues: The issues found, defaults to no issues
+        :type issues: list, optional
+        """
+        self.issues = list(issues or [])
+
+    def __bool__(self):
+        """
+        A report is true when it holds no errors, so ``if net.validate():`` reads naturally.
+
+        :return: True if no issue is an error.
+        :rtype: bool
+        """
+        return self.is_valid
+
+    def __len__(self):
+        """
+        Get the number of issues.
+
+        :return: The number of issues.
+        :rtype: int
+        """
+        return len(self.issues)
+
+    def __iter__(self):
+        """
+        Iterate over the issues.
+
+        :return: An iterator over the issue dictionaries.
+        :rtype: iterator
+        """
+        return iter(self.issues)
+
+    def __repr__(self):
+        """
+        Get a short summary of the report.
+
+        :return: The number of errors and warnings.
+        :rtype: str
+        """
+        return f"ValidationReport(errors={len(self.errors)}, warnings={len(self.warnings)})"
+
+    @property
+    def is_valid(self):
+        """
+        Check that the network has no errors; warnings are allowed.
+
+        :return: True if no issue is an error.
+        :rtype: bool
+        """
+        return not self.errors
+
+    @property
+    def errors(self):
+        """
+        Get the issues that make the network unusable.
+
+        :return: The issues with severity "error".
+        :rtype: list
+        """
+        return [issue for issue in self.issues if issue["severity"] == ERROR]
+
+    @property
+    def warnings(self):
+        """
+        Get the issues that are suspicious but do not prevent using the network.
+
+        :return: The issues with severity "warning".
+        :rtype: list
+        """
+        return [issue for issue in self.issues if issue["severity"] == WARNING]
+
+    def to_dataframe(self):
+        """
+        Convert the report to a DataFrame with one row per offending element and rule.
+
+        :return: A DataFrame with the columns rule, severity, element_type, field, id and message.
+        :rtype: pandas.DataFrame
+        """
+        columns = ["rule", "severity", "element_type", "field", "id", "message"]
+        frames = [pd.DataFrame({"rule": issue["rule"], "severity": issue["severity"], "element_type": issue["element_type"],
+                                "field": issue["field"], "id": issue["ids"], "message": issue["message"]}, columns=columns)
+                  for issue in self.issues]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+
+
+class Validator:
+    """
+    Checks the referential and electrical consistency of a network.
+
+    Every rule is evaluated on whole columns at once, so validating a network costs
+    a few array operations per rule regardless of the number of elements. The rules are:
+
+    - ``dangling_bus``: a line, load, transformer, generator, impedence, storage,
+      switch or three-winding transformer references a bus missing from the network (error).
+    - ``same_bus``: a line, transformer or impedence connects a bus to itself (error).
+    - ``voltage_mismatch``: the rated voltage of a transformer winding differs from
+      the nominal voltage of its bus by more than the tolerance (warning).
+    - ``limit_order``: a lower limit is above its upper limit, such as ``min_vm_pu``
+      above ``max_vm_pu`` or ``lv_kv`` above ``hv_kv`` (error).
+
+    Fields missing from a table are skipped, and the voltage and limit rules are not
+    applied to missing (NaN) values; a missing bus reference is a dangling one.
+
+    :param network: The network to validate.
+    :type network: class:`networks.network.Network`
+    :param kv_tolerance: The allowed relative difference between a winding's rated
+        voltage and its bus voltage, defaults to 0.1
+    :type kv_tolerance: float, optional
+    """
+
+    def __init__(self, network, kv_tolerance: float = 0.1):
+        """
+        Initializes a Validator for a network.
+
+        :param network: The network to validate.
+        :type network: class:`networks.network.Network`
+        :param kv_tolerance: The allowed relative difference between a winding's rated
+            voltage and its bus voltage, defaults to 0.1
+        :type kv_tolerance: float, optional
+        """
+        self.network = network
+        self.kv_tolerance = kv_tolerance
+
+    def validate(self):
+        """
+        Run every rule on the network.
+
+        :return: The issues found.
+        :rtype: ValidationReport
+        """
+        issues = []
+        issues += self._check_bus_references()
+        issues += self._check_distinct_buses()
+        issues += self._check_winding_voltages()
+        issues += self._check_limits()
+        return ValidationReport(issues)
+
+    def _check_bus_references(self):
+        """
+        Find elements referencing buses missing from the network.
+
+        :return: The issues found.
+        :rtype: list
+        """
+        buses = self.network.net["bus"]
+        issues = []
+        for element_type, fields in BUS_REFERENCES.items():
+            table = self.network.net[element_type]
+            for field in fields:
+                if not self._has(table, field):
+                    continue
+                dangling = buses.rows_of(table.column(field)) < 0
+                if dangling.any():
+                    issues.append(self._issue("dangling_bus", ERROR, element_type, field, table, dangling,
+                                              f"{element_type} {field} references a bus missing from the network"))
+        return issues
+
+    def _check_distinct_buses(self):
+        """
+        Find branches connecting a bus to itself.
+
+        :return: The issues found.
+        :rtype: list
+        """
+        issues = []
+        for element_type, pairs in DISTINCT_BUSES.items():
+            table = self.network.net[element_type]
+            for from_field, to_field in pairs:
+                if not self._has(table, from_field, to_field):
+                    continue
+                same = table.column(from_field) == table.column(to_field)
+                if same.any():
+                    issues.append(self._issue("same_bus", ERROR, element_type, to_field, table, same,
+                                              f"{element_type} {from_field} and {to_field} are the same bus"))
+        return issues
+
+    def _check_winding_voltages(self):
+        """
+        Find transformer windings whose rated voltage does not match the voltage of their bus.
+
+        :return: The issues found.
+        :rtype: list
+        """
+        buses = self.network.net["bus"]
+        if "vn_kv" not in buses.fields:
+            return []
+        vn_kv = np.asarray(buses.column("vn_kv"), dtype=float)
+
+        issues = []
+        for element_type, windings in WINDING_VOLTAGES.items():
+            table = self.network.net[element_type]
+            for kv_field, bus_field in windings:
+                if not self._has(table, kv_field, bus_field):
+                    continue
+                rows = buses.rows_of(table.column(bus_field))
+                rated = np.asarray(table.column(kv_field), dtype=float)
+                nominal = np.where(rows >= 0, vn_kv[rows], np.nan)
+                with np.errstate(invalid="ignore"):
+                    mismatch = np.abs(rated - nominal) > self.kv_tolerance * np.abs(nominal)
+                if mismatch.any():
+                    issues.append(self._issue("voltage_mismatch", WARNING, element_type, kv_field, table, mismatch,
+                                              f"{element_type} {kv_field} differs from the vn_kv of bus {bus_field}"))
+        return issues
+
+    def _check_limits(self):
+        """
+        Find elements whose lower limit is above their upper limit.
+
+        :return: The issues found.
+        :rtype: list
+        """
+        issues = []
+        for element_type, pairs in ORDERED_LIMITS.items():
+            table = self.network.net[element_type]
+            for lower_field, upper_field in pairs:
+                if not self._has(table, lower_field, upper_field):
+                    continue
+                lower = np.asarray(table.column(lower_field), dtype=float)
+                upper = np.asarray(table.column(upper_field), dtype=float)
+                with np.errstate(invalid="ignore"):
+                    inverted = lower > upper
+                if inverted.any():
+                    issues.append(self._issue("limit_order", ERROR, element_type, lower_field, table, inverted,
+                                              f"{element_type} {lower_field} is above {upper_field}"))
+        return issues
+
+    @staticmethod
+    def _has(table, *fields):
+        """
+        Check that a table holds elements and stores every one of the fields.
+
+        :param table: The element table.
+        :type table: ElementTable
+        :return: True if the rule over the fields can be evaluated on the table.
+        :rtype: bool
+        """
+        return len(table) > 0 and all(field in table.fields for field in fields)
+
+    @staticmethod
+    def _issue(rule, severity, element_type, field, table, mask, message):
+        """
+        Build the issue for the elements of a table selected by a mask.
+
+        :param rule: The name of the rule.
+        :type rule: str
+        :param severity: "error" or "warning".
+        :type severity: str
+        :param element_type: The type of the offending elements.
+        :type element_type: str
+        :param field: The field the rule found at fault.
+        :type field: str
+        :param table: The table of the offending elements.
+        :type table: ElementTable
+        :param mask: True for each offending element of the table.
+        :type mask: numpy.ndarray
+        :param message: A description of the issue.
+        :type message: str
+        :return: The issue dictionary.
+        :rtype: dict
+        """
+        return {"rule": rule, "severity": severity, "element_type": element_type, "field": field,
+                "ids": table.column("id")[mask], "message": message}
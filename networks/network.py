@@ -1,8 +1,18 @@
 import pandas as pd
+import numpy as np
+import inspect
 import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 
 
 from networks.Element import Element
+from networks.ElementTable import ElementTable
+from networks.ElementView import ElementView
+from networks.IdAllocator import IdAllocator
 from networks.Bus import Bus
 from networks.Line import Line
 from networks.Load import Load
@@ -12,124 +22,935 @@ from networks.Impedence import Impedence
 from networks.Storage import Storage
 from networks.Switch import Switch
 from networks.ThreeWindingTransformer import ThreeWindingTransformer
+from networks.Topology import Topology
+from networks.Islands import IslandDetector
+from networks.Validator import Validator, BUS_REFERENCES
+from networks.Query import Query
+from networks.NetworkEvent import NetworkEvent
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet files are optional
+    pa = pq = None
+
+
+# element class stored in each table of the network
+ELEMENT_CLASSES = {
+    "bus": Bus,
+    "line": Line,
+    "load": Load,
+    "transformer": Transformer,
+    "generator": Generator,
+    "impedence": Impedence,
+    "storage": Storage,
+    "switch": Switch,
+    "threewindingtransformer": ThreeWindingTransformer
+}
+
+# dtype used to parse the CSV columns annotated with each type in the element constructors
+_CSV_TYPES = {str: object, int: np.int64, bool: bool}
+
+# declared dtype of the CSV columns of each element type. Float columns are left to
+# the parser, which keeps integer-valued ones such as tap positions as integers, and
+# phases is written both as letters and as a number of phases.
+CSV_DTYPES = {
+    element_type: {name: _CSV_TYPES[parameter.annotation]
+                   for name, parameter in inspect.signature(element_class.__init__).parameters.items()
+                   if parameter.annotation in _CSV_TYPES and name != "phases"}
+    for element_type, element_class in ELEMENT_CLASSES.items()
+}
+
+
+def _require_pyarrow(method: str):
+    """Check that pyarrow is installed before reading or writing Parquet files.
+
+    :param method: The name of the method requiring pyarrow.
+    :type method: str
+    :raises ImportError: If pyarrow is not installed.
+    """
+    if pq is None:
+        raise ImportError(f"Network.{method} requires pyarrow, install it with: pip install pyarrow")
+
+
+def _to_arrow(values):
+    """Convert a column of an element table to an Arrow array.
+
+    Object columns mixing strings with other values, such as line phases read
+    as 3 and "abc", have no single Arrow type, so their values are written as
+    JSON strings and decoded by :func:`_from_arrow`.
+
+    :param values: The values of the column.
+    :type values: numpy.ndarray
+    :return: The array, and whether its values are encoded as JSON.
+    :rtype: tuple[pyarrow.Array, bool]
+    """
+    if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) not in ("string", "empty"):
+        encoded = [None if missing else json.dumps(value, default=lambda value: value.item())
+                   for value, missing in zip(values, pd.isna(values))]
+        return pa.array(encoded, type=pa.string()), True
+    # from_pandas stores NaN in object and float columns as missing values
+    return pa.array(values, from_pandas=True), False
+
+
+def _from_arrow(column, encoded: bool = False):
+    """Convert a column read from a Parquet file to the NumPy array stored in an element table.
+
+    :param column: The column.
+    :type column: pyarrow.ChunkedArray
+    :param encoded: Whether the values were encoded as JSON by :func:`_to_arrow`, defaults to False
+    :type encoded: bool, optional
+    :return: The values, with NaN for missing values.
+    :rtype: numpy.ndarray
+    """
+    values = column.to_numpy()
+    if values.dtype == object:
+        missing = pd.isna(values)
+        if encoded:
+            decoded = np.full(len(values), np.nan, dtype=object)
+            decoded[~missing] = [json.loads(value) for value in values[~missing]]
+            return decoded
+        values = np.where(missing, np.nan, values)
+    return values
+
+
+def _chunk_dtypes(file_path, columns, chunksize: int):
+    """Find the dtypes that parse CSV columns read in chunks as if the whole file was read at once.
+
+    The parser infers the type of each chunk on its own, so a column holding 3 in
+    one chunk and "abc" in another would be read as the number 3 and the string
+    "abc", where the whole file gives the strings "3" and "abc".
+
+    :param file_path: The path of the CSV file.
+    :type file_path: str
+    :param columns: The columns whose dtype is inferred by the parser.
+    :type columns: list
+    :param chunksize: The number of rows read at a time.
+    :type chunksize: int
+    :return: The dtype of each column inferred with different types in different chunks.
+    :rtype: dict
+    """
+    found = {}
+    for df in pd.read_csv(file_path, usecols=lambda column: column in columns, chunksize=chunksize):
+        for column, dtype in df.dtypes.items():
+            found.setdefault(column, set()).add(dtype)
+    return {column: np.float64 if all(dtype.kind in "if" for dtype in kinds) else object
+            for column, kinds in found.items() if len(kinds) > 1}
+
+
+# name of the file describing the columns of a network saved with Network.save_memmap
+MEMMAP_MANIFEST = "manifest.json"
+
+# version of the layout written by Network.save_memmap
+MEMMAP_VERSION = 1
 
 
-# Marko: IDs are currently unique across all networks (eg. if network 1 has lines
-# with IDs 1, 2, 3, network 2's lines would start numbering at 4). Is this useful
-# so that elements can be easily moved between networks, or should each network
-# have IDs starting at 1 for each element type?
 class Network:
     """
     A class to represent a network of power system elements.
+
+    Each network numbers its elements with its own id allocator per element type,
+    so ids start at 1 for each element type in every network. Elements added to the
+    network are given the next id of their type, replacing the id they were created
+    with.
+
+    :param id_allocators: Allocators to use for some element types, for example
+        ranges reserved with :meth:`reserve_ids` for a worker process, defaults to None
+    :type id_allocators: dict, optional
     """
-    def __init__(self):
+    def __init__(self, id_allocators=None):
         """
-        Initialize the network as a dictionary composed of empty lists for each type of element.
+        Initialize the network as a dictionary composed of an empty columnar
+        :class:`ElementTable` for each type of element.
+
+        :param id_allocators: Allocators to use for some element types, defaults to None
+        :type id_allocators: dict, optional
         """
         self.net = {
-            "bus": [],
-            "line": [],
-            "load": [],
-            "transformer": [],
-            "generator": [],
-            "impedence": [],
-            "storage": [],
-            "switch": [],
-            "threewindingtransformer": []
+            "bus": ElementTable(),
+            "line": ElementTable(),
+            "load": ElementTable(),
+            "transformer": ElementTable(),
+            "generator": ElementTable(),
+            "impedence": ElementTable(),
+            "storage": ElementTable(),
+            "switch": ElementTable(),
+            "threewindingtransformer": ElementTable()
         }
+        self._id_allocators = {element_type: IdAllocator() for element_type in self.net}
+        self._id_allocators.update(id_allocators or {})
+        self._topology = Topology(self)
+        self._island_detector = IslandDetector(self)
+        self._subscribers = {}
+        self._batch_depth = 0
+        self._pending_events = []
+        for element_type, table in self.net.items():
+            self._set_table(element_type, table)
+
     def add_bus(self, Bus):
         """Add a Bus element to the network.
 
         :param Bus: an instance of the Bus class
         :type Bus: Bus
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["bus"].append(Bus.to_dict())
+        return self._add_element("bus", Bus)
 
     def add_line(self, Line):
         """Add a Line element to the network.
 
         :param Line: an instance of the Line class
         :type Line: Line
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["line"].append(Line.to_dict())
+        return self._add_element("line", Line)
 
     def add_load(self, Load):
         """Add a Load element to the network.
 
         :param Load: an instance of the Load class
         :type Load: Load
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["load"].append(Load.to_dict())
+        return self._add_element("load", Load)
 
     def add_transformer(self, Transformer):
         """Add a Transformer element to the network.
 
         :param Transformer: an instance of the Transformer class
         :type Transformer: Transformer
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["transformer"].append(Transformer.to_dict())
+        return self._add_element("transformer", Transformer)
 
     def add_generator(self, Generator):
         """Add a Generator element to the network.
 
         :param Generator: an instance of the Generator class
         :type Generator: Generator
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["generator"].append(Generator.to_dict())
+        return self._add_element("generator", Generator)
 
     def add_impedence(self, Impedence):
         """Add a Impedence element to the network.
 
         :param Impedence: an instance of the Impedence class
         :type Impedence: Impedence
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["impedence"].append(Impedence.to_dict())
+        return self._add_element("impedence", Impedence)
 
     def add_storage(self, Storage):
         """Add a Storage element to the network.
 
         :param Storage: an instance of the Storage class
         :type Storage: Storage
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["storage"].append(Storage.to_dict())
+        return self._add_element("storage", Storage)
 
     def add_switch(self, Switch):
         """Add a Switch element to the network.
 
         :param Switch: an instance of the Switch class
         :type Switch: Switch
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
         """
-        self.net["switch"].append(Switch.to_dict())
+        return self._add_element("switch", Switch)
 
     def add_threewindingtransformer(self, ThreeWindingTransformer):
         """Add a ThreeWindingTransformerh element to the network.
 
         :param ThreeWindingTransformer: an instance of the ThreeWindingTransformer class
         :type ThreeWindingTransformer: ThreeWindingTransformer
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
+        """
+        return self._add_element("threewindingtransformer", ThreeWindingTransformer)
+
+    def add_buses(self, data):
+        """Add many Bus elements to the network in one step.
+
+        :param data: One column per argument of the Bus class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("bus", data)
+
+    def add_lines(self, data):
+        """Add many Line elements to the network in one step.
+
+        :param data: One column per argument of the Line class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("line", data)
+
+    def add_loads(self, data):
+        """Add many Load elements to the network in one step.
+
+        :param data: One column per argument of the Load class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("load", data)
+
+    def add_transformers(self, data):
+        """Add many Transformer elements to the network in one step.
+
+        :param data: One column per argument of the Transformer class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
         """
-        self.net["threewindingtransformer"].append(ThreeWindingTransformer.to_dict())
+        return self._add_elements("transformer", data)
 
-    # NEXT STEPS: remove_element functions
+    def add_generators(self, data):
+        """Add many Generator elements to the network in one step.
+
+        :param data: One column per argument of the Generator class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("generator", data)
+
+    def add_impedences(self, data):
+        """Add many Impedence elements to the network in one step.
+
+        :param data: One column per argument of the Impedence class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("impedence", data)
+
+    def add_storages(self, data):
+        """Add many Storage elements to the network in one step.
+
+        :param data: One column per argument of the Storage class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("storage", data)
+
+    def add_switches(self, data):
+        """Add many Switch elements to the network in one step.
+
+        :param data: One column per argument of the Switch class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("switch", data)
+
+    def add_threewindingtransformers(self, data):
+        """Add many ThreeWindingTransformer elements to the network in one step.
+
+        :param data: One column per argument of the ThreeWindingTransformer class, as a DataFrame
+            or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids assigned to the new elements.
+        :rtype: numpy.ndarray
+        """
+        return self._add_elements("threewindingtransformer", data)
+
+    def _add_element(self, element_type: str, element):
+        """Give an element the next id of its type in this network and add it.
+
+        The network stores the values of the element, so later changes to the
+        element object are not seen by the network; the returned view reads and
+        writes the stored values instead.
+
+        :param element_type: The type of the element (eg. "bus", "line").
+        :type element_type: str
+        :param element: The element to add.
+        :type element: Element
+        :return: A live view of the element stored in the network.
+        :rtype: ElementView
+        """
+        id = self._allocate_ids(element_type)
+        element._set_id(id)
+        self.net[element_type].append_values(element._field_names, element._field_values(element))
+        return ElementView(self, element_type, id)
+
+    def _allocate_ids(self, element_type: str, count: int = 1):
+        """Allocate a block of ids for one element type.
+
+        The block always starts after the highest id already stored, so elements
+        appended with their own ids are never given a duplicate.
+
+        :param element_type: The type of the elements (eg. "bus", "line").
+        :type element_type: str
+        :param count: The number of ids to allocate, defaults to 1
+        :type count: int, optional
+        :return: The first id of the block.
+        :rtype: int
+        """
+        max_id = self.net[element_type].max_id
+        return self._id_allocators[element_type].allocate(count, None if max_id is None else int(max_id) + 1)
+
+    def reserve_ids(self, counts: dict):
+        """Reserve blocks of ids for networks built elsewhere, eg. in worker processes.
+
+        A network created with the returned allocators numbers its elements within
+        the reserved blocks, so it can later be merged into this network with
+        :meth:`merge` without renumbering.
+
+        :param counts: The number of ids to reserve for each element type.
+        :type counts: dict
+        :return: An allocator limited to the reserved block for each element type.
+        :rtype: dict
+        """
+        allocators = {}
+        for element_type, count in counts.items():
+            first = self._allocate_ids(element_type, count)
+            allocators[element_type] = IdAllocator(first, first + count)
+        return allocators
+
+    def _shared_allocators(self):
+        """Get the id allocators of this network, for networks derived from it to share.
+
+        The allocators are first moved past every id in use, since they only skip
+        the ids stored in the network allocating from them.
+
+        :return: The allocator of each element type.
+        :rtype: dict
+        """
+        for element_type in self.net:
+            self._allocate_ids(element_type, 0)
+        return self._id_allocators
+
+    def merge(self, other):
+        """Add every element of another network to this network, keeping their ids.
+
+        :param other: The network to merge, usually built with allocators from :meth:`reserve_ids`.
+        :type other: Network
+        :raises ValueError: If an element of the other network has an id already used in this network.
+        """
+        for element_type, table in other.net.items():
+            self.net[element_type].extend({field: table.column(field) for field in table.fields})
+
+    def _add_elements(self, element_type: str, data):
+        """Add many elements of one type from whole columns.
+
+        The elements receive a contiguous block of ids from the allocator of their
+        element type, exactly as if they had been added one by one. If the data has
+        an ``id`` column, as in saved networks, the elements keep these ids instead
+        and the ids allocated afterwards start after the highest one.
+
+        :param element_type: The type of the elements (eg. "bus", "line").
+        :type element_type: str
+        :param data: One column per argument of the element class, and optionally an
+            ``id`` column, as a DataFrame or a dictionary of equal-length arrays
+        :type data: pandas.DataFrame or dict
+        :return: The ids of the new elements.
+        :rtype: numpy.ndarray
+        :raises ValueError: If columns are missing, unknown or of different lengths,
+            or if an id is missing or already used in the network.
+        """
+        element_class = ELEMENT_CLASSES[element_type]
+        fields = list(inspect.signature(element_class.__init__).parameters)[1:]
+
+        missing = [field for field in fields if field not in data]
+        unknown = [field for field in data if field not in fields and field != "id"]
+        if missing or unknown:
+            raise ValueError(f"Invalid {element_type} columns, missing: {missing}, unknown: {unknown}")
+
+        columns = {field: np.asarray(data[field]) for field in fields}
+        count = len(columns[fields[0]])
+        if any(len(values) != count for values in columns.values()):
+            raise ValueError("All columns must have the same length")
+
+        if "id" in data:
+            ids = np.asarray(data["id"])
+            if len(ids) != count:
+                raise ValueError("All columns must have the same length")
+            missing_ids = pd.isna(ids)
+            if missing_ids.any():
+                raise ValueError(f"Invalid {element_type} ids, missing at rows: {np.flatnonzero(missing_ids).tolist()}")
+            ids = ids.astype(np.int64)
+        else:
+            first = self._allocate_ids(element_type, count)
+            ids = np.arange(first, first + count, dtype=np.int64)
+
+        # same field order as the to_dict methods of the element classes
+        records = {fields[0]: columns[fields[0]], "id": ids}
+        records.update((field, columns[field]) for field in fields[1:])
+        self.net[element_type].extend(records)
+        return ids
+
+    def get_element(self, element_type: str, id: int):
+        """Get an element of the network by its id.
+
+        :param element_type: The type of the element (eg. "bus", "line").
+        :type element_type: str
+        :param id: The id of the element.
+        :type id: int
+        :return: The element as a dictionary.
+        :rtype: dict
+        :raises KeyError: If the network has no element of this type with this id.
+        """
+        return self.net[element_type].get(id)
+
+    def view(self, element_type: str, id: int):
+        """Get a live view of an element of the network, which reads and writes
+        the element in place.
+
+        :param element_type: The type of the element (eg. "bus", "line").
+        :type element_type: str
+        :param id: The id of the element.
+        :type id: int
+        :return: A view of the element.
+        :rtype: ElementView
+        :raises KeyError: If the network has no element of this type with this id.
+        """
+        self.net[element_type].row_of(id)
+        return ElementView(self, element_type, id)
+
+    def find_by_name(self, element_type: str, name: str):
+        """Find the elements of the network with a given name.
+
+        :param element_type: The type of the elements (eg. "bus", "line").
+        :type element_type: str
+        :param name: The name of the elements.
+        :type name: str
+        :return: The matching elements as dictionaries, empty if there is no match.
+        :rtype: list
+        """
+        table = self.net[element_type]
+        return [table[row] for row in table.rows_named(name)]
+
+    def fork(self):
+        """Create a copy-on-write snapshot of the network.
+
+        The snapshot shares the storage of every element type with this network.
+        An element type is only copied, in the snapshot or in this network, when it
+        is first modified, so variants that change a few elements cost little memory.
+
+        The snapshot shares the id allocators of this network, so elements added to
+        either of them after forking get different ids and :meth:`diff`,
+        :meth:`apply_patch` and :meth:`merge` match elements unambiguously.
+
+        :return: A network holding the same elements.
+        :rtype: Network
+        """
+        forked = Network(self._shared_allocators())
+        for element_type, table in self.net.items():
+            forked._set_table(element_type, table.fork())
+        return forked
+
+    def diff(self, other):
+        """Compute the changes that turn this network into another network.
+
+        Elements are matched by id through the id indexes, and the fields of the
+        elements present in both networks are compared column by column.
+
+        :param other: The network to compare against.
+        :type other: Network
+        :return: A delta with an entry for each element type that differs, holding
+            the "added" elements as dictionaries, the "removed" element ids and the
+            "changed" fields as a dictionary of {id: {field: new value}}.
+        :rtype: dict
+        """
+        delta = {}
+        for element_type, table in self.net.items():
+            other_table = other.net[element_type]
+            ids = table.column("id") if "id" in table.fields else np.empty(0, dtype=np.int64)
+            other_ids = other_table.column("id") if "id" in other_table.fields else np.empty(0, dtype=np.int64)
 
-    def to_dataframe(self):
+            removed = ids[~np.isin(ids, other_ids)]
+            added = other_ids[~np.isin(other_ids, ids)]
+            common = ids[np.isin(ids, other_ids)]
+            rows = table.rows_of(common)
+            other_rows = other_table.rows_of(common)
+
+            changed = {}
+            for field in dict.fromkeys(table.fields + other_table.fields):
+                old = table.column(field)[rows] if field in table.fields else np.full(len(common), np.nan, dtype=object)
+                new = other_table.column(field)[other_rows] if field in other_table.fields else np.full(len(common), np.nan, dtype=object)
+                different = np.asarray(old != new, dtype=bool) & ~(pd.isna(old) & pd.isna(new))
+                for id, value in zip(common[different].tolist(), new[different].tolist()):
+                    changed.setdefault(id, {})[field] = value
+
+            if len(removed) or len(added) or changed:
+                delta[element_type] = {
+                    "added": [other_table.get(id) for id in added.tolist()],
+                    "removed": removed.tolist(),
+                    "changed": changed
+                }
+        return delta
+
+    def apply_patch(self, delta):
+        """Apply a delta produced by :meth:`diff` to this network.
+
+        Elements are removed first, then changed, then added. Subscribers are
+        notified once, after the whole delta is applied.
+
+        :param delta: The changes to apply, as returned by :meth:`diff`.
+        :type delta: dict
+        :raises KeyError: If the delta references an element missing from the network.
+        """
+        with self.batch():
+            for element_type, changes in delta.items():
+                table = self.net[element_type]
+                for id in changes.get("removed", ()):
+                    table.remove(id)
+                for id, fields in changes.get("changed", {}).items():
+                    for field, value in fields.items():
+                        table.set_value(table.row_of(id), field, value)
+                for record in changes.get("added", ()):
+                    table.append(record)
+
+    def subscribe(self, callback, element_types=None):
+        """Call a function after every change to the elements of the network.
+
+        The callback receives a list of :class:`networks.NetworkEvent.NetworkEvent`,
+        each reporting elements of one type that were added, removed or changed in
+        one field, so consumers such as translated models can update the changed
+        elements instead of rebuilding. Outside of :meth:`batch` the callback is
+        called after every change with a single event; inside a batch it is called
+        once when the batch ends.
+
+        Changes made through the element tables of the network are reported as
+        well, as long as the tables are not replaced in ``net`` directly.
+
+        :param callback: The function to call with the list of events.
+        :type callback: callable
+        :param element_types: Only report changes to these element types, defaults to every type
+        :type element_types: iterable, optional
+        :return: The callback, to pass to :meth:`unsubscribe`.
+        :rtype: callable
+        """
+        self._subscribers[callback] = None if element_types is None else frozenset(element_types)
+        return callback
+
+    def unsubscribe(self, callback):
+        """Stop calling a function subscribed with :meth:`subscribe`.
+
+        :param callback: The subscribed function.
+        :type callback: callable
+        :raises KeyError: If the function is not subscribed.
+        """
+        del self._subscribers[callback]
+
+    @contextmanager
+    def batch(self):
+        """Group the changes made in a ``with`` block into one notification.
+
+        The events of the block are merged where consecutive events have the same
+        element type, kind and field, and subscribers are called once when the
+        outermost batch ends, even if the block raises. Batches can be nested.
+
+        :return: A context manager delaying the notifications.
+        :rtype: contextlib.AbstractContextManager
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_events:
+                events, self._pending_events = NetworkEvent.coalesce(self._pending_events), []
+                self._publish(events)
+
+    def _set_table(self, element_type: str, table):
+        """Store the table of an element type and report its changes to the subscribers.
+
+        :param element_type: The type of the elements.
+        :type element_type: str
+        :param table: The table holding the elements.
+        :type table: ElementTable
+        """
+        self.net[element_type] = table
+        table.set_listener(partial(self._emit, element_type))
+
+    def _emit(self, element_type: str, kind: str, ids, field: str = None):
+        """Report a change of an element table to the subscribers, or hold it until the batch ends.
+
+        :param element_type: The type of the changed elements.
+        :type element_type: str
+        :param kind: "added", "removed" or "changed".
+        :type kind: str
+        :param ids: The ids of the changed elements.
+        :type ids: numpy.ndarray
+        :param field: The changed field, defaults to None
+        :type field: str, optional
+        """
+        if not self._subscribers:
+            return
+        event = NetworkEvent(element_type, kind, ids, field)
+        if self._batch_depth:
+            self._pending_events.append(event)
+        else:
+            self._publish([event])
+
+    def _publish(self, events):
+        """Call every subscriber with the events of the element types it subscribed to.
+
+        :param events: The events to report.
+        :type events: list
+        """
+        for callback, element_types in list(self._subscribers.items()):
+            selected = events if element_types is None else [event for event in events if event.element_type in element_types]
+            if selected:
+                callback(selected)
+
+    def fingerprints(self):
+        """Get a content hash of each element type of the network.
+
+        The hashes depend only on the field values of the elements, not on their
+        order or on how they were added, and are stable across processes, so they
+        can key caches of models or results built from some element types. Each
+        table only rehashes the elements changed since it was last hashed.
+
+        :return: A dictionary mapping each element type to the hash of its elements.
+        :rtype: dict
+        """
+        return {element_type: table.fingerprint() for element_type, table in self.net.items()}
+
+    def fingerprint(self):
+        """Get a content hash of the whole network.
+
+        Two networks holding the same elements have the same fingerprint, and a
+        change to any field of any element changes it. It is combined from
+        :meth:`fingerprints`, so it is cheap to recompute after a few changes.
+
+        :return: The hash as 32 hexadecimal digits.
+        :rtype: str
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for element_type, fingerprint in sorted(self.fingerprints().items()):
+            digest.update(f"{element_type}={fingerprint};".encode())
+        return digest.hexdigest()
+
+    def get_topology(self):
+        """Get the bus adjacency index of the network.
+
+        The index is shared by every consumer of the network and is only
+        recompiled when buses or branch elements have changed.
+
+        :return: The sparse bus adjacency structure of the network.
+        :rtype: Topology
+        """
+        return self._topology
+
+    def get_island_detector(self):
+        """Get the island detector of the network.
+
+        The detector is shared by every consumer of the network and can open and
+        close single branches for contingency screening.
+
+        :return: The union-find island detector of the network.
+        :rtype: IslandDetector
+        """
+        return self._island_detector
+
+    def connected_components(self):
+        """Find the groups of in-service buses connected by branches and closed switches.
+
+        :return: The bus ids of each connected component, largest component first.
+        :rtype: list
+        """
+        return self._island_detector.connected_components()
+
+    def find_islands(self):
+        """Find the groups of in-service buses cut off from the largest connected component.
+
+        :return: The bus ids of each island.
+        :rtype: list
+        """
+        return self._island_detector.find_islands()
+
+    def validate(self, kv_tolerance: float = 0.1):
+        """Check that every bus reference points to a bus of the network and that
+        the electrical parameters of the elements are consistent.
+
+        Each rule is evaluated as a few array operations over whole columns, so the
+        network can be validated after every import.
+
+        :param kv_tolerance: The allowed relative difference between the rated voltage
+            of a transformer winding and the nominal voltage of its bus, defaults to 0.1
+        :type kv_tolerance: float, optional
+        :return: The issues found, which is true when none of them is an error.
+        :rtype: ValidationReport
+        """
+        return Validator(self, kv_tolerance).validate()
+
+    def query(self, element_type: str, expr: str, as_frame: bool = False):
+        """Find the elements of one type matching a filter expression.
+
+        The expression uses Python syntax over the fields of the elements, eg.
+        ``net.query("line", "length_km > 5 and max_amp < 300")``, and can read the
+        fields of referenced buses, eg. ``net.query("load", "bus.zone == 'North'")``.
+        It is evaluated on whole columns of the element table, without converting
+        the network to DataFrames; see :class:`networks.Query.Query` for the syntax.
+
+        :param element_type: The type of the elements (eg. "bus", "line").
+        :type element_type: str
+        :param expr: The filter expression.
+        :type expr: str
+        :param as_frame: Return the matching elements as a DataFrame instead of
+            their ids, defaults to False
+        :type as_frame: bool, optional
+        :return: The ids of the matching elements, or the matching elements.
+        :rtype: numpy.ndarray or pandas.DataFrame
+        :raises ValueError: If the expression is not valid.
+        :raises KeyError: If the expression uses a field the elements or buses do not have.
+        """
+        query = Query(element_type, expr)
+        return query.frame(self) if as_frame else query.ids(self)
+
+    def partition_by_zone(self, reserve: dict = None):
+        """Split the network into one subnetwork per bus zone.
+
+        Each bus goes to the subnetwork of its zone, and every other element goes
+        to the subnetwork of the zone all its buses belong to, keeping its id so
+        the subnetworks can be processed separately and merged back with
+        :meth:`merge`. Branches connecting buses of different zones, and elements
+        referencing a bus missing from the network, are left out of every
+        subnetwork and listed in the boundary table instead. Buses without a zone
+        are grouped under the zone None.
+
+        By default the subnetworks share the id allocators of this network, so the
+        elements added to any of them get ids unused in this network and in the
+        other subnetworks. Subnetworks sent to other processes no longer share
+        their allocators, so they should be given blocks of ids with ``reserve``;
+        the element types not listed in ``reserve`` keep sharing this network's
+        allocators.
+
+        The zone of every element is found with vectorized id lookups and the
+        elements of all zones are gathered with a single sort per element type.
+
+        :param reserve: The number of ids to reserve with :meth:`reserve_ids` for
+            each element type in every subnetwork, defaults to sharing the allocators
+        :type reserve: dict, optional
+        :return: A dictionary of subnetworks by zone, in order of first appearance,
+            and a boundary DataFrame with one row per bus reference of each element
+            left out, with the columns element_type, id, terminal (the bus id
+            field), bus_id and zone.
+        :rtype: tuple
+        """
+        buses = self.net["bus"]
+        zones = buses.column("zone") if "zone" in buses.fields else np.full(len(buses), None, dtype=object)
+        bus_codes, names = pd.factorize(zones)
+        names = list(names)
+        if (bus_codes < 0).any():
+            bus_codes = np.where(bus_codes < 0, len(names), bus_codes)
+            names.append(None)
+
+        codes = {"bus": bus_codes}
+        boundary = []
+        for element_type, fields in BUS_REFERENCES.items():
+            table = self.net[element_type]
+            fields = [field for field in fields if field in table.fields]
+            if len(table) == 0 or not fields:
+                codes[element_type] = np.full(len(table), -1, dtype=np.int64)
+                continue
+
+            bus_ids = [table.column(field) for field in fields]
+            rows = [buses.rows_of(ids) for ids in bus_ids]
+            terminals = np.stack([np.where(row >= 0, bus_codes[row], -1) for row in rows])
+            inside = (terminals == terminals[0]).all(axis=0) & (terminals[0] >= 0)
+            codes[element_type] = np.where(inside, terminals[0], -1)
+
+            left_out = ~inside
+            if left_out.any():
+                ids = table.column("id")[left_out]
+                for field, ids_of_buses, terminal in zip(fields, bus_ids, terminals):
+                    boundary.append(pd.DataFrame({
+                        "element_type": element_type,
+                        "id": ids,
+                        "terminal": field,
+                        "bus_id": ids_of_buses[left_out],
+                        "zone": [names[code] if code >= 0 else None for code in terminal[left_out].tolist()],
+                    }))
+
+        if reserve is None:
+            subnetworks = {zone: Network(self._shared_allocators()) for zone in names}
+        else:
+            shared = self._shared_allocators()
+            subnetworks = {zone: Network({**shared, **self.reserve_ids(reserve)}) for zone in names}
+        for element_type, element_codes in codes.items():
+            order = np.argsort(element_codes, kind="stable")
+            counts = np.bincount(element_codes[element_codes >= 0], minlength=len(names))
+            starts = np.searchsorted(element_codes[order], 0)
+            for zone, rows in zip(names, np.split(order[starts:], np.cumsum(counts)[:-1])):
+                subnetworks[zone]._set_table(element_type, self.net[element_type].take(rows))
+
+        columns = ["element_type", "id", "terminal", "bus_id", "zone"]
+        boundary = pd.concat(boundary, ignore_index=True) if boundary else pd.DataFrame(columns=columns)
+        return subnetworks, boundary
+
+    def remove_element(self, element_type: str, id: int):
+        """Remove an element from the network.
+
+        The element is tombstoned in constant time and hidden from iteration and
+        DataFrame export; its storage is reclaimed once enough elements of the same
+        type have been removed.
+
+        :param element_type: The type of the element (eg. "bus", "line").
+        :type element_type: str
+        :param id: The id of the element.
+        :type id: int
+        :return: The removed element as a dictionary, which can be passed to
+            ``net[element_type].append`` to restore it.
+        :rtype: dict
+        :raises KeyError: If the network has no element of this type with this id.
+        """
+        return self.net[element_type].remove(id)
+
+    def to_dataframe(self, compact: bool = False):
         
-        """Convert each element list in the network to a pandas DataFrame.
+        """Convert each element table in the network to a pandas DataFrame.
 
+        Each table caches its DataFrame, so only the element types modified since
+        the previous call are rebuilt. The returned DataFrames are shared with the
+        cache and should be copied before being modified.
+
+        The compact mode stores repeated strings such as ``type`` and ``zone`` as
+        categoricals, floats as float32 where the values are exact in float32 and
+        ids in the smallest integer dtype holding them, which takes a fraction of
+        the memory when many networks are held at once; see :meth:`memory_report`.
+
+        :param compact: Downcast the columns to save memory, defaults to False
+        :type compact: bool, optional
         :return: A dictionary of pandas DataFrames where the keys are element 
             types and the values are the corresponding DataFrames.
         :rtype: dict
         """
         
-        # Convert each element list to a pandas DataFrame
-        bus_df = pd.DataFrame(self.net["bus"])
-        line_df = pd.DataFrame(self.net["line"])
-        load_df = pd.DataFrame(self.net["load"])
-        transformer_df = pd.DataFrame(self.net["transformer"])
-        generator_df = pd.DataFrame(self.net["generator"])
-        impedence_df = pd.DataFrame(self.net["impedence"])
-        storage_df = pd.DataFrame(self.net["storage"])
-        switch_df = pd.DataFrame(self.net["switch"])
-        threewindingtransformer_df = pd.DataFrame(self.net["threewindingtransformer"])
+        # Convert each element table to a pandas DataFrame
+        bus_df = self.net["bus"].to_dataframe(compact)
+        line_df = self.net["line"].to_dataframe(compact)
+        load_df = self.net["load"].to_dataframe(compact)
+        transformer_df = self.net["transformer"].to_dataframe(compact)
+        generator_df = self.net["generator"].to_dataframe(compact)
+        impedence_df = self.net["impedence"].to_dataframe(compact)
+        storage_df = self.net["storage"].to_dataframe(compact)
+        switch_df = self.net["switch"].to_dataframe(compact)
+        threewindingtransformer_df = self.net["threewindingtransformer"].to_dataframe(compact)
 
         #dictionary of element DataFrames
         return { 
@@ -144,6 +965,22 @@ class Network:
             "threewindingtransformer": threewindingtransformer_df,
         }
 
+    def memory_report(self):
+        """Compare the memory used by the DataFrames of the network in the default and compact modes.
+
+        :return: A DataFrame with one row per element type and column, holding its
+            dtype and size in bytes (including the strings it references) in each mode.
+        :rtype: pandas.DataFrame
+        """
+        columns = ["element_type", "column", "dtype", "bytes", "compact_dtype", "compact_bytes"]
+        rows = []
+        for element_type, table in self.net.items():
+            frame, compact = table.to_dataframe(), table.to_dataframe(compact=True)
+            for column in frame.columns:
+                rows.append((element_type, column, str(frame[column].dtype), frame[column].memory_usage(index=False, deep=True),
+                             str(compact[column].dtype), compact[column].memory_usage(index=False, deep=True)))
+        return pd.DataFrame(rows, columns=columns)
+
     def save_to_csv(self, directory=os.path.expanduser("~/Desktop/network_data")):
         
         """Save the network data to CSV files in the specified directory.
@@ -165,88 +1002,237 @@ class Network:
         for key, df in dfs.items():
             df.to_csv(f"{directory}/{key}.csv", index=False)
 
-    def load_from_csv(self, directory=os.path.expanduser("~/Desktop/network_data")):
+    def load_from_csv(self, directory=os.path.expanduser("~/Desktop/network_data"), max_workers: int = 1,
+                      chunksize: int = None, progress=None):
         
         """Load the network data from CSV files in the specified directory.
 
         This method expects specific CSV files to be present in the directory. If a 
         file is empty or does not exist, it will be skipped with a corresponding 
-        message. The loaded data will be added to the network as appropriate objects.
+        message. Each file is parsed column by column with the dtypes declared in
+        ``CSV_DTYPES`` and its elements are added to the network in bulk. Elements
+        read from a file with an ``id`` column, as written by :meth:`save_to_csv`,
+        keep their ids so that references such as ``bus_id`` stay valid; otherwise
+        they receive new ids exactly as if they had been added one by one.
+
+        With several workers the files are read and parsed concurrently by a thread
+        pool, which hides the latency of network file systems since the pandas
+        parser releases the GIL. The elements are still added in the usual order,
+        so the ids do not depend on the number of workers, but every parsed file is
+        held in memory until all of them are read.
+
+        With a chunk size the files are streamed instead: each file is read in
+        chunks of at most that many rows, and each chunk is added to the network
+        before the next one is parsed, so the memory used on top of the network
+        is proportional to the chunk size. The columns without a declared dtype
+        are scanned once beforehand, so that every chunk is parsed with the dtypes
+        of the whole file.
 
         :param directory: The directory from which the CSV files will be loaded, 
             defaults to "~/Desktop/network_data"
         :type directory: str, optional
+        :param max_workers: The number of files read at the same time, None for the
+            default of ThreadPoolExecutor, defaults to 1
+        :type max_workers: int, optional
+        :param chunksize: The number of rows read at a time, defaults to reading whole files
+        :type chunksize: int, optional
+        :param progress: A function called after each file or chunk is added, with
+            the element type and the number of its elements loaded so far, defaults to None
+        :type progress: callable, optional
+        :raises ValueError: If a file lacks a column of its element type, has an id
+            already used in the network, or a chunk size is given together with
+            several workers.
         """
         
-        #expected CSV files
-        files = ["bus.csv", "line.csv", "load.csv", "transformer.csv", "generator.csv", "impedence.csv", "storage.csv", "switch.csv", "threewindingtransformer.csv"]
-        dataframes = {}
-
-        # check which files exists and if the file is empty
-        for file in files:
-            file_path = os.path.join(directory, file)
-            if os.path.isfile(file_path):
-                try:
-                    df = pd.read_csv(file_path)
-                    if df.empty:
-                        print(f"File {file} is empty. Skipping...")
-                    else:
-                        dataframes[file.split('.')[0] + '_df'] = df
-                except pd.errors.EmptyDataError:
-                    print(f"File {file} is empty or has no columns to parse. Skipping...")
+        if chunksize is not None and max_workers != 1:
+            raise ValueError("Files read in chunks are streamed one at a time, use max_workers=1")
+
+        read = partial(self._read_csv, directory, chunksize=chunksize)
+        with self.batch():
+            if max_workers == 1:
+                # read each file or chunk only when the previous one has been added
+                parsed = map(read, self.net)
             else:
-                print(f"File {file} not found in directory {directory}. Skipping...")
-
-        # Add each element from the DataFrames to the network
-        if 'bus_df' in dataframes:
-            for _, row in dataframes['bus_df'].iterrows():
-                bus = Bus(row['name'], row['vn_kv'], row['type'], row['zone'], row['max_vm_pu'], row['min_vm_pu'], row['in_service'])
-                self.add_bus(bus)
-
-        if 'line_df' in dataframes:
-            for _, row in dataframes['line_df'].iterrows():
-                line = Line(row['name'], row['from_bus_id'], row['to_bus_id'], row['length_km'], row['max_loading_percent'], row['r_ohm_per_km'], row['x_ohm_per_km'],
-                            row['c_nf_per_km'], row['r0_ohm_per_km'], row['x0_ohm_per_km'], row['c0_nf_per_km'], row['norm_amp'], row['max_amp'], row['num_parallel'], row['derating_factor'], row['phases'])
-                self.add_line(line)
-
-        if 'load_df' in dataframes:
-            for _, row in dataframes['load_df'].iterrows():
-                load = Load(row['name'], row['bus_id'], row['p_kw'], row['q_kvar'], row['kv'], row['kva'], row['const_z_percent'], row['const_i_percent'],
-                            row['fixed'], row['max_p_kw'], row['min_p_kw'], row['max_q_kvar'], row['min_q_kvar'])
-                self.add_load(load)
-
-        if 'transformer_df' in dataframes:
-            for _, row in dataframes['transformer_df'].iterrows():
-                transformer = Transformer(row['name'], row['hv_bus_id'], row['lv_bus_id'], row['hv_kv'], row['lv_kv'], row['sn_kva'], row['vk_percent'], row['vkr_percent'],
-                                        row['pfe_kw'], row['i0_percent'], row['tap_min'], row['tap_neutral'], row['tap_max'], row['tap_step_percent'], row['rh'], row['rl'], row['x'])
-                self.add_transformer(transformer)
-
-        if 'generator_df' in dataframes:
-            for _, row in dataframes['generator_df'].iterrows():
-                generator = Generator(row['name'], row['bus_id'], row['p_kw'], row['q_kvar'], row['kv'], row['kva'], row['pvfactor'], row['fixed'], row['max_p_kw'],
-                                    row['min_p_kw'], row['max_q_kvar'], row['min_q_kvar'], row['phases'], row['subtrans_react_pu'])
-                self.add_generator(generator)
-
-        if 'impedence_df' in dataframes:
-            for _, row in dataframes['impedence_df'].iterrows():
-                impedence = Impedence(row['name'], row['from_bus_id'], row['to_bus_id'], row['r_pu'], row['x_pu'], row['kv'], row['kvar'])
-                self.add_impedence(impedence)
-
-        if 'storage_df' in dataframes:
-            for _, row in dataframes['storage_df'].iterrows():
-                storage = Storage(row['name'], row['bus_id'], row['p_kw'], row['p_kvar'], row['max_e_kwh'], row['min_e_kwh'], row['soc_percent'], row['max_p_mv'],
-                                row['min_p_kw'], row['max_q_mvar'], row['min_q_kvar'])
-                self.add_storage(storage)
-
-        if 'switch_df' in dataframes:
-            for _, row in dataframes['switch_df'].iterrows():
-                switch = Switch(row['name'], row['bus_id'], row['type'], row['closed'], row['base_freq'], row['max_ka'])
-                self.add_switch(switch)
-
-        if 'threewindingtransformer_df' in dataframes:
-            for _, row in dataframes['threewindingtransformer_df'].iterrows():
-                threewindingtransformer = ThreeWindingTransformer(row['name'], row['hv_bus_id'], row['mv_bus_id'], row['lv_bus_id'], row['hv_kv'], row['mv_kv'], row['lv_kv'], row['sn_hv_kva'],
-                                                                row['sn_mv_kva'], row['sn_lv_kva'], row['vk_hv_percent'], row['vk_mv_percent'], row['vk_lv_percent'], row['vkr_hv_percent'], row['vkr_mv_percent'],
-                                                                row['vkr_lv_percent'], row['pfe_kw'], row['i0_percent'], row['tap_min'], row['tap_neutral'], row['tap_max'], row['tap_step_percent'], row['rh'], row['rm'], row['rl'], row['xh'], row['xm'], row['xl'])
-                self.add_threewindingtransformer(threewindingtransformer)
+                with ThreadPoolExecutor(max_workers) as executor:
+                    parsed = list(executor.map(lambda element_type: list(read(element_type)), self.net))
+            for element_type, chunks in zip(self.net, parsed):
+                loaded = 0
+                for columns in chunks:
+                    loaded += len(self._add_elements(element_type, columns))
+                    if progress is not None:
+                        progress(element_type, loaded)
+
+    def _read_csv(self, directory, element_type: str, chunksize: int = None):
+        """Parse the CSV file of one element type into columns, whole or in chunks.
+
+        Columns declared as int or bool are read again with inferred dtypes if the
+        file has empty cells in them, starting after the rows already returned. When
+        reading in chunks, the columns without a declared dtype are first scanned
+        so that every chunk gets the dtype inferred from the whole file.
+
+        :param directory: The directory holding the CSV files.
+        :type directory: str
+        :param element_type: The type of the elements (eg. "bus", "line").
+        :type element_type: str
+        :param chunksize: The number of rows read at a time, defaults to reading the whole file
+        :type chunksize: int, optional
+        :return: The values of each constructor argument of the element class and of
+            the ids if the file has them, for the whole file or for each chunk;
+            nothing if the file is missing or empty.
+        :rtype: iterator
+        """
+        file = f"{element_type}.csv"
+        file_path = os.path.join(directory, file)
+        if not os.path.isfile(file_path):
+            print(f"File {file} not found in directory {directory}. Skipping...")
+            return
+
+        fields = list(inspect.signature(ELEMENT_CLASSES[element_type].__init__).parameters)[1:]
+        fields.append("id")
+        dtypes = dict(CSV_DTYPES[element_type], id=np.int64)
+        inferred = None
+        loaded = 0
+        while True:
+            try:
+                if inferred is None:
+                    undeclared = [field for field in fields if field not in dtypes]
+                    inferred = _chunk_dtypes(file_path, undeclared, chunksize) if chunksize is not None else {}
+                reader = pd.read_csv(file_path, usecols=lambda column: column in fields, dtype=dict(dtypes, **inferred),
+                                     chunksize=chunksize, skiprows=range(1, loaded + 1))
+                for df in reader if chunksize is not None else [reader]:
+                    if not df.empty:
+                        loaded += len(df)
+                        yield {field: df[field].to_numpy() for field in df.columns}
+                break
+            except pd.errors.EmptyDataError:
+                print(f"File {file} is empty or has no columns to parse. Skipping...")
+                return
+            except ValueError:
+                if all(dtype is object for dtype in dtypes.values()):
+                    raise
+                # empty cells can not be stored as int or bool, so those columns become float or object
+                dtypes = {field: dtype for field, dtype in dtypes.items() if dtype is object}
+        if loaded == 0:
+            print(f"File {file} is empty. Skipping...")
+
+    def save_parquet(self, directory, compression: str = "zstd"):
+        """Save the network to one Parquet file per element type.
+
+        Each file holds the columns of an element table with their types, ids
+        included, and repeated strings are dictionary-encoded, so the files are
+        much smaller than CSV files and are loaded without parsing text. Columns
+        mixing strings with other values are stored as JSON strings and restored
+        by :meth:`load_parquet`. Element types without any field are not written.
+
+        :param directory: The directory where the files will be saved, created if it does not exist.
+        :type directory: str
+        :param compression: The Parquet compression codec, defaults to "zstd"
+        :type compression: str, optional
+        :raises ImportError: If pyarrow is not installed.
+        """
+        _require_pyarrow("save_parquet")
+        os.makedirs(directory, exist_ok=True)
+        for element_type, table in self.net.items():
+            if not table.fields:
+                continue
+            arrays, encoded = zip(*(_to_arrow(np.asarray(table.column(field))) for field in table.fields))
+            arrow_table = pa.Table.from_arrays(list(arrays), names=list(table.fields))
+            json_fields = [field for field, is_encoded in zip(table.fields, encoded) if is_encoded]
+            arrow_table = arrow_table.replace_schema_metadata({"element_type": element_type,
+                                                               "json_fields": json.dumps(json_fields)})
+            strings = [field for field, array in zip(table.fields, arrays) if pa.types.is_string(array.type)]
+            pq.write_table(arrow_table, os.path.join(directory, f"{element_type}.parquet"),
+                           compression=compression, use_dictionary=strings)
+
+    def load_parquet(self, directory):
+        """Load the elements saved with :meth:`save_parquet` into the network, keeping their ids.
+
+        Missing values are read back as NaN, as in networks loaded from CSV files.
+        Element types without a file are skipped.
+
+        :param directory: The directory holding the Parquet files.
+        :type directory: str
+        :raises ImportError: If pyarrow is not installed.
+        :raises ValueError: If an element has an id already used in the network.
+        """
+        _require_pyarrow("load_parquet")
+        with self.batch():
+            for element_type in self.net:
+                file_path = os.path.join(directory, f"{element_type}.parquet")
+                if not os.path.isfile(file_path):
+                    continue
+                arrow_table = pq.read_table(file_path)
+                metadata = arrow_table.schema.metadata or {}
+                json_fields = json.loads(metadata.get(b"json_fields", b"[]"))
+                self.net[element_type].extend({name: _from_arrow(column, name in json_fields) for name, column in
+                                               zip(arrow_table.column_names, arrow_table.columns)})
+
+    def save_memmap(self, directory):
+        """Save the network in a binary format that :meth:`open_memmap` maps into memory.
+
+        Each column of each element table is written as a ``.npy`` array, next to a
+        JSON manifest listing the files. String columns are written as an array of
+        integer codes and a JSON list of their distinct values.
+
+        :param directory: The directory where the files will be saved, created if it does not exist.
+        :type directory: str
+        """
+        os.makedirs(directory, exist_ok=True)
+        manifest = {"version": MEMMAP_VERSION, "tables": {}}
+        for element_type, table in self.net.items():
+            columns = []
+            for field in table.fields:
+                values = np.asarray(table.column(field))
+                column = {"field": field, "file": f"{element_type}.{field}.npy"}
+                if values.dtype == object:
+                    codes, uniques = pd.factorize(values)
+                    column["values"] = f"{element_type}.{field}.json"
+                    with open(os.path.join(directory, column["values"]), "w") as file:
+                        json.dump(uniques.tolist(), file, default=lambda value: value.item())
+                    values = codes.astype(np.int32)
+                np.save(os.path.join(directory, column["file"]), values)
+                column["dtype"] = values.dtype.str
+                columns.append(column)
+            manifest["tables"][element_type] = {"rows": len(table), "columns": columns}
+        with open(os.path.join(directory, MEMMAP_MANIFEST), "w") as file:
+            json.dump(manifest, file, indent=1)
+
+    @classmethod
+    def open_memmap(cls, directory):
+        """Open a network saved with :meth:`save_memmap` without reading its columns.
+
+        The numeric and boolean columns are memory-mapped read-only, so opening a
+        network costs little more than building its id indexes, pages are read
+        from disk only when the columns are used, and processes opening the same
+        files share them in the page cache. A table is copied into memory the
+        first time it is modified. String columns are rebuilt from their codes.
+
+        :param directory: The directory holding the files.
+        :type directory: str
+        :return: The network.
+        :rtype: Network
+        :raises ValueError: If the files were written in an unsupported layout.
+        """
+        with open(os.path.join(directory, MEMMAP_MANIFEST)) as file:
+            manifest = json.load(file)
+        if manifest.get("version") != MEMMAP_VERSION:
+            raise ValueError(f"Unsupported memory-mapped network version {manifest.get('version')}")
 
+        network = cls()
+        for element_type, description in manifest["tables"].items():
+            columns = {}
+            for column in description["columns"]:
+                path = os.path.join(directory, column["file"])
+                # an empty file can not be mapped
+                values = np.load(path, mmap_mode="r" if description["rows"] else None)
+                if "values" in column:
+                    with open(os.path.join(directory, column["values"])) as file:
+                        uniques = json.load(file)
+                    # code -1 marks a missing value
+                    lookup = np.empty(len(uniques) + 1, dtype=object)
+                    lookup[:-1] = uniques
+                    lookup[-1] = np.nan
+                    values = lookup[values]
+                columns[column["field"]] = values
+            network._set_table(element_type, ElementTable.from_arrays(columns))
+        return network
@@ -0,0 +1,204 @@
+import unittest
+import warnings
+import numpy as np
+import pandas as pd
+from networks.ElementTable import ElementTable
+
+
+class TestElementTable(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.table = ElementTable(capacity=2)
+        self.records = [{'name': f"Bus{i}", 'id': i + 1, 'vn_kv': 110.0, 'type': 'b', 'zone': 'Zone1', 'max_vm_pu': 1.05, 'min_vm_pu': 0.95, 'in_service': True} for i in range(5)]
+        for record in self.records:
+            self.table.append(record)
+
+    def test_append_and_read(self):
+        """tests if appended elements are read back unchanged, including after the buffers grow
+        """
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(self.table[0], self.records[0])
+        self.assertEqual(self.table[-1], self.records[-1])
+        self.assertEqual(list(self.table), self.records)
+        self.assertEqual(self.table, self.records)
+
+    def test_append_values(self):
+        """tests if an element appended as field names and values is stored like the same record, with missing fields left empty
+        """
+        fields, values = ("name", "id", "vn_kv", "type"), ("Bus6", 6, 20.0, "n")
+        self.table.append_values(fields, values)
+
+        row = self.table[5]
+        self.assertEqual({field: row[field] for field in fields}, dict(zip(fields, values)))
+        self.assertTrue(pd.isna(row["zone"]))
+        self.assertEqual(self.table.row_of(6), 5)
+        self.assertEqual(self.table.rows_named("Bus6"), [5])
+        with self.assertRaises(ValueError):
+            self.table.append_values(fields, ("Bus7", 6, 20.0, "n"))
+
+    def test_typed_columns(self):
+        """tests if each field is stored as a typed NumPy array
+        """
+        self.assertEqual(self.table.column("id").dtype, np.int64)
+        self.assertEqual(self.table.column("vn_kv").dtype, np.float64)
+        self.assertEqual(self.table.column("in_service").dtype, np.bool_)
+        self.assertEqual(self.table.column("name").dtype, object)
+        self.assertFalse(self.table.column("vn_kv").flags.writeable)
+
+    def test_promotion(self):
+        """tests if a column is widened when a value does not fit its dtype
+        """
+        table = ElementTable()
+        table.append({"a": 1, "b": True})
+        table.append({"a": 2.5, "b": "x"})
+        table.append({"a": 3, "c": 4})
+
+        self.assertEqual(table.column("a").dtype, np.float64)
+        self.assertEqual(table.column("b").dtype, object)
+        self.assertTrue(np.isnan(table[0]["c"]))
+        self.assertTrue(np.isnan(table[2]["b"]))
+
+    def test_to_dataframe(self):
+        """tests if the table converts to the same DataFrame as the equivalent list of dictionaries
+        """
+        pd.testing.assert_frame_equal(self.table.to_dataframe(), pd.DataFrame(self.records))
+        pd.testing.assert_frame_equal(ElementTable().to_dataframe(), pd.DataFrame([]))
+
+    def test_dataframe_cache(self):
+        """tests if the DataFrame is reused until the table is modified
+        """
+        frame = self.table.to_dataframe()
+        self.assertIs(self.table.to_dataframe(), frame)
+
+        self.table.set_value(0, "vn_kv", 20.0)
+        frame = self.table.to_dataframe()
+        self.assertEqual(frame.loc[0, "vn_kv"], 20.0)
+        self.assertIs(self.table.to_dataframe(), frame)
+
+        self.table.append(dict(self.records[0], id=6))
+        self.assertEqual(len(self.table.to_dataframe()), 6)
+
+    def test_set_value(self):
+        """tests if editing an element keeps the id and name indexes up to date
+        """
+        self.table.set_value(1, "id", 10)
+        self.table.set_value(1, "name", "Renamed")
+
+        self.assertEqual(self.table.row_of(10), 1)
+        self.assertEqual(self.table.rows_named("Renamed"), [1])
+        self.assertEqual(self.table.rows_named("Bus1"), [])
+        with self.assertRaises(KeyError):
+            self.table.row_of(2)
+        with self.assertRaises(ValueError):
+            self.table.set_value(0, "id", 10)
+
+    def test_remove(self):
+        """tests if removed elements are hidden and the rows of the others stay consistent
+        """
+        table = ElementTable()
+        table.COMPACTION_THRESHOLD = 0.5
+        for record in self.records:
+            table.append(record)
+
+        removed = table.remove(2)
+        self.assertEqual(removed, self.records[1])
+        self.assertEqual(len(table), 4)
+        self.assertEqual(list(table), [self.records[i] for i in (0, 2, 3, 4)])
+        self.assertEqual(table.column("id").tolist(), [1, 3, 4, 5])
+        self.assertEqual(table.row_of(4), 2)
+        self.assertEqual(table.rows_of([5, 2]).tolist(), [3, -1])
+        self.assertEqual(table.rows_named("Bus1"), [])
+        self.assertEqual(len(table.to_dataframe()), 4)
+        with self.assertRaises(KeyError):
+            table.get(2)
+
+        table.set_value(2, "vn_kv", 20.0)
+        self.assertEqual(table.get(4)["vn_kv"], 20.0)
+
+        table.append(removed)
+        self.assertEqual(table[-1], self.records[1])
+
+    def test_take(self):
+        """tests if selected elements are copied into a new table that can be searched by id and name
+        """
+        self.table.extend({"name": ["Bus1", "Bus9"], "id": [6, 7], "vn_kv": [20.0, 20.0]})
+        table = self.table.take([5, 1, 3])
+
+        self.assertEqual(table.column("id").tolist(), [6, 2, 4])
+        self.assertEqual(table.column("vn_kv").dtype, np.float64)
+        self.assertEqual(table.rows_named("Bus1"), [0, 1])
+        self.assertEqual(self.table.rows_named("Bus1"), [1, 5])
+        self.assertEqual(table.row_of(4), 2)
+
+    def test_from_arrays(self):
+        """tests if a table over existing arrays shares them until it is modified
+        """
+        ids = np.array([3, 1, 2])
+        table = ElementTable.from_arrays({"name": np.array(["a", "b", "a"], dtype=object), "id": ids})
+
+        self.assertEqual(table.row_of(2), 2)
+        self.assertEqual(table.rows_named("a"), [0, 2])
+        self.assertTrue(np.shares_memory(table.column("id"), ids))
+        table.set_field(1, "name", "c")
+        self.assertFalse(np.shares_memory(table.column("id"), ids))
+        with self.assertRaises(ValueError):
+            ElementTable.from_arrays({"id": np.array([1, 1])})
+
+    def test_compact_dataframe(self):
+        """tests if the compact DataFrame downcasts columns without changing their values
+        """
+        self.table.set_field(1, "vn_kv", 1.25)
+        self.table.set_field(2, "max_vm_pu", 16777217.0)
+        self.table.set_field(3, "min_vm_pu", 1e40)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            frame = self.table.to_dataframe(compact=True)
+
+        self.assertEqual(frame["id"].dtype, np.int8)
+        self.assertEqual(frame["vn_kv"].dtype, np.float32)
+        self.assertEqual(frame["max_vm_pu"].dtype, np.float64)
+        self.assertEqual(frame["min_vm_pu"].dtype, np.float64)
+        self.assertEqual(frame["zone"].dtype, "category")
+        self.assertEqual(frame["name"].dtype, object)
+        self.assertEqual(frame["in_service"].dtype, np.bool_)
+        pd.testing.assert_frame_equal(frame, self.table.to_dataframe(), check_dtype=False, check_categorical=False, check_exact=True)
+        self.assertIs(self.table.to_dataframe(compact=True), frame)
+
+    def test_compaction(self):
+        """tests if the buffers are compacted once enough elements are removed
+        """
+        for id in (1, 2):
+            self.table.remove(id)
+
+        self.assertEqual(self.table._dead, 0)
+        self.assertEqual(self.table._size, 3)
+        self.assertEqual(self.table.row_of(5), 2)
+        self.assertEqual(self.table.rows_named("Bus4"), [2])
+        self.assertEqual(list(self.table), self.records[2:])
+
+    def test_rows_with_tombstones(self):
+        """tests if rows and slots stay consistent through removals, edits and restores without rebuilding the row index
+        """
+        table = ElementTable()
+        table.COMPACTION_THRESHOLD = 0.9
+        table.extend({"id": np.arange(1, 201), "vn_kv": np.full(200, 20.0)})
+        rng = np.random.default_rng(0)
+        for id in rng.permutation(np.arange(1, 201))[:150].tolist():
+            record = table.remove(id)
+            ranks = table._ranks
+            if len(table):
+                table.set_field(int(table.column("id")[0]), "vn_kv", 30.0)
+                table.set_value(len(table) - 1, "vn_kv", 40.0)
+            if id % 3 == 0:
+                table.append(record)
+
+            live = np.flatnonzero(table._alive[:table._size])
+            for row in (0, len(table) // 2, len(table) - 1):
+                self.assertEqual(table._physical(row), live[row])
+            self.assertEqual(table.row_of(int(table.column("id")[-1])), len(table) - 1)
+            if ranks is not None and id % 3:
+                self.assertIs(table._ranks, ranks)
+
+
+if __name__ == '__main__':
+    unittest.main()
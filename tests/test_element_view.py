@@ -0,0 +1,67 @@
+import unittest
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+
+
+class TestElementView(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        self.bus = self.net.add_bus(Bus("Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True))
+        self.net.add_bus(Bus("Bus2", 110.0, "b", "Zone1", 1.05, 0.95, True))
+        self.line = self.net.add_line(Line("Line1", 1, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+
+    def test_read(self):
+        """tests if a view reads the values stored in the network
+        """
+        self.assertEqual(self.bus.get_id(), 1)
+        self.assertEqual(self.bus.get_name(), "Bus1")
+        self.assertEqual(self.bus.get_property("vn_kv"), 110.0)
+        self.assertEqual(self.bus.get_property("length_km"), "Not a valid variable for this element")
+        self.assertEqual(self.line.to_dict(), self.net.get_element("line", 1))
+        self.assertEqual(self.net.view("bus", 1), self.bus)
+
+    def test_write_in_place(self):
+        """tests if changes made through a view are seen by the network, its DataFrames and its topology
+        """
+        self.net.to_dataframe()
+        self.line.set_property("length_km", 5.0)
+        self.bus.set_name("Renamed")
+
+        self.assertEqual(self.net.get_element("line", 1)["length_km"], 5.0)
+        self.assertEqual(self.net.to_dataframe()["line"].loc[0, "length_km"], 5.0)
+        self.assertEqual(self.net.find_by_name("bus", "Renamed")[0]["id"], 1)
+        self.assertEqual(self.line.set_property("id", 7), "Not a valid variable for this element")
+
+        self.net.add_bus(Bus("Bus3", 110.0, "b", "Zone1", 1.05, 0.95, True))
+        self.line.set_properties({"to_bus_id": 3, "length_km": 2.0})
+        self.assertEqual(self.net.get_topology().neighbors(1).tolist(), [3])
+        self.assertIsNotNone(self.line.set_properties({"length_km": 1.0, "vn_kv": 20.0}))
+        self.assertEqual(self.line.get_property("length_km"), 2.0)
+
+    def test_removed_element(self):
+        """tests if a view stays valid as other elements are removed and fails once its own element is removed
+        """
+        self.net.remove_element("bus", 1)
+        bus = self.net.view("bus", 2)
+        self.net.remove_element("line", 1)
+
+        self.assertEqual(bus.get_name(), "Bus2")
+        with self.assertRaises(KeyError):
+            self.line.get_property("length_km")
+        with self.assertRaises(KeyError):
+            self.net.view("line", 1)
+
+    def test_fork(self):
+        """tests if writing through a view of a fork leaves the original network unchanged
+        """
+        fork = self.net.fork()
+        fork.view("bus", 1).set_property("vn_kv", 20.0)
+
+        self.assertEqual(self.bus.get_property("vn_kv"), 110.0)
+        self.assertEqual(fork.get_element("bus", 1)["vn_kv"], 20.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+from networks.network import Network
+from networks.ElementTable import ElementTable
+from networks.Bus import Bus
+from networks.Load import Load
+from injections.injections import Injections, Injection
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        for name, vn_kv in [("Bus1", 110.0), ("Bus2", 20.0), ("Bus3", 20.0)]:
+            self.net.add_bus(Bus(name, vn_kv, "b", "North", 1.05, 0.95, True))
+        for name, bus in [("Load1", 2), ("Load2", 3)]:
+            self.net.add_load(Load(name, bus, 100.0, 50.0, 20.0, 150.0, 0.5, 0.5, True, 200.0, 0.0, 100.0, 0.0))
+
+    def test_stable(self):
+        """tests if networks with the same elements have the same fingerprint, whatever their order
+        """
+        other = Network()
+        other.net["bus"].extend({field: self.net.net["bus"].column(field)[::-1] for field in self.net.net["bus"].fields})
+        other.net["load"] = self.net.net["load"].take([0, 1])
+
+        self.assertEqual(other.fingerprints(), self.net.fingerprints())
+        self.assertEqual(other.fingerprint(), self.net.fingerprint())
+        self.assertEqual(self.net.fingerprint(), self.net.fingerprint())
+
+    def test_change_one_type(self):
+        """tests if changing a load only changes the load fingerprint, and changing it back restores it
+        """
+        before = self.net.fingerprints()
+        overall = self.net.fingerprint()
+
+        self.net.view("load", 1).set_property("p_kw", 120.0)
+        after = self.net.fingerprints()
+
+        self.assertNotEqual(after["load"], before["load"])
+        self.assertEqual({key: value for key, value in after.items() if key != "load"},
+                         {key: value for key, value in before.items() if key != "load"})
+        self.assertNotEqual(self.net.fingerprint(), overall)
+
+        self.net.view("load", 1).set_property("p_kw", 100.0)
+        self.assertEqual(self.net.fingerprint(), overall)
+
+    def test_incremental(self):
+        """tests if only the appended and modified elements are rehashed
+        """
+        table = self.net.net["bus"]
+        table.fingerprint()
+        table.append(dict(table.get(3), name="Bus4", id=4))
+        table.set_field(1, "vn_kv", 132.0)
+
+        with mock.patch.object(ElementTable, "_hash_slots", autospec=True, side_effect=ElementTable._hash_slots) as hash_slots:
+            table.fingerprint()
+        self.assertEqual(sorted(len(call.args[1]) for call in hash_slots.call_args_list), [1, 1])
+
+    def test_remove_and_fork(self):
+        """tests if removing an element changes the fingerprint of a fork but not of its parent
+        """
+        before = self.net.fingerprint()
+        forked = self.net.fork()
+        forked.remove_element("load", 2)
+
+        self.assertNotEqual(forked.fingerprint(), before)
+        self.assertEqual(self.net.fingerprint(), before)
+
+        forked.net["load"].append(self.net.net["load"].get(2))
+        self.assertEqual(forked.fingerprint(), before)
+
+    def test_injections(self):
+        """tests if injection fingerprints follow the injection data
+        """
+        injections = Injections([Injection(0, [0, 1], [0.5, 0.6])], [Injection(0, [0, 1], [0.1, 0.2])])
+        same = Injections([Injection(0, [0.0, 1.0], [0.5, 0.6])], [Injection(0, [0, 1], [0.1, 0.2])])
+        before = injections.fingerprints()
+
+        self.assertEqual(same.fingerprint(), injections.fingerprint())
+
+        injections.injections["load"][0].magnitudes = [0.5, 0.7]
+        after = injections.fingerprints()
+        self.assertNotEqual(after["load"], before["load"])
+        self.assertEqual(after["generator"], before["generator"])
+
+        with self.assertRaises(ValueError):
+            injections.injections["load"][0].magnitudes[0] = 0.9
+        injections.injections["load"][0].get_magnitudes()[0] = 0.9
+        self.assertEqual(injections.fingerprints(), after)
+
+
+if __name__ == '__main__':
+    unittest.main()
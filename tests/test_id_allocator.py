@@ -0,0 +1,44 @@
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from networks.IdAllocator import IdAllocator
+
+
+class TestIdAllocator(unittest.TestCase):
+
+    def test_allocate(self):
+        """tests if ids are allocated in contiguous blocks above the floor
+        """
+        allocator = IdAllocator()
+
+        self.assertEqual(allocator.allocate(), 1)
+        self.assertEqual(allocator.allocate(3), 2)
+        self.assertEqual(allocator.allocate(floor=10), 10)
+        self.assertEqual(allocator.next_id, 11)
+
+    def test_concurrent_allocate(self):
+        """tests if threads allocating at the same time never receive the same id
+        """
+        allocator = IdAllocator()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(lambda _: allocator.allocate(), range(10000)))
+
+        self.assertEqual(sorted(ids), list(range(1, 10001)))
+
+    def test_reserve(self):
+        """tests if a reserved range can be sent to another process and is bounded
+        """
+        allocator = IdAllocator()
+        allocator.allocate(5)
+
+        reserved = pickle.loads(pickle.dumps(allocator.reserve(10)))
+
+        self.assertEqual(reserved.allocate(10), 6)
+        self.assertEqual(allocator.allocate(), 16)
+        with self.assertRaises(ValueError):
+            reserved.allocate()
+
+
+if __name__ == '__main__':
+    unittest.main()
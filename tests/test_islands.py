@@ -0,0 +1,97 @@
+import unittest
+import numpy as np
+from networks.network import Network
+from networks.Islands import IslandDetector
+from networks.NetworkGenerator import NetworkGenerator
+
+
+class TestIslandDetector(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        count = 7
+        self.net.add_buses({"name": [f"Bus{i}" for i in range(1, count + 1)], "vn_kv": [110.0] * count, "type": ["b"] * count, "zone": ["Zone1"] * count,
+                            "max_vm_pu": [1.05] * count, "min_vm_pu": [0.95] * count, "in_service": [True] * 6 + [False]})
+        count = 4
+        self.line_ids = self.net.add_lines({"name": [f"Line{i}" for i in range(1, count + 1)], "from_bus_id": [1, 2, 5, 7], "to_bus_id": [2, 3, 6, 1],
+                                            "length_km": [10.0] * count, "max_loading_percent": [80.0] * count, "r_ohm_per_km": [0.1] * count,
+                                            "x_ohm_per_km": [0.2] * count, "c_nf_per_km": [100.0] * count, "r0_ohm_per_km": [0.1] * count,
+                                            "x0_ohm_per_km": [0.2] * count, "c0_nf_per_km": [100.0] * count, "norm_amp": [200.0] * count,
+                                            "max_amp": [250.0] * count, "num_parallel": [1] * count, "derating_factor": [0.9] * count,
+                                            "phases": [3] * count, "type": ["ol"] * count})
+        self.net.add_impedences({"name": ["Impedence1"], "from_bus_id": [3], "to_bus_id": [4], "r_pu": [4.0], "x_pu": [3.5], "kv": [8.0], "kvar": [2.3]})
+
+    def components(self):
+        return sorted(sorted(component.tolist()) for component in self.net.connected_components())
+
+    def test_connected_components(self):
+        """tests if buses are grouped by branch connectivity, leaving out buses not in service
+        """
+        self.assertEqual(self.components(), [[1, 2, 3, 4], [5, 6]])
+        self.assertEqual([island.tolist() for island in self.net.find_islands()], [[5, 6]])
+
+    def test_open_and_close_branch(self):
+        """tests if opening and closing a single branch updates the components
+        """
+        detector = self.net.get_island_detector()
+
+        detector.open_branch("line", self.line_ids[1])
+        self.assertEqual(self.components(), [[1, 2], [3, 4], [5, 6]])
+        self.assertFalse(detector.is_connected(1, 4))
+
+        detector.close_branch("line", self.line_ids[1])
+        self.assertEqual(self.components(), [[1, 2, 3, 4], [5, 6]])
+        self.assertTrue(detector.is_connected(1, 4))
+
+    def test_switches(self):
+        """tests if closed bus-bus switches connect buses and open line switches disconnect lines
+        """
+        self.net.net["switch"].append({"name": "Switch1", "id": 1, "bus_id": 4, "type": "b", "closed": True, "base_freq": 50.0, "max_ka": 1.0, "element_id": 5})
+        self.assertEqual(self.components(), [[1, 2, 3, 4, 5, 6]])
+
+        self.net.net["switch"].append({"name": "Switch2", "id": 2, "bus_id": 1, "type": "l", "closed": False, "base_freq": 50.0, "max_ka": 1.0, "element_id": self.line_ids[0]})
+        self.assertEqual(self.components(), [[1], [2, 3, 4, 5, 6]])
+
+    def test_unmapped_switches(self):
+        """tests if closed in-series switches are allowed and open switches without an element raise an error
+        """
+        switches = {"name": ["Switch1"], "bus_id": [1], "type": ["CB"], "closed": [True], "base_freq": [50.0], "max_ka": [1.0]}
+        self.net.add_switches(switches)
+        self.assertEqual(self.components(), [[1, 2, 3, 4], [5, 6]])
+
+        self.net.add_switches(dict(switches, name=["Switch2"], closed=[False]))
+        with self.assertRaises(ValueError):
+            self.net.connected_components()
+
+    def test_network_change(self):
+        """tests if the components are recomputed after the network changes
+        """
+        self.assertEqual(len(self.net.find_islands()), 1)
+
+        self.net.remove_element("line", self.line_ids[2])
+
+        self.assertEqual(self.components(), [[1, 2, 3, 4], [5], [6]])
+
+    def test_incremental_matches_rebuild(self):
+        """tests if opening and closing branches one at a time gives the components of a full rebuild
+        """
+        net = NetworkGenerator(300, seed=5).generate()
+        detector = net.get_island_detector()
+        rng = np.random.default_rng(5)
+        opened = set()
+        for line_id in rng.choice(net.net["line"].column("id"), 60).tolist():
+            if line_id in opened:
+                detector.close_branch("line", line_id)
+                opened.discard(line_id)
+            else:
+                detector.open_branch("line", line_id)
+                opened.add(line_id)
+
+            rebuilt = IslandDetector(net)
+            rebuilt._opened = {("line", id) for id in opened}
+            self.assertEqual(sorted(sorted(component.tolist()) for component in detector.connected_components()),
+                             sorted(sorted(component.tolist()) for component in rebuilt.connected_components()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+
+
+class TestMemmap(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        for name, zone in [("Bus1", "North"), ("Bus2", "North"), ("Bus3", float("nan"))]:
+            self.net.add_bus(Bus(name, 20.0, "b", zone, 1.05, 0.95, True))
+        self.net.add_line(Line("Line1", 1, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+        self.net.add_line(Line("Line2", 2, 3, 2.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, float("nan"), 1, 0.9, 3, "cs"))
+        self.net.remove_element("bus", 2)
+        self.directory = tempfile.TemporaryDirectory()
+        self.net.save_memmap(self.directory.name)
+
+    def tearDown(self):  # this method is run after each test
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """tests if a saved network is opened with the same elements, ids and dtypes
+        """
+        result = Network.open_memmap(self.directory.name)
+
+        for element_type, frame in self.net.to_dataframe().items():
+            pd.testing.assert_frame_equal(result.to_dataframe()[element_type], frame)
+        self.assertTrue(np.isnan(result.net["bus"].get_field(3, "zone")))
+        self.assertEqual(result.find_by_name("line", "Line2")[0]["id"], 2)
+        self.assertEqual(result.fingerprint(), self.net.fingerprint())
+
+    def test_copy_on_write(self):
+        """tests if the columns are memory-mapped until a table is modified, leaving the files unchanged
+        """
+        result = Network.open_memmap(self.directory.name)
+        self.assertIsInstance(result.net["line"]._columns["length_km"], np.memmap)
+        self.assertTrue(result.net["line"].shared)
+
+        result.view("line", 1).set_property("length_km", 5.0)
+        self.assertEqual(result.add_bus(Bus("Bus4", 20.0, "b", "South", 1.05, 0.95, True)).get_id(), 4)
+
+        self.assertFalse(result.net["line"].shared)
+        self.assertEqual(Network.open_memmap(self.directory.name).view("line", 1).get_property("length_km"), 10.0)
+
+    def test_unsupported_version(self):
+        """tests if a manifest of another version is rejected
+        """
+        with open(f"{self.directory.name}/manifest.json", "w") as file:
+            file.write('{"version": 0, "tables": {}}')
+        with self.assertRaises(ValueError):
+            Network.open_memmap(self.directory.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,6 @@
 import os
+import tempfile
+import numpy as np
 import pandas as pd
 import unittest
 from networks.network import Network
@@ -87,7 +89,7 @@ class TestNetwork(unittest.TestCase):
         bus = Bus("Bus", 110.0, "b", "Zone1", 1.05, 0.95, True)
         result.add_bus(bus)
 
-        expected_result = {"bus": [{'name': 'Bus', 'id': 4, 'vn_kv': 110.0, 'type': 'b', 'zone': 'Zone1', 'max_vm_pu': 1.05, 'min_vm_pu': 0.95, 'in_service': True}],
+        expected_result = {"bus": [{'name': 'Bus', 'id': 1, 'vn_kv': 110.0, 'type': 'b', 'zone': 'Zone1', 'max_vm_pu': 1.05, 'min_vm_pu': 0.95, 'in_service': True}],
                             "line": [],
                             "load": [],
                             "transformer": [],
@@ -107,7 +109,7 @@ class TestNetwork(unittest.TestCase):
         result.add_line(line)
 
         expected_result = {"bus": [],
-                            "line": [{'name': 'Line', 'id': 3, 'from_bus_id': 1, 'to_bus_id': 2, 'length_km': 10.0, 'max_loading_percent': 80.0, 'r_ohm_per_km': 0.1, 'x_ohm_per_km': 0.2, 'c_nf_per_km': 100.0, 'r0_ohm_per_km': 0.1, 'x0_ohm_per_km': 0.2, 'c0_nf_per_km': 100.0, 'norm_amp': 200.0, 'max_amp': 250.0, 'num_parallel': 1, 'derating_factor': 0.9, 'phases': 3}],
+                            "line": [{'name': 'Line', 'id': 1, 'from_bus_id': 1, 'to_bus_id': 2, 'length_km': 10.0, 'max_loading_percent': 80.0, 'r_ohm_per_km': 0.1, 'x_ohm_per_km': 0.2, 'c_nf_per_km': 100.0, 'r0_ohm_per_km': 0.1, 'x0_ohm_per_km': 0.2, 'c0_nf_per_km': 100.0, 'norm_amp': 200.0, 'max_amp': 250.0, 'num_parallel': 1, 'derating_factor': 0.9, 'phases': 3}],
                             "load": [],
                             "transformer": [],
                             "generator": [],
@@ -127,7 +129,7 @@ class TestNetwork(unittest.TestCase):
 
         expected_result = {"bus": [],
                             "line": [],
-                            "load": [{'name': 'Load', 'id': 2, 'bus_id': 2, 'p_kw': 50.0, 'q_kvar': 30.0, 'kv': 0.4, 'kva': 50.0, 'const_z_percent': 0.0, 'const_i_percent': 0.0, 'fixed': True, 'max_p_kw': 55.0, 'min_p_kw': 45.0, 'max_q_kvar': 35.0, 'min_q_kvar': 25.0}],
+                            "load": [{'name': 'Load', 'id': 1, 'bus_id': 2, 'p_kw': 50.0, 'q_kvar': 30.0, 'kv': 0.4, 'kva': 50.0, 'const_z_percent': 0.0, 'const_i_percent': 0.0, 'fixed': True, 'max_p_kw': 55.0, 'min_p_kw': 45.0, 'max_q_kvar': 35.0, 'min_q_kvar': 25.0}],
                             "transformer": [],
                             "generator": [],
                             "impedence": [],
@@ -147,7 +149,7 @@ class TestNetwork(unittest.TestCase):
         expected_result = {"bus": [],
                             "line": [],
                             "load": [],
-                            "transformer": [{'name': 'Transformer', 'id': 2, 'hv_bus_id': 1, 'lv_bus_id': 2, 'hv_kv': 110.0, 'lv_kv': 20.0, 'sn_kva': 1000.0, 'vk_percent': 6.0, 'vkr_percent': 0.5, 'pfe_kw': 1.0, 'i0_percent': 2.0, 'tap_min': -2, 'tap_neutral': 0, 'tap_max': 2, 'tap_step_percent': 1.25, 'rh': 0.01, 'rl': 0.02, 'x': 0.01}],
+                            "transformer": [{'name': 'Transformer', 'id': 1, 'hv_bus_id': 1, 'lv_bus_id': 2, 'hv_kv': 110.0, 'lv_kv': 20.0, 'sn_kva': 1000.0, 'vk_percent': 6.0, 'vkr_percent': 0.5, 'pfe_kw': 1.0, 'i0_percent': 2.0, 'tap_min': -2, 'tap_neutral': 0, 'tap_max': 2, 'tap_step_percent': 1.25, 'rh': 0.01, 'rl': 0.02, 'x': 0.01}],
                             "generator": [],
                             "impedence": [],
                             "storage": [],
@@ -167,7 +169,7 @@ class TestNetwork(unittest.TestCase):
                             "line": [],
                             "load": [],
                             "transformer": [],
-                            "generator": [{'name': 'Generator', 'id': 2, 'bus_id': 2, 'p_kw': 60.0, 'q_kvar': 20.0, 'kv': 0.4, 'kva': 60.0, 'pvfactor': 1.0, 'fixed': True, 'max_p_kw': 65.0, 'min_p_kw': 55.0, 'max_q_kvar': 25.0, 'min_q_kvar': 15.0, 'phases': 3, 'subtrans_react_pu': 0.02}],
+                            "generator": [{'name': 'Generator', 'id': 1, 'bus_id': 2, 'p_kw': 60.0, 'q_kvar': 20.0, 'kv': 0.4, 'kva': 60.0, 'pvfactor': 1.0, 'fixed': True, 'max_p_kw': 65.0, 'min_p_kw': 55.0, 'max_q_kvar': 25.0, 'min_q_kvar': 15.0, 'phases': 3, 'subtrans_react_pu': 0.02}],
                             "impedence": [],
                             "storage": [],
                             "switch": [],
@@ -187,7 +189,7 @@ class TestNetwork(unittest.TestCase):
                             "load": [],
                             "transformer": [],
                             "generator": [],
-                            "impedence": [{'name': 'Impedence', 'id': 2, 'from_bus_id': 2, 'to_bus_id': 3, 'r_pu': 4.0, 'x_pu': 3.5, 'kv': 8.0, 'kvar': 2.3}],
+                            "impedence": [{'name': 'Impedence', 'id': 1, 'from_bus_id': 2, 'to_bus_id': 3, 'r_pu': 4.0, 'x_pu': 3.5, 'kv': 8.0, 'kvar': 2.3}],
                             "storage": [],
                             "switch": [],
                             "threewindingtransformer": []}
@@ -207,7 +209,7 @@ class TestNetwork(unittest.TestCase):
                             "transformer": [],
                             "generator": [],
                             "impedence": [],
-                            "storage": [{'name': 'Storage', 'id': 2, 'bus_id': 1, 'p_kw': 3.4, 'p_kvar': 2.0, 'max_e_kwh': 4.0, 'min_e_kwh': 1.0, 'soc_percent': 2.3, 'max_p_mv': 5.0, 'min_p_kw': 3.0, 'max_q_mvar': 5.0, 'min_q_kvar': 0.5}],
+                            "storage": [{'name': 'Storage', 'id': 1, 'bus_id': 1, 'p_kw': 3.4, 'p_kvar': 2.0, 'max_e_kwh': 4.0, 'min_e_kwh': 1.0, 'soc_percent': 2.3, 'max_p_mv': 5.0, 'min_p_kw': 3.0, 'max_q_mvar': 5.0, 'min_q_kvar': 0.5}],
                             "switch": [],
                             "threewindingtransformer": []}
 
@@ -227,7 +229,7 @@ class TestNetwork(unittest.TestCase):
                             "generator": [],
                             "impedence": [],
                             "storage": [],
-                            "switch": [{'name': 'Switch', 'id': 2, 'bus_id': 1, 'type': 'CB', 'closed': True, 'base_freq': 80.0, 'max_ka': 45.0}],
+                            "switch": [{'name': 'Switch', 'id': 1, 'bus_id': 1, 'type': 'CB', 'closed': True, 'base_freq': 80.0, 'max_ka': 45.0}],
                             "threewindingtransformer": []}
 
         self.assertEqual(result.net, expected_result)
@@ -247,10 +249,214 @@ class TestNetwork(unittest.TestCase):
                             "impedence": [],
                             "storage": [],
                             "switch": [],
-                            "threewindingtransformer": [{'name': 'TWTransformer', 'id': 2, 'hv_bus_id': 101, 'mv_bus_id': 102, 'lv_bus_id': 103, 'hv_kv': 110.0, 'mv_kv': 33.0, 'lv_kv': 11.0, 'sn_hv_kva': 10000.0, 'sn_mv_kva': 8000.0, 'sn_lv_kva': 5000.0, 'vk_hv_percent': 10.5, 'vk_mv_percent': 11.0, 'vk_lv_percent': 12.0, 'vkr_hv_percent': 1.2, 'vkr_mv_percent': 1.5, 'vkr_lv_percent': 1.8, 'pfe_kw': 50.0, 'i0_percent': 0.5, 'tap_min': -10, 'tap_neutral': 0, 'tap_max': 10, 'tap_step_percent': 1.25, 'rh': 0.01, 'rm': 0.015, 'rl': 0.02, 'xh': 0.05, 'xm': 0.07, 'xl': 0.09}]}
+                            "threewindingtransformer": [{'name': 'TWTransformer', 'id': 1, 'hv_bus_id': 101, 'mv_bus_id': 102, 'lv_bus_id': 103, 'hv_kv': 110.0, 'mv_kv': 33.0, 'lv_kv': 11.0, 'sn_hv_kva': 10000.0, 'sn_mv_kva': 8000.0, 'sn_lv_kva': 5000.0, 'vk_hv_percent': 10.5, 'vk_mv_percent': 11.0, 'vk_lv_percent': 12.0, 'vkr_hv_percent': 1.2, 'vkr_mv_percent': 1.5, 'vkr_lv_percent': 1.8, 'pfe_kw': 50.0, 'i0_percent': 0.5, 'tap_min': -10, 'tap_neutral': 0, 'tap_max': 10, 'tap_step_percent': 1.25, 'rh': 0.01, 'rm': 0.015, 'rl': 0.02, 'xh': 0.05, 'xm': 0.07, 'xl': 0.09}]}
 
         self.assertEqual(result.net, expected_result)
     
+    def test_get_element(self):
+        """tests if an element can be looked up by its id
+        """
+        bus = self.testnet.net["bus"][1]
+
+        self.assertEqual(self.testnet.get_element("bus", bus["id"]), bus)
+        with self.assertRaises(KeyError):
+            self.testnet.get_element("bus", -1)
+
+    def test_find_by_name(self):
+        """tests if elements can be looked up by their name
+        """
+        result = self.testnet.find_by_name("line", "Line2")
+
+        self.assertEqual(result, [self.testnet.net["line"][1]])
+        self.assertEqual(self.testnet.find_by_name("line", "Missing"), [])
+
+    def test_duplicate_id(self):
+        """tests if adding an element with an id already in the network is rejected
+        """
+        with self.assertRaises(ValueError):
+            self.testnet.net["bus"].append(self.testnet.net["bus"][0])
+
+    def test_bulk_add(self):
+        """tests if elements added in bulk match elements added one by one
+        """
+        one_by_one = Network()
+        for i in range(3):
+            one_by_one.add_bus(Bus(f"Bus{i}", 110.0, "b", "Zone1", 1.05, 0.95, i != 1))
+
+        result = Network()
+        ids = result.add_buses(pd.DataFrame({"name": ["Bus0", "Bus1", "Bus2"], "vn_kv": [110.0] * 3, "type": ["b"] * 3, "zone": ["Zone1"] * 3,
+                                             "max_vm_pu": [1.05] * 3, "min_vm_pu": [0.95] * 3, "in_service": [True, False, True]}))
+
+        self.assertEqual(ids.tolist(), list(range(ids[0], ids[0] + 3)))
+        self.assertEqual(result.get_element("bus", ids[2])["name"], "Bus2")
+        pd.testing.assert_frame_equal(result.to_dataframe()["bus"].drop(columns=["id"]), one_by_one.to_dataframe()["bus"].drop(columns=["id"]))
+
+        with self.assertRaises(ValueError):
+            result.add_buses({"name": ["Bus3"], "vn_kv": [110.0]})
+
+    def test_remove_element(self):
+        """tests if an element can be removed from a network and restored
+        """
+        result = Network()
+        result.net["bus"].extend({"name": ["Bus1", "Bus2"], "id": [1, 2]})
+
+        removed = result.remove_element("bus", 1)
+
+        self.assertEqual(result.net["bus"], [{"name": "Bus2", "id": 2}])
+        self.assertEqual(result.to_dataframe()["bus"]["id"].tolist(), [2])
+        with self.assertRaises(KeyError):
+            result.get_element("bus", 1)
+
+        result.net["bus"].append(removed)
+        self.assertEqual(result.get_element("bus", 1), removed)
+
+    def test_fork(self):
+        """tests if a forked network shares unchanged element types and copies modified ones
+        """
+        result = self.testnet.fork()
+        load = result.net["load"][0]
+
+        self.assertEqual(result.net, self.testnet.net)
+        self.assertTrue(np.shares_memory(result.net["load"].column("p_kw"), self.testnet.net["load"].column("p_kw")))
+
+        result.net["load"].set_value(0, "p_kw", 10.0)
+
+        self.assertEqual(result.get_element("load", load["id"])["p_kw"], 10.0)
+        self.assertEqual(self.testnet.get_element("load", load["id"])["p_kw"], load["p_kw"])
+        self.assertFalse(np.shares_memory(result.net["load"].column("p_kw"), self.testnet.net["load"].column("p_kw")))
+        self.assertTrue(np.shares_memory(result.net["line"].column("length_km"), self.testnet.net["line"].column("length_km")))
+
+    def test_fork_ids(self):
+        """tests if elements added to a network and to its fork after forking get different ids
+        """
+        network = Network()
+        network.add_bus(Bus("Bus1", 20.0, "b", "Zone1", 1.05, 0.95, True))
+        forked = network.fork()
+
+        added = network.add_bus(Bus("Bus2", 20.0, "b", "Zone1", 1.05, 0.95, True)).get_id()
+        forked_added = forked.add_bus(Bus("Bus3", 20.0, "b", "Zone1", 1.05, 0.95, True)).get_id()
+
+        self.assertNotEqual(added, forked_added)
+        network.apply_patch(network.diff(forked))
+        self.assertEqual(sorted(network.net["bus"].column("id").tolist()), [1, forked_added])
+        self.assertEqual(network.get_element("bus", forked_added)["name"], "Bus3")
+
+    def test_diff_and_patch(self):
+        """tests if the delta between two networks turns one into the other
+        """
+        modified = self.testnet.fork()
+        line = modified.net["line"][0]
+        load = modified.net["load"][0]
+        modified.remove_element("line", line["id"])
+        modified.net["load"].set_value(0, "p_kw", 75.0)
+        modified.net["bus"].append(dict(modified.net["bus"][0], id=1000, name="Bus1000"))
+
+        delta = self.testnet.diff(modified)
+
+        self.assertEqual(set(delta), {"bus", "line", "load"})
+        self.assertEqual(delta["line"], {"added": [], "removed": [line["id"]], "changed": {}})
+        self.assertEqual(delta["load"]["changed"], {load["id"]: {"p_kw": 75.0}})
+        self.assertEqual([record["id"] for record in delta["bus"]["added"]], [1000])
+        self.assertEqual(self.testnet.diff(self.testnet), {})
+
+        result = self.testnet.fork()
+        result.apply_patch(delta)
+        self.assertEqual(result.net, modified.net)
+
+    def test_network_ids(self):
+        """tests if each network numbers its elements independently and updates the element ids
+        """
+        network1 = Network()
+        network2 = Network()
+        bus1 = Bus("Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True)
+        bus2 = Bus("Bus2", 110.0, "b", "Zone1", 1.05, 0.95, True)
+
+        network1.add_bus(bus1)
+        network2.add_bus(bus2)
+        network1.net["bus"].append(dict(bus2.to_dict(), id=7))
+        network1.add_bus(bus2)
+
+        self.assertEqual(bus1.get_property("id"), 1)
+        self.assertEqual(network2.net["bus"].column("id").tolist(), [1])
+        self.assertEqual(network1.net["bus"].column("id").tolist(), [1, 7, 8])
+        self.assertEqual(bus2.get_property("id"), 8)
+
+    def test_reserve_and_merge(self):
+        """tests if networks built with reserved id ranges merge without renumbering
+        """
+        result = Network()
+        result.add_bus(Bus("Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True))
+        workers = [Network(result.reserve_ids({"bus": 2})) for _ in range(2)]
+        for i, worker in enumerate(workers):
+            worker.add_bus(Bus(f"Worker{i}Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True))
+            worker.add_bus(Bus(f"Worker{i}Bus2", 110.0, "b", "Zone1", 1.05, 0.95, True))
+
+        for worker in reversed(workers):
+            result.merge(worker)
+        result.add_bus(Bus("Bus2", 110.0, "b", "Zone1", 1.05, 0.95, True))
+
+        self.assertEqual(result.net["bus"].column("id").tolist(), [1, 4, 5, 2, 3, 6])
+        self.assertEqual(result.get_element("bus", 4)["name"], "Worker1Bus1")
+        with self.assertRaises(ValueError):
+            result.merge(workers[0])
+
+    def test_element_slots(self):
+        """tests if element objects store their attributes in slots instead of a per-instance dictionary
+        """
+        bus = Bus("Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True)
+
+        self.assertFalse(hasattr(bus, "__dict__"))
+        with self.assertRaises(AttributeError):
+            bus.vn_kv = 20.0
+        bus.set_property("vn_kv", 20.0)
+        self.assertEqual(bus.get_property("vn_kv"), 20.0)
+
+    def test_element_subclass(self):
+        """tests if subclasses of an element class inherit its fields and can add their own
+        """
+        class MyBus(Bus):
+            pass
+
+        class MeteredBus(Bus):
+            _fields = Bus._fields + ("meter",)
+            __slots__ = ("__meter",)
+
+        bus = MyBus("Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True)
+        self.assertEqual(bus.get_property("vn_kv"), 110.0)
+        bus.set_property("vn_kv", 20.0)
+        self.assertEqual(bus.to_dict()["vn_kv"], 20.0)
+
+        metered = MeteredBus("Bus2", 110.0, "b", "Zone1", 1.05, 0.95, True)
+        metered.set_property("meter", "M1")
+        self.assertEqual(metered.get_properties(["zone", "meter"]), {"zone": "Zone1", "meter": "M1"})
+
+    def test_get_and_set_properties(self):
+        """tests if every field of an element can be read and written through the field table, one at a time or in bulk
+        """
+        line = Line("Line1", 1, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol")
+        record = line.to_dict()
+
+        self.assertEqual({field: line.get_property(field) for field in record}, record)
+        self.assertEqual(line.get_properties(["name", "type"]), {"name": "Line1", "type": "ol"})
+        self.assertEqual(line.get_property("vn_kv"), "Not a valid variable for this element")
+        self.assertEqual(line.set_property("id", 5), "Not a valid variable for this element")
+
+        self.assertIsNone(line.set_properties({"name": "Line2", "length_km": 5.0}))
+        self.assertEqual(line.get_properties(["name", "length_km"]), {"name": "Line2", "length_km": 5.0})
+        self.assertIsNotNone(line.set_properties({"type": "cs", "vn_kv": 20.0}))
+        self.assertEqual(line.get_property("type"), "ol")
+
+    def test_memory_report(self):
+        """tests if the memory report lists every column with its size in both DataFrame modes
+        """
+        report = self.testnet.memory_report()
+        bus = report[report["element_type"] == "bus"].set_index("column")
+
+        self.assertEqual(list(bus.index), list(self.bus_df.columns))
+        self.assertEqual(bus.loc["id", "dtype"], "int64")
+        self.assertEqual(bus.loc["id", "compact_dtype"], "int8")
+        self.assertLess(bus.loc["id", "compact_bytes"], bus.loc["id", "bytes"])
+
     def test_bus_to_dataframe(self):
         """tests if the program can convert the network buses to a pandas dataframe
         """
@@ -355,15 +561,116 @@ class TestNetwork(unittest.TestCase):
         result = Network()
         result.load_from_csv(directory = "test_network_data2")
     
-        # convert network dictionaries to DataFrames, excluding "id" column because each new element created generates a new id
-        result_dfs = {f"{key}": pd.DataFrame(result.net[f"{key}"]).drop(columns=["id"]) for key in result.net.keys()}
-        expected_dfs = {f"{key}": pd.DataFrame(self.testnet.net[f"{key}"]).drop(columns=['id']) for key in self.testnet.net.keys()}
+        # convert network dictionaries to DataFrames, including the "id" column since the saved ids are kept
+        result_dfs = {f"{key}": pd.DataFrame(result.net[f"{key}"]) for key in result.net.keys()}
+        expected_dfs = {f"{key}": pd.DataFrame(self.testnet.net[f"{key}"]) for key in self.testnet.net.keys()}
 
         # check that the loaded network matches the original network
         for key in self.testnet.net.keys():
             pd.testing.assert_frame_equal(result_dfs[f"{key}"], expected_dfs[f"{key}"])
         
         
+    def test_load_from_csv_keeps_ids(self):
+        """tests if the ids saved in the CSV files are kept, so references between elements stay valid
+        """
+        network = Network()
+        for name in ("Bus1", "Bus2", "Bus3"):
+            network.add_bus(Bus(name, 20.0, "b", "Zone1", 1.05, 0.95, True))
+        network.remove_element("bus", 2)
+        network.add_load(Load("Load1", 3, 50.0, 30.0, 0.4, 50.0, 0.0, 0.0, True, 55.0, 45.0, 35.0, 25.0))
+        with tempfile.TemporaryDirectory() as directory:
+            network.save_to_csv(directory=directory)
+            result = Network()
+            result.load_from_csv(directory)
+
+        self.assertEqual(result.net["bus"].column("id").tolist(), [1, 3])
+        self.assertEqual(result.get_element("bus", result.get_element("load", 1)["bus_id"])["name"], "Bus3")
+        self.assertEqual(result.add_bus(Bus("Bus4", 20.0, "b", "Zone1", 1.05, 0.95, True)).get_id(), 4)
+
+    def test_load_from_csv_missing_ids(self):
+        """tests if an empty id cell in a CSV file is reported instead of being cast to a bogus id
+        """
+        network = Network()
+        for name in ("Bus1", "Bus2"):
+            network.add_bus(Bus(name, 20.0, "b", "Zone1", 1.05, 0.95, True))
+        with tempfile.TemporaryDirectory() as directory:
+            network.save_to_csv(directory=directory)
+            path = os.path.join(directory, "bus.csv")
+            with open(path) as file:
+                text = file.read()
+            with open(path, "w") as file:
+                file.write(text.replace("Bus2,2,", "Bus2,,"))
+            with self.assertRaises(ValueError):
+                Network().load_from_csv(directory)
+
+    def test_load_from_csv_dtypes(self):
+        """tests if CSV columns are parsed with their declared dtypes, empty cells included
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            pd.DataFrame({"name": ["1", "Bus2"], "vn_kv": [20, 20], "type": ["b", "b"], "zone": ["Zone1", None],
+                          "max_vm_pu": [1.05, 1.05], "min_vm_pu": [0.95, 0.95], "in_service": [True, None]}).to_csv(f"{directory}/bus.csv", index=False)
+            self.testnet.net["load"].to_dataframe().to_csv(f"{directory}/load.csv", index=False)
+            result = Network()
+            result.load_from_csv(directory)
+
+        bus = result.to_dataframe()["bus"]
+        self.assertEqual(bus["name"].tolist(), ["1", "Bus2"])
+        self.assertEqual(bus["vn_kv"].dtype, np.int64)
+        self.assertTrue(pd.isna(bus["zone"][1]))
+        self.assertEqual(bus["in_service"].tolist()[0], True)
+        self.assertTrue(pd.isna(bus["in_service"][1]))
+        load = result.to_dataframe()["load"]
+        self.assertEqual(load["bus_id"].dtype, np.int64)
+        self.assertEqual(load["fixed"].dtype, np.bool_)
+
+    def test_load_from_csv_parallel(self):
+        """tests if reading the CSV files with a thread pool loads the same network as reading them in turn
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.testnet.save_to_csv(directory=directory)
+            sequential = Network()
+            sequential.load_from_csv(directory)
+            parallel = Network()
+            parallel.load_from_csv(directory, max_workers=4)
+
+        for key, df in sequential.to_dataframe().items():
+            pd.testing.assert_frame_equal(parallel.to_dataframe()[key], df)
+
+    def test_load_from_csv_chunked(self):
+        """tests if streaming the CSV files in chunks loads the same network and reports the progress of each chunk
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            buses = pd.DataFrame({"name": [f"Bus{i}" for i in range(5)], "vn_kv": 20.0, "type": "b", "zone": "Zone1",
+                                  "max_vm_pu": 1.05, "min_vm_pu": 0.95, "in_service": [True, True, True, None, True]})
+            buses.to_csv(f"{directory}/bus.csv", index=False)
+            self.testnet.net["load"].to_dataframe().to_csv(f"{directory}/load.csv", index=False)
+            whole = Network()
+            whole.load_from_csv(directory)
+            progress = []
+            chunked = Network()
+            chunked.load_from_csv(directory, chunksize=2, progress=lambda element_type, rows: progress.append((element_type, rows)))
+            with self.assertRaises(ValueError):
+                Network().load_from_csv(directory, max_workers=2, chunksize=2)
+
+        for key, df in whole.to_dataframe().items():
+            pd.testing.assert_frame_equal(chunked.to_dataframe()[key], df)
+        self.assertEqual(progress, [("bus", 2), ("bus", 4), ("bus", 5), ("load", 1)])
+
+    def test_load_from_csv_chunked_mixed_types(self):
+        """tests if a column inferred with different types in different chunks is read as from the whole file
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            lines = self.testnet.net["line"].to_dataframe().drop(columns=["id"])
+            lines = pd.concat([lines, lines.iloc[[0]].assign(name="Line3", phases="abc")], ignore_index=True)
+            lines.to_csv(f"{directory}/line.csv", index=False)
+            whole = Network()
+            whole.load_from_csv(directory)
+            chunked = Network()
+            chunked.load_from_csv(directory, chunksize=2)
+
+        self.assertEqual(whole.net["line"].column("phases").tolist(), ["3", "3", "abc"])
+        pd.testing.assert_frame_equal(chunked.to_dataframe()["line"], whole.to_dataframe()["line"])
+
     @classmethod  # this method is run once after all tests
     def tearDownClass(cls):
         os.remove("network_data/switch.csv")
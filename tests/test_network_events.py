@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from networks.network import Network
+from networks.NetworkEvent import NetworkEvent
+from networks.Bus import Bus
+from networks.Load import Load
+
+
+class TestNetworkEvents(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        for name in ["Bus1", "Bus2"]:
+            self.net.add_bus(Bus(name, 20.0, "b", "North", 1.05, 0.95, True))
+        self.net.add_load(Load("Load1", 1, 100.0, 50.0, 20.0, 150.0, 0.5, 0.5, True, 200.0, 0.0, 100.0, 0.0))
+        self.notifications = []
+        self.net.subscribe(self.notifications.append)
+
+    def test_mutations(self):
+        """tests if adding, changing and removing elements are each reported with their type and id
+        """
+        self.net.add_bus(Bus("Bus3", 20.0, "b", "South", 1.05, 0.95, True))
+        self.net.view("load", 1).set_property("p_kw", 80.0)
+        self.net.remove_element("bus", 2)
+        self.net.add_loads({"name": ["Load2", "Load3"], "bus_id": [1, 3], "p_kw": [1.0, 2.0], "q_kvar": [0.0, 0.0],
+                            "kv": [20.0, 20.0], "kva": [1.0, 2.0], "const_z_percent": [0.5, 0.5], "const_i_percent": [0.5, 0.5],
+                            "fixed": [True, True], "max_p_kw": [1.0, 2.0], "min_p_kw": [0.0, 0.0], "max_q_kvar": [1.0, 1.0],
+                            "min_q_kvar": [0.0, 0.0]})
+
+        self.assertEqual(self.notifications, [
+            [NetworkEvent("bus", "added", np.array([3]))],
+            [NetworkEvent("load", "changed", np.array([1]), "p_kw")],
+            [NetworkEvent("bus", "removed", np.array([2]))],
+            [NetworkEvent("load", "added", np.array([2, 3]))],
+        ])
+
+    def test_batch(self):
+        """tests if a batch of changes produces one notification with consecutive events merged
+        """
+        with self.net.batch():
+            for bus in [1, 2]:
+                self.net.view("bus", bus).set_property("vn_kv", 22.0)
+                self.net.view("bus", bus).set_property("vn_kv", 21.0)
+            with self.net.batch():
+                self.net.remove_element("load", 1)
+            self.assertEqual(self.notifications, [])
+
+        self.assertEqual(self.notifications, [[
+            NetworkEvent("bus", "changed", np.array([1, 2]), "vn_kv"),
+            NetworkEvent("load", "removed", np.array([1])),
+        ]])
+
+    def test_subscriptions(self):
+        """tests if subscribers only receive the element types they asked for, and forks notify their own subscribers
+        """
+        loads = []
+        self.net.subscribe(loads.append, element_types=["load"])
+        forked = self.net.fork()
+        forked.add_bus(Bus("Bus3", 20.0, "b", "South", 1.05, 0.95, True))
+        added = self.net.add_bus(Bus("Bus3", 20.0, "b", "South", 1.05, 0.95, True)).get_id()
+        self.net.unsubscribe(self.notifications.append)
+        self.net.view("load", 1).set_name("Load")
+
+        self.assertEqual(self.notifications, [[NetworkEvent("bus", "added", np.array([added]))]])
+        self.assertEqual(loads, [[NetworkEvent("load", "changed", np.array([1]), "name")]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+from networks.NetworkGenerator import NetworkGenerator
+
+
+class TestNetworkGenerator(unittest.TestCase):
+
+    def test_radial(self):
+        """tests if a radial network is a single tree of lines and transformers spanning every bus
+        """
+        net = NetworkGenerator(1000, "radial", num_zones=3, seed=1).generate()
+
+        self.assertEqual(len(net.net["bus"]), 1000)
+        self.assertEqual(len(net.net["line"]) + len(net.net["transformer"]), 999)
+        self.assertEqual(len(net.connected_components()), 1)
+        self.assertEqual(sorted(set(net.net["bus"].column("zone"))), ["Zone1", "Zone2", "Zone3"])
+        for element_type in ("load", "generator", "storage", "switch"):
+            self.assertGreater(len(net.net[element_type]), 0)
+        self.assertEqual(len(net.validate()), 0)
+
+    def test_meshed(self):
+        """tests if a meshed network adds lines to the radial one
+        """
+        radial = NetworkGenerator(1000, "radial", seed=1).generate()
+        meshed = NetworkGenerator(1000, "meshed", seed=1, mesh_ratio=0.2).generate()
+
+        self.assertGreater(len(meshed.net["line"]), len(radial.net["line"]) + 150)
+        self.assertTrue(meshed.validate())
+
+    def test_seed(self):
+        """tests if the same seed generates the same network
+        """
+        first = NetworkGenerator(200, "meshed", seed=7).generate()
+        second = NetworkGenerator(200, "meshed", seed=7).generate()
+
+        self.assertEqual(first.diff(second), {})
+
+    def test_injections(self):
+        """tests if every load and generator gets a time series
+        """
+        generator = NetworkGenerator(300, seed=3)
+        net = generator.generate()
+        injections = generator.generate_injections(net, num_steps=24, step_hours=1.0)
+
+        loads = injections.injections["load"]
+        self.assertEqual([injection.get_location() for injection in loads], net.net["load"].column("id").tolist())
+        self.assertEqual(len(injections.injections["generator"]), len(net.net["generator"]))
+        self.assertEqual(loads[0].get_times(), list(np.arange(24.0)))
+        self.assertEqual(len(loads[0].get_magnitudes()), 24)
+        self.assertTrue(all(min(injection.get_magnitudes()) >= 0 for injection in loads))
+
+    def test_invalid(self):
+        """tests if invalid sizes and topologies are rejected
+        """
+        with self.assertRaises(ValueError):
+            NetworkGenerator(0)
+        with self.assertRaises(ValueError):
+            NetworkGenerator(10, "ring")
+
+
+if __name__ == '__main__':
+    unittest.main()
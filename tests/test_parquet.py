@@ -0,0 +1,64 @@
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+import networks.network as network
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+
+
+class TestParquet(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        for name, zone in [("Bus1", "North"), ("Bus2", "North"), ("Bus3", float("nan"))]:
+            self.net.add_bus(Bus(name, 20.0, "b", zone, 1.05, 0.95, True))
+        self.net.add_line(Line("Line1", 1, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+        self.net.add_line(Line("Line2", 2, 3, 2.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, float("nan"), 1, 0.9, 3, "cs"))
+        self.net.remove_element("bus", 2)
+
+    @unittest.skipUnless(network.pq is not None, "pyarrow is not installed")
+    def test_round_trip(self):
+        """tests if a network saved to Parquet files is loaded back with the same elements, ids and dtypes
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.net.save_parquet(directory)
+            result = Network()
+            result.load_parquet(directory)
+
+        for element_type, frame in self.net.to_dataframe().items():
+            pd.testing.assert_frame_equal(result.to_dataframe()[element_type], frame)
+        self.assertEqual(result.net["bus"].column("id").tolist(), [1, 3])
+        self.assertTrue(np.isnan(result.net["bus"].get_field(3, "zone")))
+        self.assertEqual(result.add_bus(Bus("Bus4", 20.0, "b", "North", 1.05, 0.95, True)).get_id(), 4)
+
+    @unittest.skipUnless(network.pq is not None, "pyarrow is not installed")
+    def test_round_trip_mixed_column(self):
+        """tests if a column mixing strings and numbers is loaded back with the same values
+        """
+        self.net.add_line(Line("Line3", 1, 3, 2.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, "abc", "cs"))
+        self.net.net["line"].set_field(2, "phases", float("nan"))
+        with tempfile.TemporaryDirectory() as directory:
+            self.net.save_parquet(directory)
+            result = Network()
+            result.load_parquet(directory)
+
+        phases = result.net["line"].column("phases")
+        self.assertEqual(phases[0], 3)
+        self.assertIsInstance(phases[0], int)
+        self.assertTrue(np.isnan(phases[1]))
+        self.assertEqual(phases[2], "abc")
+        pd.testing.assert_frame_equal(result.to_dataframe()["line"], self.net.to_dataframe()["line"])
+
+    @unittest.skipIf(network.pq is not None, "pyarrow is installed")
+    def test_requires_pyarrow(self):
+        """tests if saving to Parquet without pyarrow raises an ImportError
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(ImportError):
+                self.net.save_parquet(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+from networks.Load import Load
+from networks.Transformer import Transformer
+
+
+class TestPartition(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        for name, zone in [("Bus1", "North"), ("Bus2", "North"), ("Bus3", "South"), ("Bus4", "South")]:
+            self.net.add_bus(Bus(name, 110.0, "b", zone, 1.05, 0.95, True))
+        for name, from_bus, to_bus in [("Line1", 1, 2), ("Line2", 2, 3), ("Line3", 3, 4)]:
+            self.net.add_line(Line(name, from_bus, to_bus, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+        self.net.add_load(Load("Load1", 4, 100.0, 50.0, 110.0, 150.0, 0.5, 0.5, True, 200.0, 0.0, 100.0, 0.0))
+        self.net.add_load(Load("Load2", 9, 100.0, 50.0, 110.0, 150.0, 0.5, 0.5, True, 200.0, 0.0, 100.0, 0.0))
+        self.net.add_transformer(Transformer("Transformer1", 1, 2, 110.0, 20.0, 1000.0, 6.0, 0.5, 1.0, 2.0, -2, 0, 2, 1.25, 0.01, 0.02, 0.01))
+
+    def test_partition_by_zone(self):
+        """tests if every element goes to the zone of its buses, keeping its id
+        """
+        subnetworks, _ = self.net.partition_by_zone()
+
+        self.assertEqual(list(subnetworks), ["North", "South"])
+        north, south = subnetworks["North"], subnetworks["South"]
+        self.assertEqual(north.net["bus"].column("id").tolist(), [1, 2])
+        self.assertEqual(north.net["line"].column("id").tolist(), [1])
+        self.assertEqual(north.net["transformer"].column("id").tolist(), [1])
+        self.assertEqual(south.net["line"].column("id").tolist(), [3])
+        self.assertEqual(south.get_element("load", 1), self.net.get_element("load", 1))
+        self.assertEqual(len(north.net["load"]), 0)
+
+    def test_boundary(self):
+        """tests if tie-lines and elements referencing missing buses are listed in the boundary table
+        """
+        _, boundary = self.net.partition_by_zone()
+
+        self.assertEqual(boundary.to_dict("records"), [
+            {"element_type": "line", "id": 2, "terminal": "from_bus_id", "bus_id": 2, "zone": "North"},
+            {"element_type": "line", "id": 2, "terminal": "to_bus_id", "bus_id": 3, "zone": "South"},
+            {"element_type": "load", "id": 2, "terminal": "bus_id", "bus_id": 9, "zone": None},
+        ])
+
+    def test_merge_back(self):
+        """tests if the subnetworks and the boundary elements stitch back into the whole network
+        """
+        subnetworks, boundary = self.net.partition_by_zone()
+
+        merged = Network()
+        for subnetwork in subnetworks.values():
+            merged.merge(subnetwork)
+        for element_type, id in boundary[["element_type", "id"]].drop_duplicates().itertuples(index=False):
+            merged.net[element_type].append(self.net.get_element(element_type, id))
+
+        for element_type, table in self.net.net.items():
+            self.assertEqual(sorted(merged.net[element_type].column("id").tolist()) if len(merged.net[element_type]) else [],
+                             sorted(table.column("id").tolist()) if len(table) else [])
+
+    def test_add_then_merge(self):
+        """tests if elements added to the subnetworks get ids unused in the network and in the other subnetworks
+        """
+        self.net.net["bus"].append(dict(self.net.get_element("bus", 4), name="Bus9", id=9))
+        subnetworks, _ = self.net.partition_by_zone()
+        north, south = subnetworks["North"], subnetworks["South"]
+
+        self.assertEqual(north.add_bus(Bus("Bus10", 110.0, "b", "North", 1.05, 0.95, True)).get_id(), 10)
+        self.assertEqual(south.add_bus(Bus("Bus11", 110.0, "b", "South", 1.05, 0.95, True)).get_id(), 11)
+        self.assertEqual(self.net.add_bus(Bus("Bus12", 110.0, "b", "South", 1.05, 0.95, True)).get_id(), 12)
+        merged = Network()
+        merged.merge(north)
+        merged.merge(south)
+        self.assertEqual(sorted(merged.net["bus"].column("id").tolist()), [1, 2, 3, 4, 9, 10, 11])
+
+    def test_reserve(self):
+        """tests if the subnetworks get separate blocks of ids when ids are reserved for them
+        """
+        subnetworks, _ = self.net.partition_by_zone(reserve={"bus": 2})
+        north, south = subnetworks["North"], subnetworks["South"]
+
+        self.assertEqual(north.add_bus(Bus("Bus5", 110.0, "b", "North", 1.05, 0.95, True)).get_id(), 5)
+        self.assertEqual(south.add_bus(Bus("Bus7", 110.0, "b", "South", 1.05, 0.95, True)).get_id(), 7)
+        self.assertEqual(self.net.add_bus(Bus("Bus9", 110.0, "b", "South", 1.05, 0.95, True)).get_id(), 9)
+        merged = Network()
+        merged.merge(north)
+        merged.merge(south)
+        self.assertEqual(sorted(merged.net["bus"].column("id").tolist()), [1, 2, 3, 4, 5, 7])
+
+    def test_reserve_then_merge_back(self):
+        """tests if elements of types without reserved ids get unused ids and merge back with the boundary elements
+        """
+        subnetworks, boundary = self.net.partition_by_zone(reserve={"bus": 2})
+        north, south = subnetworks["North"], subnetworks["South"]
+
+        line_id = north.add_line(Line("Line4", 1, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol")).get_id()
+        self.assertEqual(line_id, 4)
+        self.assertEqual(south.add_line(Line("Line5", 3, 4, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol")).get_id(), 5)
+        merged = Network()
+        merged.merge(north)
+        merged.merge(south)
+        for element_type, id in boundary[["element_type", "id"]].drop_duplicates().itertuples(index=False):
+            merged.net[element_type].append(self.net.get_element(element_type, id))
+        self.assertEqual(sorted(merged.net["line"].column("id").tolist()), [1, 2, 3, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
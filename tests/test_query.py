@@ -0,0 +1,57 @@
+import unittest
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+from networks.Load import Load
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        for name, vn_kv, zone in [("Bus1", 110.0, "North"), ("Bus2", 20.0, "North"), ("Bus3", 20.0, "South")]:
+            self.net.add_bus(Bus(name, vn_kv, "b", zone, 1.05, 0.95, True))
+        for name, from_bus, to_bus, length_km, max_amp, type in [("Line1", 1, 2, 10.0, 250.0, "ol"), ("Line2", 2, 3, 2.0, 250.0, "cs"), ("Line3", 1, 3, 8.0, 400.0, "ol")]:
+            self.net.add_line(Line(name, from_bus, to_bus, length_km, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, max_amp, 1, 0.9, 3, type))
+        for name, bus in [("Load1", 2), ("Load2", 3), ("Load3", 9)]:
+            self.net.add_load(Load(name, bus, 100.0, 50.0, 20.0, 150.0, 0.5, 0.5, True, 200.0, 0.0, 100.0, 0.0))
+
+    def test_filter(self):
+        """tests if fields are compared and combined element-wise
+        """
+        self.assertEqual(self.net.query("line", "length_km > 5 and max_amp < 300").tolist(), [1])
+        self.assertEqual(self.net.query("line", "type in ['cs'] or not length_km < 9").tolist(), [1, 2])
+        self.assertEqual(self.net.query("line", "(type == 'ol') & (length_km * 2 >= 16)").tolist(), [1, 3])
+        self.assertEqual(self.net.query("line", "0 < length_km < 5").tolist(), [2])
+        self.assertEqual(self.net.query("storage", "p_kw > 0").tolist(), [])
+
+    def test_join_to_bus(self):
+        """tests if the fields of referenced buses can be used, missing buses matching nothing
+        """
+        self.assertEqual(self.net.query("load", "bus.zone == 'North'").tolist(), [1])
+        self.assertEqual(self.net.query("load", "bus.vn_kv < 100").tolist(), [1, 2])
+        self.assertEqual(self.net.query("line", "from_bus.vn_kv > to_bus.vn_kv").tolist(), [1, 3])
+
+    def test_frame(self):
+        """tests if the matching elements can be returned as a DataFrame
+        """
+        frame = self.net.query("line", "type == 'ol'", as_frame=True)
+
+        self.assertEqual(frame["name"].tolist(), ["Line1", "Line3"])
+        self.assertEqual(list(frame.columns), list(self.net.to_dataframe()["line"].columns))
+
+    def test_invalid(self):
+        """tests if unsupported expressions and unknown fields are rejected
+        """
+        with self.assertRaises(ValueError):
+            self.net.query("line", "length_km >")
+        with self.assertRaises(ValueError):
+            self.net.query("line", "__import__('os').getcwd() == 1")
+        with self.assertRaises(KeyError):
+            self.net.query("line", "vn_kv > 1")
+        with self.assertRaises(KeyError):
+            self.net.query("line", "bus.zone == 'North'")
+
+
+if __name__ == '__main__':
+    unittest.main()
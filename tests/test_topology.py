@@ -0,0 +1,92 @@
+import unittest
+import numpy as np
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+from networks.Transformer import Transformer
+from networks.Impedence import Impedence
+from networks.ThreeWindingTransformer import ThreeWindingTransformer
+
+
+class TestTopology(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        self.bus_ids = []
+        for i in range(5):
+            bus = Bus(f"Bus{i}", 110.0, "b", "Zone1", 1.05, 0.95, True)
+            self.net.add_bus(bus)
+            self.bus_ids.append(bus.get_property("id"))
+        b = self.bus_ids
+
+        self.line = Line("Line1", b[0], b[1], 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol")
+        self.net.add_line(self.line)
+        self.net.add_transformer(Transformer("Transformer1", b[1], b[2], 110.0, 20.0, 1000.0, 6.0, 0.5, 1.0, 2.0, -2, 0, 2, 1.25, 0.01, 0.02, 0.01))
+        self.net.add_impedence(Impedence("Impedence1", b[2], b[3], 4.0, 3.5, 8.0, 2.3))
+        self.trafo3w = ThreeWindingTransformer("TWTransformer1", b[0], b[2], b[3], 110.0, 33.0, 11.0, 10000.0, 8000.0, 5000.0, 10.5, 11.0, 12.0, 1.2, 1.5, 1.8, 50.0, 0.5, -10, 0, 10, 1.25, 0.01, 0.015, 0.02, 0.05, 0.07, 0.09)
+        self.net.add_threewindingtransformer(self.trafo3w)
+
+    def test_neighbors(self):
+        """tests if the neighbours of a bus are found through every branch type
+        """
+        topology = self.net.get_topology()
+        b = self.bus_ids
+
+        self.assertEqual(sorted(topology.neighbors(b[0]).tolist()), [b[1], b[2], b[3]])
+        self.assertEqual(sorted(topology.neighbors(b[2]).tolist()), [b[0], b[1], b[3]])
+        self.assertEqual(topology.neighbors(b[4]).tolist(), [])
+
+    def test_degree(self):
+        """tests if the degree of a bus counts every branch connection
+        """
+        topology = self.net.get_topology()
+        b = self.bus_ids
+
+        self.assertEqual(topology.degree(b[0]), 3)
+        self.assertEqual(topology.degree(b[4]), 0)
+        self.assertEqual(topology.num_buses, 5)
+        self.assertEqual(topology.num_edges, 12)
+
+    def test_incident_branches(self):
+        """tests if the branches connected to a bus are listed once each
+        """
+        topology = self.net.get_topology()
+
+        self.assertEqual(topology.incident_branches(self.bus_ids[0]),
+                         [("line", self.line.get_property("id")), ("threewindingtransformer", self.trafo3w.get_property("id"))])
+
+    def test_lazy_rebuild(self):
+        """tests if the topology is rebuilt only after a branch is added
+        """
+        topology = self.net.get_topology()
+        b = self.bus_ids
+        indices = topology.indices
+        self.assertIs(topology.indices, indices)
+
+        self.net.add_line(Line("Line2", b[3], b[4], 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+
+        self.assertIsNot(topology.indices, indices)
+        self.assertEqual(topology.neighbors(b[4]).tolist(), [b[3]])
+
+    def test_removed_branch(self):
+        """tests if a removed branch no longer connects its buses
+        """
+        topology = self.net.get_topology()
+        b = self.bus_ids
+
+        self.net.remove_element("line", self.line.get_property("id"))
+
+        self.assertEqual(sorted(topology.neighbors(b[1]).tolist()), [b[2]])
+        self.assertEqual(topology.degree(b[0]), 2)
+
+    def test_csr_matrix(self):
+        """tests if the adjacency converts to a symmetric sparse matrix
+        """
+        matrix = self.net.get_topology().to_csr_matrix()
+
+        self.assertEqual(matrix.shape, (5, 5))
+        np.testing.assert_array_equal(matrix.toarray(), matrix.toarray().T)
+
+
+if __name__ == '__main__':
+    unittest.main()
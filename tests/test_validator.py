@@ -0,0 +1,57 @@
+import unittest
+from networks.network import Network
+from networks.Bus import Bus
+from networks.Line import Line
+from networks.Load import Load
+from networks.Transformer import Transformer
+
+
+class TestValidator(unittest.TestCase):
+
+    def setUp(self):  # this method is run before each test
+        self.net = Network()
+        self.net.add_bus(Bus("Bus1", 110.0, "b", "Zone1", 1.05, 0.95, True))
+        self.net.add_bus(Bus("Bus2", 110.0, "b", "Zone1", 1.05, 0.95, True))
+        self.net.add_bus(Bus("Bus3", 20.0, "b", "Zone1", 1.05, 0.95, True))
+        self.net.add_line(Line("Line1", 1, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+        self.net.add_load(Load("Load1", 3, 100.0, 50.0, 20.0, 150.0, 0.5, 0.5, True, 200.0, 0.0, 100.0, 0.0))
+        self.net.add_transformer(Transformer("Transformer1", 2, 3, 110.0, 20.0, 1000.0, 6.0, 0.5, 1.0, 2.0, -2, 0, 2, 1.25, 0.01, 0.02, 0.01))
+
+    def test_valid_network(self):
+        """tests if a consistent network passes without issues
+        """
+        report = self.net.validate()
+
+        self.assertTrue(report)
+        self.assertEqual(len(report), 0)
+        self.assertEqual(len(report.to_dataframe()), 0)
+
+    def test_dangling_bus(self):
+        """tests if references to missing buses are reported as errors
+        """
+        self.net.add_line(Line("Line2", 2, 9, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+        self.net.remove_element("bus", 3)
+
+        report = self.net.validate()
+
+        self.assertFalse(report)
+        dangling = {(issue["element_type"], issue["field"]): issue["ids"].tolist() for issue in report if issue["rule"] == "dangling_bus"}
+        self.assertEqual(dangling, {("line", "to_bus_id"): [2], ("load", "bus_id"): [1], ("transformer", "lv_bus_id"): [1]})
+
+    def test_electrical_rules(self):
+        """tests if voltage mismatches are warnings and inverted limits and self-loops are errors
+        """
+        self.net.add_transformer(Transformer("Transformer2", 1, 3, 66.0, 20.0, 1000.0, 6.0, 0.5, 1.0, 2.0, 2, 0, -2, 1.25, 0.01, 0.02, 0.01))
+        self.net.add_line(Line("Line2", 2, 2, 10.0, 80.0, 0.1, 0.2, 100.0, 0.1, 0.2, 100.0, 200.0, 250.0, 1, 0.9, 3, "ol"))
+
+        report = self.net.validate()
+
+        self.assertEqual([(issue["rule"], issue["field"], issue["ids"].tolist()) for issue in report.warnings],
+                         [("voltage_mismatch", "hv_kv", [2])])
+        self.assertEqual([(issue["rule"], issue["element_type"], issue["ids"].tolist()) for issue in report.errors],
+                         [("same_bus", "line", [2]), ("limit_order", "transformer", [2])])
+        self.assertEqual(len(report.to_dataframe()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
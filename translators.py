@@ -60,36 +60,55 @@ class PandaPowerAdapter(PowerflowSimulator):
         self.injections = injections  # injections object
         self.net = pp.create_empty_network()  # pandapower network object
 
+    def _bus(self, bus_id):
+        """Returns the pandapower index of a bus, looked up by its id in the common network
+
+        :param bus_id: Id of the bus in the common network
+        :type bus_id: int
+        :return: Index of the bus in the pandapower network
+        :rtype: int
+        :raises KeyError: If the common network has no bus with this id
+        """
+        return int(self.network.get_element("bus", bus_id)["id"])
+
     #update translate_network whenever network class is updated to hold actual network elements instead of just dictionaries
     def translate_network(self):
+        """Translate network elements to pandapower elements
+
+        Every element keeps its id as its pandapower index and the buses it connects
+        to are looked up by id, so the translation does not depend on the position
+        of the elements in the network.
+
+        :raises KeyError: If an element references a bus missing from the network
+        """
 
         for bus in self.network.net['bus']:
             
-            pp.create_bus(self.net,name = bus["name"], vn_kv = bus["vn_kv"],type = bus["type"],zone=bus["zone"])
+            pp.create_bus(self.net,name = bus["name"], vn_kv = bus["vn_kv"],type = bus["type"],zone=bus["zone"],index=bus["id"])
 
         print(self.net.bus)
 
         for line in self.network.net['line']:
 
-            pp.create_line_from_parameters(self.net, from_bus=line["from_bus_id"], to_bus=line["to_bus_id"], length_km=line["length_km"], name=line["name"],index=line["id"],r_ohm_per_km=line["r_ohm_per_km"],x_ohm_per_km=line["x_ohm_per_km"],c_nf_per_km=line["c_nf_per_km"],max_i_ka=line["max_amp"],)
+            pp.create_line_from_parameters(self.net, from_bus=self._bus(line["from_bus_id"]), to_bus=self._bus(line["to_bus_id"]), length_km=line["length_km"], name=line["name"],index=line["id"],r_ohm_per_km=line["r_ohm_per_km"],x_ohm_per_km=line["x_ohm_per_km"],c_nf_per_km=line["c_nf_per_km"],max_i_ka=line["max_amp"],)
 
         print(self.net.line)   
             
         for load in self.network.net['load']:
             
-            pp.create_load(self.net,name=load["name"], bus=load["bus_id"],p_mw= (load["p_kw"])*1000 )
+            pp.create_load(self.net,name=load["name"], bus=self._bus(load["bus_id"]),p_mw= (load["p_kw"])*1000,index=load["id"])
 
         print(self.net.load)
 
         for trafo in self.network.net['transformer']:
 
-            pp.create_transformer_from_parameters(self.net, hv_bus=trafo["hv_bus_id"], lv_bus=trafo["lv_bus_id"], name=trafo["name"], sn_mva=(trafo["sn_kva"]/1000), vn_hv_kv=trafo["hv_kv"], vn_lv_kv=trafo["lv_kv"], vk_percent=trafo["vk_percent"], vkr_percent=trafo["vkr_percent"], pfe_kw=trafo["pfe_kw"], i0_percent=trafo["i0_percent"])
+            pp.create_transformer_from_parameters(self.net, hv_bus=self._bus(trafo["hv_bus_id"]), lv_bus=self._bus(trafo["lv_bus_id"]), name=trafo["name"], sn_mva=(trafo["sn_kva"]/1000), vn_hv_kv=trafo["hv_kv"], vn_lv_kv=trafo["lv_kv"], vk_percent=trafo["vk_percent"], vkr_percent=trafo["vkr_percent"], pfe_kw=trafo["pfe_kw"], i0_percent=trafo["i0_percent"],index=trafo["id"])
 
         print(self.net.trafo)
 
         for generator in self.network.net['generator']:
 
-            pp.create.create_gen(self.net,name=generator["name"], bus=generator["bus_id"], p_mw= generator["p_kw"])
+            pp.create.create_gen(self.net,name=generator["name"], bus=self._bus(generator["bus_id"]), p_mw= generator["p_kw"],index=generator["id"])
 
         print(self.net.gen)
 
@@ -218,10 +237,11 @@ class OpenDSSAdapter(PowerflowSimulator):
                     f"R1={line['r_ohm_per_km']} X1={line['x_ohm_per_km']} C1={line['c_nf_per_km']} ")
                 file.write(f"Normamps={line['norm_amp']}\n")
 
-            if self.injections:
-                # mock monitor for timeseries simulation
+            if self.injections and len(self.network.net["load"]):
+                # mock monitor for timeseries simulation, on the first load whatever its id
+                first_load = self.network.net["load"][0]["id"]
                 file.write(
-                    f"new monitor.load.1 element=load.1 terminal=1\n")
+                    f"new monitor.load.{first_load} element=load.{first_load} terminal=1\n")
                 # setup timeseries simulation
                 file.write(f"set mode=daily\n")
                 file.write(f"set stepsize=2.4h\n")